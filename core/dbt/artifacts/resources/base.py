@@ -1,11 +1,50 @@
 import hashlib
+import mmap
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from dbt.artifacts.resources.types import NodeType
 from dbt_common.dataclass_schema import dbtClassMixin
 
 
+def _utf8_char_length(lead_byte: int) -> int:
+    if lead_byte < 0x80:
+        return 1
+    elif lead_byte >= 0xF0:
+        return 4
+    elif lead_byte >= 0xE0:
+        return 3
+    return 2
+
+
+def _is_space(data: bytes) -> bool:
+    try:
+        return data.decode("utf-8").isspace()
+    except UnicodeDecodeError:
+        return False
+
+
+def _stripped_range(data: mmap.mmap) -> Tuple[int, int]:
+    """The range of the utf-8 encoded data left by str.strip(), which strips the characters
+    for which str.isspace() is true, unicode whitespace included.
+    """
+    start, end = 0, len(data)
+    while start < end:
+        length = _utf8_char_length(data[start])
+        if not _is_space(data[start : start + length]):
+            break
+        start += length
+    while end > start:
+        char_start = end - 1
+        # step back over utf-8 continuation bytes to the start of the last character
+        while char_start > start and end - char_start < 4 and 0x80 <= data[char_start] < 0xC0:
+            char_start -= 1
+        if not _is_space(data[char_start:end]):
+            break
+        end = char_start
+    return start, end
+
+
 @dataclass
 class BaseResource(dbtClassMixin):
     name: str
@@ -60,6 +99,23 @@ class FileHash(dbtClassMixin):
         checksum = hashlib.new(name, data).hexdigest()
         return cls(name=name, checksum=checksum)
 
+    @classmethod
+    def from_file(cls, path: str, name="sha256", chunk_size=1024 * 1024) -> "FileHash":
+        """Create a file hash from the contents of the file at the given path,
+        without reading the whole file into memory. Leading and trailing
+        whitespace is skipped, so the hash matches `from_contents` on the
+        stripped file contents.
+        """
+        hasher = hashlib.new(name)
+        with open(path, "rb") as handle:
+            if not handle.seek(0, 2):
+                return cls(name=name, checksum=hasher.hexdigest())
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                start, end = _stripped_range(data)
+                for offset in range(start, end, chunk_size):
+                    hasher.update(data[offset : min(offset + chunk_size, end)])
+        return cls(name=name, checksum=hasher.hexdigest())
+
 
 @dataclass
 class Docs(dbtClassMixin):
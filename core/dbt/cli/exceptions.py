@@ -1,12 +1,14 @@
-from typing import IO, List, Optional, Union
+from typing import IO, TYPE_CHECKING, List, Optional, Union
 
 from click.exceptions import ClickException
 
-from dbt.artifacts.schemas.catalog import CatalogArtifact
-from dbt.contracts.graph.manifest import Manifest
-from dbt.contracts.results import RunExecutionResult
 from dbt.utils import ExitCodes
 
+if TYPE_CHECKING:
+    from dbt.artifacts.schemas.catalog import CatalogArtifact
+    from dbt.contracts.graph.manifest import Manifest
+    from dbt.contracts.results import RunExecutionResult
+
 
 class DbtUsageException(Exception):
     pass
@@ -38,11 +40,11 @@ class ResultExit(CliException):
         self,
         result: Union[
             bool,  # debug
-            CatalogArtifact,  # docs generate
+            "CatalogArtifact",  # docs generate
             List[str],  # list/ls
-            Manifest,  # parse
+            "Manifest",  # parse
             None,  # clean, deps, init, source
-            RunExecutionResult,  # build, compile, run, seed, snapshot, test, run-operation
+            "RunExecutionResult",  # build, compile, run, seed, snapshot, test, run-operation
         ] = None,
     ) -> None:
         super().__init__(ExitCodes.ModelError)
@@ -1,23 +1,25 @@
 import functools
 from copy import copy
 from dataclasses import dataclass
-from typing import Callable, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Union
 
 import click
 from click.exceptions import BadOptionUsage
 from click.exceptions import Exit as ClickExit
 from click.exceptions import NoSuchOption, UsageError
 
-from dbt.adapters.factory import register_adapter
-from dbt.artifacts.schemas.catalog import CatalogArtifact
-from dbt.artifacts.schemas.run import RunExecutionResult
 from dbt.cli import params as p
 from dbt.cli import requires
 from dbt.cli.exceptions import DbtInternalException, DbtUsageException
-from dbt.cli.requires import setup_manifest
-from dbt.contracts.graph.manifest import Manifest
-from dbt.mp_context import get_mp_context
-from dbt_common.events.base_types import EventMsg
+
+# Modules that pull in the adapters, the manifest or the artifact schemas are imported by
+# the commands that use them, so that the cli starts quickly (e.g. `dbt --version`).
+# tests/unit/cli/test_import_time.py checks that they stay out of this module's imports.
+if TYPE_CHECKING:
+    from dbt.artifacts.schemas.catalog import CatalogArtifact
+    from dbt.artifacts.schemas.run import RunExecutionResult
+    from dbt.contracts.graph.manifest import Manifest
+    from dbt_common.events.base_types import EventMsg
 
 
 @dataclass
@@ -29,11 +31,11 @@ class dbtRunnerResult:
     exception: Optional[BaseException] = None
     result: Union[
         bool,  # debug
-        CatalogArtifact,  # docs generate
+        "CatalogArtifact",  # docs generate
         List[str],  # list/ls
-        Manifest,  # parse
+        "Manifest",  # parse
         None,  # clean, deps, init, source
-        RunExecutionResult,  # build, compile, run, seed, snapshot, test, run-operation
+        "RunExecutionResult",  # build, compile, run, seed, snapshot, test, run-operation
     ] = None
 
 
@@ -41,8 +43,8 @@ class dbtRunnerResult:
 class dbtRunner:
     def __init__(
         self,
-        manifest: Optional[Manifest] = None,
-        callbacks: Optional[List[Callable[[EventMsg], None]]] = None,
+        manifest: Optional["Manifest"] = None,
+        callbacks: Optional[List[Callable[["EventMsg"], None]]] = None,
     ) -> None:
         self.manifest = manifest
 
@@ -50,14 +52,17 @@ class dbtRunner:
             callbacks = []
         self.callbacks = callbacks
 
+    def _context_obj(self, args: List[str]) -> Dict[str, Any]:
+        return {
+            "manifest": self.manifest,
+            "callbacks": self.callbacks,
+            "dbt_runner_command_args": args,
+        }
+
     def invoke(self, args: List[str], **kwargs) -> dbtRunnerResult:
         try:
             dbt_ctx = cli.make_context(cli.name, args.copy())
-            dbt_ctx.obj = {
-                "manifest": self.manifest,
-                "callbacks": self.callbacks,
-                "dbt_runner_command_args": args,
-            }
+            dbt_ctx.obj = self._context_obj(args)
 
             for key, value in kwargs.items():
                 dbt_ctx.params[key] = value
@@ -142,6 +147,8 @@ def global_flags(func):
     @p.warn_error
     @p.warn_error_options
     @p.write_json
+    @p.write_graph_node_data
+    @p.write_timeline
     @p.use_fast_test_edges
     @p.upload_artifacts
     @functools.wraps(func)
@@ -356,6 +363,7 @@ def compile(ctx, **kwargs):
 @p.exclude
 @p.full_refresh
 @p.show_output_format
+@p.show_output_file
 @p.show_limit
 @p.introspect
 @p.profiles_dir
@@ -375,6 +383,8 @@ def compile(ctx, **kwargs):
 def show(ctx, **kwargs):
     """Generates executable SQL for a named resource or inline query, runs that SQL, and returns a preview of the
     results. Does not materialize anything to the warehouse."""
+    from dbt.adapters.factory import register_adapter
+    from dbt.mp_context import get_mp_context
     from dbt.task.show import ShowTask, ShowTaskDirect
 
     if ctx.obj["flags"].inline_direct:
@@ -386,7 +396,7 @@ def show(ctx, **kwargs):
             ctx.obj["runtime_config"],
         )
     else:
-        setup_manifest(ctx)
+        requires.setup_manifest(ctx)
         task = ShowTask(
             ctx.obj["flags"],
             ctx.obj["runtime_config"],
@@ -769,6 +779,7 @@ def source(ctx, **kwargs):
 @source.command("freshness")
 @click.pass_context
 @global_flags
+@p.batch_freshness
 @p.exclude
 @p.output_path  # TODO: Is this ok to re-use?  We have three different output params, how much can we consolidate?
 @p.profiles_dir
@@ -1,14 +1,11 @@
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-import pytz
 from click import Choice, Context, Parameter, ParamType
 
-from dbt.config.utils import normalize_warn_error_options, parse_cli_yaml_string
-from dbt.event_time.sample_window import SampleWindow
-from dbt.events import ALL_EVENT_NAMES
-from dbt.exceptions import OptionNotYamlDictError, ValidationError
-from dbt_common.exceptions import DbtValidationError
-from dbt_common.helper_types import WarnErrorOptionsV2
+# The modules these types convert values with are imported when a value is converted,
+# so that importing the cli stays cheap.
+if TYPE_CHECKING:
+    from dbt.event_time.sample_window import SampleWindow
 
 
 class YAML(ParamType):
@@ -20,6 +17,11 @@ class YAML(ParamType):
         # assume non-string values are a problem
         if not isinstance(value, str):
             self.fail(f"Cannot load YAML from type {type(value)}", param, ctx)
+
+        from dbt.config.utils import parse_cli_yaml_string
+        from dbt.exceptions import OptionNotYamlDictError, ValidationError
+        from dbt_common.exceptions import DbtValidationError
+
         try:
             param_option_name = param.opts[0] if param.opts else param.name
             return parse_cli_yaml_string(value, param_option_name.strip("-"))
@@ -54,6 +56,10 @@ class WarnErrorOptionsType(YAML):
 
     def convert(self, value, param, ctx):
         # this function is being used by param in click
+        from dbt.config.utils import normalize_warn_error_options
+        from dbt.events import ALL_EVENT_NAMES
+        from dbt_common.helper_types import WarnErrorOptionsV2
+
         warn_error_options = super().convert(value, param, ctx)
         normalize_warn_error_options(warn_error_options)
 
@@ -99,10 +105,15 @@ class SampleType(ParamType):
 
     def convert(
         self, value, param: Optional[Parameter], ctx: Optional[Context]
-    ) -> Optional[SampleWindow]:
+    ) -> Optional["SampleWindow"]:
         if value is None:
             return None
 
+        import pytz
+
+        from dbt.config.utils import parse_cli_yaml_string
+        from dbt.event_time.sample_window import SampleWindow
+
         if isinstance(value, str):
             try:
                 # Try and identify if it's a "dict" or a "str"
@@ -12,7 +12,6 @@ from dbt.cli.option_types import (
 )
 from dbt.cli.options import MultiOption
 from dbt.cli.resolvers import default_profiles_dir, default_project_dir
-from dbt.version import get_version_information
 
 # --- shared option specs --- #
 model_decls = ("-m", "--models", "--model")
@@ -56,6 +55,14 @@ args = _create_option_and_track_env_var(
     type=YAML(),
 )
 
+batch_freshness = _create_option_and_track_env_var(
+    "--batch-freshness/--no-batch-freshness",
+    envvar="DBT_ENGINE_BATCH_FRESHNESS",
+    help="If specified, calculate the freshness of sources with a loaded_at_field using one query per database and schema, rather than one query per source.",
+    default=False,
+    type=click.BOOL,
+)
+
 browser = _create_option_and_track_env_var(
     "--browser/--no-browser",
     envvar=None,
@@ -606,6 +613,14 @@ show_limit = _create_option_and_track_env_var(
     default=5,
 )
 
+show_output_file = _create_option_and_track_env_var(
+    "--output-file",
+    envvar=None,
+    help="Write all rows returned by dbt show to this file, as JSON or CSV depending on --output, fetching them in chunks instead of loading them into memory. Only a preview of the rows is printed.",
+    type=click.Path(file_okay=True, dir_okay=False, writable=True),
+    default=None,
+)
+
 show_output_format = _create_option_and_track_env_var(
     "--output",
     envvar=None,
@@ -769,6 +784,8 @@ vars = _create_option_and_track_env_var(
 def _version_callback(ctx, _param, value):
     if not value or ctx.resilient_parsing:
         return
+    from dbt.version import get_version_information
+
     click.echo(get_version_information())
     ctx.exit()
 
@@ -818,6 +835,22 @@ write_json = _create_option_and_track_env_var(
     type=click.BOOL,
 )
 
+write_graph_node_data = _create_option_and_track_env_var(
+    "--write-graph-node-data/--no-write-graph-node-data",
+    envvar="DBT_ENGINE_WRITE_GRAPH_NODE_DATA",
+    help="Whether or not to include the serialized nodes in graph.gpickle. Without them, the file only has the graph structure and is much faster to write for large projects.",
+    default=True,
+    type=click.BOOL,
+)
+
+write_timeline = _create_option_and_track_env_var(
+    "--write-timeline/--no-write-timeline",
+    envvar="DBT_ENGINE_WRITE_TIMELINE",
+    help="Whether or not to write a timeline of parsing, graph compilation, node selection and node execution to timeline.json in the target directory, in the Chrome trace event format.",
+    default=False,
+    type=click.BOOL,
+)
+
 upload_artifacts = _create_option_and_track_env_var(
     "--upload-to-artifacts-ingest-api/--no-upload-to-artifacts-ingest-api",
     envvar="DBT_UPLOAD_TO_ARTIFACTS_INGEST_API",
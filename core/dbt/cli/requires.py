@@ -2,62 +2,20 @@ import importlib.util
 import os
 import time
 import traceback
-from functools import update_wrapper
+from functools import partial, update_wrapper
 from typing import Dict, Optional
 
 from click import Context
 
-import dbt.tracking
-from dbt.adapters.factory import adapter_management, get_adapter, register_adapter
 from dbt.cli.exceptions import ExceptionExit, ResultExit
-from dbt.cli.flags import Flags
-from dbt.config import RuntimeConfig
-from dbt.config.catalogs import get_active_write_integration, load_catalogs
-from dbt.config.runtime import UnsetProfile, load_profile, load_project
-from dbt.context.providers import generate_runtime_macro_context
-from dbt.context.query_header import generate_query_header_context
-from dbt.deprecations import show_deprecations_summary
-from dbt.env_vars import KNOWN_ENGINE_ENV_VARS, validate_engine_env_vars
-from dbt.events.logging import setup_event_logger
-from dbt.events.types import (
-    ArtifactUploadError,
-    CommandCompleted,
-    MainEncounteredError,
-    MainReportArgs,
-    MainReportVersion,
-    MainStackTrace,
-    MainTrackingUserState,
-    ResourceReport,
-)
-from dbt.exceptions import DbtProjectError, FailFastError
-from dbt.flags import get_flag_dict, get_flags, set_flags
-from dbt.mp_context import get_mp_context
-from dbt.parser.manifest import parse_manifest
-from dbt.plugins import set_up_plugin_manager
-from dbt.profiler import profiler
-from dbt.tracking import active_user, initialize_from_flags, track_run
-from dbt.utils import try_get_max_rss_kb
-from dbt.utils.artifact_upload import upload_artifacts
-from dbt.version import installed as installed_version
-from dbt_common.clients.system import get_env
-from dbt_common.context import get_invocation_context, set_invocation_context
-from dbt_common.events.base_types import EventLevel
-from dbt_common.events.event_manager_client import get_event_manager
-from dbt_common.events.functions import LOG_VERSION, fire_event
-from dbt_common.events.helpers import get_json_string_utcnow
-from dbt_common.exceptions import DbtBaseException as DbtException
-from dbt_common.invocation import reset_invocation_id
-from dbt_common.record import (
-    Recorder,
-    RecorderMode,
-    get_record_mode_from_env,
-    get_record_types_from_dict,
-    get_record_types_from_env,
-)
-from dbt_common.utils import cast_dict_to_dict_of_strings
+
+# The modules these decorators use are imported when the decorated command runs, and
+# only by the decorators the command uses, so that importing the cli stays cheap.
 
 
 def _cross_propagate_engine_env_vars(env_dict: Dict[str, str]) -> None:
+    from dbt.env_vars import KNOWN_ENGINE_ENV_VARS
+
     for env_var in KNOWN_ENGINE_ENV_VARS:
         if env_var.old_name is not None:
             # If the old name is in the env dict, and not the new name, set the new name based on the old name
@@ -70,6 +28,26 @@ def _cross_propagate_engine_env_vars(env_dict: Dict[str, str]) -> None:
 
 def preflight(func):
     def wrapper(*args, **kwargs):
+        from dbt.adapters.factory import adapter_management
+        from dbt.cli.flags import Flags
+        from dbt.env_vars import validate_engine_env_vars
+        from dbt.events.logging import setup_event_logger
+        from dbt.events.types import (
+            MainReportArgs,
+            MainReportVersion,
+            MainTrackingUserState,
+        )
+        from dbt.flags import get_flag_dict, set_flags
+        from dbt.profiler import profiler
+        from dbt.tracking import active_user, initialize_from_flags, track_run
+        from dbt.version import installed as installed_version
+        from dbt_common.clients.system import get_env
+        from dbt_common.context import get_invocation_context, set_invocation_context
+        from dbt_common.events.event_manager_client import get_event_manager
+        from dbt_common.events.functions import LOG_VERSION, fire_event
+        from dbt_common.invocation import reset_invocation_id
+        from dbt_common.utils import cast_dict_to_dict_of_strings
+
         ctx = args[0]
         assert isinstance(ctx, Context)
         ctx.obj = ctx.obj or {}
@@ -131,10 +109,19 @@ def preflight(func):
 
 
 def setup_record_replay():
+    from dbt_common.context import get_invocation_context
+    from dbt_common.record import (
+        Recorder,
+        RecorderMode,
+        get_record_mode_from_env,
+        get_record_types_from_dict,
+        get_record_types_from_env,
+    )
+
     rec_mode = get_record_mode_from_env()
     rec_types = get_record_types_from_env()
 
-    recorder: Optional[Recorder] = None
+    recorder: Optional["Recorder"] = None
     if rec_mode == RecorderMode.REPLAY:
         previous_recording_path = os.environ.get(
             "DBT_ENGINE_RECORDER_FILE_PATH"
@@ -158,6 +145,9 @@ def setup_record_replay():
 
 
 def tear_down_record_replay():
+    from dbt_common.context import get_invocation_context
+    from dbt_common.record import RecorderMode
+
     recorder = get_invocation_context().recorder
     if recorder is not None:
         if recorder.mode == RecorderMode.RECORD:
@@ -174,6 +164,23 @@ def postflight(func):
     This decorator must be used before any other decorators that may throw an exception."""
 
     def wrapper(*args, **kwargs):
+        from dbt.deprecations import show_deprecations_summary
+        from dbt.events.types import (
+            ArtifactUploadError,
+            CommandCompleted,
+            MainEncounteredError,
+            MainStackTrace,
+            ResourceReport,
+        )
+        from dbt.exceptions import FailFastError
+        from dbt.flags import get_flags
+        from dbt.utils import try_get_max_rss_kb
+        from dbt.utils.artifact_upload import upload_artifacts
+        from dbt_common.events.base_types import EventLevel
+        from dbt_common.events.functions import fire_event
+        from dbt_common.events.helpers import get_json_string_utcnow
+        from dbt_common.exceptions import DbtBaseException as DbtException
+
         ctx = args[0]
         start_func = time.perf_counter()
         success = False
@@ -252,6 +259,8 @@ def unset_profile(func):
         ctx = args[0]
         assert isinstance(ctx, Context)
 
+        from dbt.config.runtime import UnsetProfile
+
         profile = UnsetProfile()
         ctx.obj["profile"] = profile
 
@@ -265,6 +274,9 @@ def profile(func):
         ctx = args[0]
         assert isinstance(ctx, Context)
 
+        from dbt.config.runtime import load_profile
+        from dbt_common.context import get_invocation_context
+
         flags = ctx.obj["flags"]
         # TODO: Generalize safe access to flags.THREADS:
         # https://github.com/dbt-labs/dbt-core/issues/6259
@@ -283,6 +295,11 @@ def project(func):
         ctx = args[0]
         assert isinstance(ctx, Context)
 
+        import dbt.tracking
+        from dbt.config.runtime import load_project
+        from dbt.exceptions import DbtProjectError
+        from dbt.plugins import set_up_plugin_manager
+
         # TODO: Decouple target from profile, and remove the need for profile here:
         # https://github.com/dbt-labs/dbt-core/issues/6257
         if not ctx.obj.get("profile"):
@@ -332,6 +349,10 @@ def runtime_config(func):
         ctx = args[0]
         assert isinstance(ctx, Context)
 
+        import dbt.tracking
+        from dbt.config import RuntimeConfig
+        from dbt.exceptions import DbtProjectError
+
         req_strs = ["profile", "project"]
         reqs = [ctx.obj.get(req_str) for req_str in req_strs]
 
@@ -346,6 +367,14 @@ def runtime_config(func):
 
         ctx.obj["runtime_config"] = config
 
+        if ctx.obj["flags"].WRITE_TIMELINE:
+            from dbt.constants import TIMELINE_FILE_NAME
+            from dbt.profiler import timeline
+
+            ctx.with_resource(
+                timeline(os.path.join(config.project_target_path, TIMELINE_FILE_NAME))
+            )
+
         if dbt.tracking.active_user is not None:
             adapter_type = (
                 getattr(config.credentials, "type", None)
@@ -377,6 +406,9 @@ def catalogs(func):
         ctx = args[0]
         assert isinstance(ctx, Context)
 
+        from dbt.config.catalogs import load_catalogs
+        from dbt.exceptions import DbtProjectError
+
         req_strs = ["flags", "profile", "project"]
         reqs = [ctx.obj.get(req_str) for req_str in req_strs]
         if None in reqs:
@@ -418,6 +450,14 @@ def manifest(*args0, write=True, write_perf_info=False):
 
 def setup_manifest(ctx: Context, write: bool = True, write_perf_info: bool = False):
     """Load the manifest and add it to the context."""
+    from dbt.adapters.factory import get_adapter, register_adapter
+    from dbt.config.catalogs import get_active_write_integration
+    from dbt.context.providers import generate_runtime_macro_context
+    from dbt.context.query_header import generate_query_header_context
+    from dbt.exceptions import DbtProjectError
+    from dbt.mp_context import get_mp_context
+    from dbt.parser.manifest import parse_manifest
+
     req_strs = ["profile", "project", "runtime_config"]
     reqs = [ctx.obj.get(dep) for dep in req_strs]
 
@@ -431,12 +471,22 @@ def setup_manifest(ctx: Context, write: bool = True, write_perf_info: bool = Fal
 
     # if a manifest has already been set on the context, don't overwrite it
     if ctx.obj.get("manifest") is None:
+        # A manifest from a previous invocation in this process (see dbt.daemon) is used
+        # in place of the partial parsing file. It is popped, so that the caller can tell
+        # it has been consumed, and mutated, by parsing. The caller gets the contents of
+        # the partial parsing file instead, since running the command goes on to update
+        # the manifest.
+        keep_manifest_msgpack = "saved_manifest" in ctx.obj
         ctx.obj["manifest"] = parse_manifest(
             runtime_config,
             write_perf_info,
             write,
             ctx.obj["flags"].write_json,
             active_integrations,
+            saved_manifest=ctx.obj.pop("saved_manifest", None),
+            manifest_msgpack_hook=(
+                partial(ctx.obj.__setitem__, "manifest_msgpack") if keep_manifest_msgpack else None
+            ),
         )
         adapter = get_adapter(runtime_config)
     else:
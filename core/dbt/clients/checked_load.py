@@ -1,6 +1,6 @@
-import collections
 import dataclasses
-from typing import Any, Dict, List, Optional, Tuple
+import functools
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import yaml
 
@@ -20,55 +20,72 @@ class YamlCheckFailure:
     message: str
 
 
-def checked_load(contents) -> Tuple[Optional[Dict[str, Any]], List[YamlCheckFailure]]:
-    # A hacky (but sadly justified) method for modifying a bit of PyYAML. We create
-    # a new local subclass of SafeLoader, since we need to associate state with
-    # the static class, but static classes do not have non-static state. This allows
-    # us to be sure we have exclusive access to the class.
-    class CheckedLoader(SafeLoader):
-        check_failures: List[YamlCheckFailure] = []
-
-        def construct_mapping(self, node, deep=False):
-            if not isinstance(node, yaml.MappingNode):
-                raise yaml.constructor.ConstructorError(
-                    None, None, "expected a mapping node, but found %s" % node.id, node.start_mark
+def _duplicate_key_message(key: Any, key_node: yaml.Node) -> str:
+    start_mark = str(key_node.start_mark)
+    if start_mark.startswith("  in"):  # this means it was at the top level
+        return f"Duplicate key '{key}' {start_mark.lstrip()}"
+    else:
+        return f"Duplicate key '{key}' at {key_node.start_mark}"
+
+
+class CheckedLoader(SafeLoader):
+    """A SafeLoader that also reports duplicate keys in mappings.
+
+    Mappings are built by the regular SafeLoader constructor. A mapping ends up with fewer
+    keys than its node only when a key is repeated, so the keys are only looked at again
+    in that case. Mappings that start with a merge key (`<<`) are not checked.
+    """
+
+    def __init__(self, stream, check_failures: List[YamlCheckFailure]) -> None:
+        super().__init__(stream)
+        self.check_failures = check_failures
+        self._scalar_tags: Dict[Tuple[str, Any], str] = {}
+
+    def resolve(self, kind, value, implicit):
+        # Implicit tags are resolved by matching every plain scalar against a list of
+        # regexes. Keys and many values repeat throughout schema files, so remember them.
+        if kind is not yaml.ScalarNode:
+            return super().resolve(kind, value, implicit)
+        key = (value, implicit)
+        tag = self._scalar_tags.get(key)
+        if tag is None:
+            tag = self._scalar_tags[key] = super().resolve(kind, value, implicit)
+        return tag
+
+    def construct_mapping(self, node, deep=False):
+        is_override = (
+            isinstance(node, yaml.MappingNode)
+            and len(node.value) > 0
+            and getattr(node.value[0][0], "value", None) == "<<"
+        )
+        mapping = super().construct_mapping(node, deep=deep)
+        if not is_override and len(mapping) < len(node.value):
+            self._check_duplicate_keys(node)
+        return mapping
+
+    def _check_duplicate_keys(self, node: yaml.MappingNode) -> None:
+        keys: Set[Any] = set()
+        for key_node, _ in node.value:
+            # keys were constructed with the mapping, so this is a lookup
+            key = self.construct_object(key_node)
+            if key in keys:
+                self.check_failures.append(
+                    YamlCheckFailure("duplicate_key", _duplicate_key_message(key, key_node))
                 )
-            is_override = (
-                len(node.value) > 0
-                and len(node.value[0]) > 0
-                and getattr(node.value[0][0], "value") == "<<"
-            )
-            self.flatten_mapping(node)
-            mapping = {}
-            for key_node, value_node in node.value:
-                key = self.construct_object(key_node, deep=deep)
-                if not isinstance(key, collections.abc.Hashable):
-                    raise yaml.constructor.ConstructorError(
-                        "while constructing a mapping",
-                        node.start_mark,
-                        "found unhashable key",
-                        key_node.start_mark,
-                    )
-                value = self.construct_object(value_node, deep=deep)
-
-                if not is_override and key in mapping:
-                    start_mark = str(key_node.start_mark)
-                    if start_mark.startswith("  in"):  # this means it was at the top level
-                        message = f"Duplicate key '{key}' {start_mark.lstrip()}"
-                    else:
-                        message = f"Duplicate key '{key}' at {key_node.start_mark}"
-
-                    self.check_failures.append(YamlCheckFailure("duplicate_key", message))
-
-                mapping[key] = value
-            return mapping
-
-    CheckedLoader.add_constructor(
-        yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG, CheckedLoader.construct_mapping
-    )
-
-    dct = load_yaml_text(contents, loader=CheckedLoader)
-    check_failures = CheckedLoader.check_failures
+            keys.add(key)
+
+
+# Build mappings directly, rather than through the generator based constructor that
+# SafeLoader uses to support recursive structures.
+CheckedLoader.add_constructor(
+    yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG, CheckedLoader.construct_mapping
+)
+
+
+def checked_load(contents) -> Tuple[Optional[Dict[str, Any]], List[YamlCheckFailure]]:
+    check_failures: List[YamlCheckFailure] = []
+    loader = functools.partial(CheckedLoader, check_failures=check_failures)
+    dct = load_yaml_text(contents, loader=loader)
 
     return (dct, check_failures)
 
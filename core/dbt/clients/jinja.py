@@ -109,6 +109,12 @@ class UnitTestMacroGenerator(MacroGenerator):
 # is small enough that I've just chosen the more readable option.
 _HAS_RENDER_CHARS_PAT = re.compile(r"({[{%#]|[#}%]})")
 
+
+def has_render_chars(string: str) -> bool:
+    """Whether the string contains any jinja delimiters, and so needs rendering."""
+    return _HAS_RENDER_CHARS_PAT.search(string) is not None
+
+
 _render_cache: Dict[str, Any] = dict()
 
 
@@ -125,9 +131,9 @@ def get_rendered(
     # If this is desirable in the native env as well, we could handle the
     # native=True case by passing the input string to ast.literal_eval, like
     # the native renderer does.
-    has_render_chars = not isinstance(string, str) or _HAS_RENDER_CHARS_PAT.search(string)
+    needs_render = not isinstance(string, str) or has_render_chars(string)
 
-    if not has_render_chars:
+    if not needs_render:
         if not native:
             return string
         elif string in _render_cache:
@@ -143,7 +149,7 @@ def get_rendered(
 
     rendered = render_template(template, ctx, node)
 
-    if not has_render_chars and native:
+    if not needs_render and native:
         _render_cache[string] = rendered
 
     return rendered
@@ -155,6 +161,9 @@ def undefined_error(msg) -> NoReturn:
 
 GENERIC_TEST_KWARGS_NAME = "_dbt_generic_test_kwargs"
 
+# test kwargs that look like a function call are rendered as a jinja expression
+TEST_KWARG_FUNCTION_PATTERN = re.compile(r"^\s*(env_var|ref|var|source|doc)\s*\(.+\)\s*$")
+
 
 def add_rendered_test_kwargs(
     context: Dict[str, Any],
@@ -165,7 +174,6 @@ def add_rendered_test_kwargs(
     renderer, then insert that value into the given context as the special test
     keyword arguments member.
     """
-    looks_like_func = r"^\s*(env_var|ref|var|source|doc)\s*\(.+\)\s*$"
 
     def _convert_function(value: Any, keypath: Tuple[Union[str, int], ...]) -> Any:
         if isinstance(value, str):
@@ -174,7 +182,7 @@ def add_rendered_test_kwargs(
                 # be strings
                 return value
 
-            if re.match(looks_like_func, value) is not None:
+            if TEST_KWARG_FUNCTION_PATTERN.match(value) is not None:
                 # curly braces to make rendering happy
                 value = f"{{{{ {value} }}}}"
 
@@ -0,0 +1,88 @@
+import csv
+from typing import Any, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+import agate
+
+from dbt.exceptions import LoadAgateTableValueError
+from dbt_common.clients.agate_helper import BOM, build_type_tester
+
+# Number of rows used to infer column types when streaming a seed
+DEFAULT_SAMPLE_SIZE = 10000
+DEFAULT_CHUNK_SIZE = 10000
+
+
+class SeedStream:
+    """Read a seed csv as a series of agate tables, without materializing the whole file.
+
+    Column types are inferred once, from the first `sample_size` rows (columns listed in
+    `text_columns` are always text), and then applied to every chunk. A value further down
+    the file that does not fit the inferred type raises a LoadAgateTableValueError for `node`;
+    setting `column_types` for that column in the seed config avoids this.
+    """
+
+    def __init__(
+        self,
+        abspath: str,
+        text_columns: Iterable[str],
+        delimiter: str = ",",
+        sample_size: int = DEFAULT_SAMPLE_SIZE,
+        node: Optional[Any] = None,
+    ) -> None:
+        self.abspath = abspath
+        self.node = node
+        self.delimiter = delimiter
+        self.rows_loaded = 0
+
+        with self._open() as fp:
+            reader = csv.reader(fp, delimiter=delimiter)
+            header: List[str] = next(reader, [])
+            sample_rows = [row for _, row in zip(range(sample_size), reader)]
+
+        type_tester = build_type_tester(text_columns=text_columns)
+        # the sample table is also what materializations use to create the seed table
+        self.sample_table = agate.Table(sample_rows, header, column_types=type_tester)
+        self.sample_table.original_abspath = abspath  # type: ignore
+
+    @property
+    def column_names(self) -> Tuple[str, ...]:
+        return self.sample_table.column_names
+
+    @property
+    def column_types(self) -> Tuple[agate.data_types.DataType, ...]:
+        return self.sample_table.column_types
+
+    def _open(self) -> TextIO:
+        fp = open(self.abspath, encoding="utf-8")
+        if fp.read(1) != BOM:
+            fp.seek(0)
+        return fp
+
+    def _to_table(self, rows: List[List[str]]) -> agate.Table:
+        try:
+            return agate.Table(rows, self.column_names, self.column_types)
+        except agate.CastError as exc:
+            raise LoadAgateTableValueError(
+                ValueError(
+                    f"{exc} Column types are inferred from the first rows of large seeds, "
+                    "set `column_types` in the seed config to override them."
+                ),
+                node=self.node,
+            )
+
+    def chunks(self, chunk_size: Optional[int] = None) -> Iterator[agate.Table]:
+        """Yield the rows of the seed as agate tables of at most `chunk_size` rows."""
+        chunk_size = chunk_size or DEFAULT_CHUNK_SIZE
+        self.rows_loaded = 0
+        with self._open() as fp:
+            reader = csv.reader(fp, delimiter=self.delimiter)
+            next(reader, None)
+            rows: List[List[str]] = []
+            for row in reader:
+                rows.append(row)
+                if len(rows) >= chunk_size:
+                    self.rows_loaded += len(rows)
+                    yield self._to_table(rows)
+                    rows = []
+            if rows:
+                self.rows_loaded += len(rows)
+                yield self._to_table(rows)
@@ -1,8 +1,10 @@
 import dataclasses
+import hashlib
 import json
 import os
 import pickle
 from collections import defaultdict, deque
+from itertools import chain
 from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 import networkx as nx  # type: ignore
@@ -11,6 +13,7 @@ import sqlparse
 import dbt.tracking
 from dbt.adapters.factory import get_adapter
 from dbt.clients import jinja
+from dbt.constants import LINKED_GRAPH_FILE_NAME
 from dbt.context.providers import (
     generate_runtime_model_context,
     generate_runtime_unit_test_context,
@@ -37,10 +40,12 @@ from dbt.exceptions import (
     ParsingError,
 )
 from dbt.flags import get_flags
-from dbt.graph import Graph
+from dbt.graph import Graph, UniqueId
 from dbt.node_types import ModelLanguage, NodeType
+from dbt.profiler import span
 from dbt_common.clients.system import make_directory
 from dbt_common.contracts.constraints import ConstraintType
+from dbt_common.events.base_types import EventLevel
 from dbt_common.events.contextvars import get_node_info
 from dbt_common.events.format import pluralize
 from dbt_common.events.functions import fire_event
@@ -119,6 +124,26 @@ def _get_tests_for_node(manifest: Manifest, unique_id: UniqueID) -> List[UniqueI
     return tests
 
 
+def linked_graph_key(manifest: Manifest) -> str:
+    """A hash of everything Linker.link_graph builds the graph from: the unique_id of each
+    graph member and the nodes it depends on, i.e. the manifest's parent map.
+    """
+    hasher = hashlib.sha256()
+    for unique_id in manifest.sources:
+        hasher.update(f"{unique_id}\n".encode())
+    for member in chain(
+        manifest.nodes.values(),
+        manifest.semantic_models.values(),
+        manifest.exposures.values(),
+        manifest.functions.values(),
+        manifest.metrics.values(),
+        manifest.unit_tests.values(),
+        manifest.saved_queries.values(),
+    ):
+        hasher.update(f"{member.unique_id}:{','.join(member.depends_on_nodes)}\n".encode())
+    return hasher.hexdigest()
+
+
 @dataclasses.dataclass
 class SeenDetails:
     node_id: UniqueID
@@ -129,6 +154,64 @@ class SeenDetails:
     )
 
 
+def _graph_to_json(graph: nx.DiGraph) -> Dict[str, List]:
+    nodes = list(graph)
+    index = {node: i for i, node in enumerate(nodes)}
+    edges = [[index[parent], index[child]] for parent, child in graph.edges()]
+    return {"nodes": nodes, "edges": edges}
+
+
+def _graph_from_json(saved: Dict[str, List], graph: nx.DiGraph) -> None:
+    nodes = saved["nodes"]
+    graph.add_nodes_from(nodes)
+    graph.add_edges_from((nodes[parent], nodes[child]) for parent, child in saved["edges"])
+
+
+def _retry_graph_key(manifest: Manifest, command: str) -> str:
+    # build adds test edges to its graph, which other commands don't
+    return f"{command}:{linked_graph_key(manifest)}"
+
+
+def write_retry_graph(
+    outfile: str, graph: Graph, manifest: Manifest, command: str, unique_ids: Iterable[str]
+) -> None:
+    """Write the part of a command's graph that `dbt retry` may need to run: the subset graph
+    of `unique_ids`, the nodes that didn't succeed. A retry of the same command can then take
+    its subset graph from this one, instead of linking the whole project again.
+    """
+    sorted_ids = sorted(unique_ids)
+    subset = graph.get_subset_graph(UniqueId(unique_id) for unique_id in sorted_ids)
+    key = _retry_graph_key(manifest, command)
+    with open(outfile, "w") as fp:
+        json.dump({"key": key, "unique_ids": sorted_ids, **_graph_to_json(subset.graph)}, fp)
+
+
+def read_retry_graph(
+    infile: str, manifest: Manifest, command: str, unique_ids: Iterable[str]
+) -> Optional[Graph]:
+    """Load a graph written by write_retry_graph, if it was written by the same command for a
+    manifest with the same linked_graph_key, and covers all of `unique_ids`.
+    """
+    if not os.path.exists(infile):
+        return None
+    try:
+        with open(infile) as fp:
+            saved = json.load(fp)
+        if saved["key"] != _retry_graph_key(manifest, command):
+            return None
+        if not set(unique_ids).issubset(saved["unique_ids"]):
+            return None
+        graph = nx.DiGraph()
+        _graph_from_json(saved, graph)
+    except Exception as exc:
+        fire_event(
+            Note(msg=f"Failed to load the retry graph from {infile}: {exc}"),
+            level=EventLevel.DEBUG,
+        )
+        return None
+    return Graph(graph)
+
+
 class Linker:
     def __init__(self, data=None) -> None:
         if data is None:
@@ -159,17 +242,50 @@ class Linker:
     def add_node(self, node):
         self.graph.add_node(node)
 
-    def write_graph(self, outfile: str, manifest: Manifest):
-        """Write the graph to a gpickle file. Before doing so, serialize and
-        include all nodes in their corresponding graph entries.
+    def write_graph(self, outfile: str, manifest: Manifest, node_data: bool = True):
+        """Write the graph to a gpickle file. Unless node_data is False, serialize and
+        include all nodes in their corresponding graph entries before doing so. This
+        is most of the cost of writing the file.
         """
-        out_graph = self.graph.copy()
-        for node_id in self.graph:
-            data = manifest.expect(node_id).to_dict(omit_none=True)
-            out_graph.add_node(node_id, **data)
+        out_graph = self.graph
+        if node_data:
+            out_graph = self.graph.copy()
+            for node_id in self.graph:
+                data = manifest.expect(node_id).to_dict(omit_none=True)
+                out_graph.add_node(node_id, **data)
         with open(outfile, "wb") as outfh:
             pickle.dump(out_graph, outfh, protocol=pickle.HIGHEST_PROTOCOL)
 
+    def write_linked_graph(self, outfile: str, key: str) -> None:
+        """Write the structure of the graph, without any node data, for a later invocation
+        with the same linked_graph_key to load instead of linking again. Nodes are
+        referred to by their index in the node list.
+        """
+        with open(outfile, "w") as fp:
+            json.dump({"key": key, **_graph_to_json(self.graph)}, fp)
+
+    @classmethod
+    def read_linked_graph(cls, infile: str, key: str) -> Optional["Linker"]:
+        """Load a graph written by write_linked_graph, if it was linked from a manifest
+        with the same linked_graph_key.
+        """
+        if not os.path.exists(infile):
+            return None
+        try:
+            with open(infile) as fp:
+                saved = json.load(fp)
+            if saved["key"] != key:
+                return None
+            linker = cls()
+            _graph_from_json(saved, linker.graph)
+        except Exception as exc:
+            fire_event(
+                Note(msg=f"Failed to load the linked graph from {infile}: {exc}"),
+                level=EventLevel.DEBUG,
+            )
+            return None
+        return linker
+
     def link_node(self, node: GraphMemberNode, manifest: Manifest):
         self.add_node(node.unique_id)
 
@@ -448,17 +564,14 @@ class Linker:
         and performance tuning. The summary includes only the edge structure,
         node types, and node names. Each of the n nodes is assigned an integer
         index 0, 1, 2,..., n-1 for compactness"""
-        graph_nodes = dict()
-        index_dict = dict()
-        for node_index, node_name in enumerate(self.graph):
-            index_dict[node_name] = node_index
-            data = manifest.expect(node_name).to_dict(omit_none=True)
-            graph_nodes[node_index] = {"name": node_name, "type": data["resource_type"]}
-
-        for node_index, node in graph_nodes.items():
-            successors = [index_dict[n] for n in self.graph.successors(node["name"])]
+        index_dict = {node_name: node_index for node_index, node_name in enumerate(self.graph)}
+        graph_nodes: Dict[int, Dict[str, Any]] = dict()
+        for node_name, node_index in index_dict.items():
+            node = {"name": node_name, "type": manifest.expect(node_name).resource_type}
+            successors = [index_dict[n] for n in self.graph.successors(node_name)]
             if successors:
-                node["succ"] = [index_dict[n] for n in self.graph.successors(node["name"])]
+                node["succ"] = successors
+            graph_nodes[node_index] = node
 
         return graph_nodes
 
@@ -675,23 +788,26 @@ class Compiler:
     # writes out the graph.gpickle file, and prints the stats, returning a Graph object.
     def compile(self, manifest: Manifest, write=True, add_test_edges=False) -> Graph:
         self.initialize()
-        linker = Linker()
-        linker.link_graph(manifest)
+        with span("link_graph", category="graph"):
+            linker = self.link_graph(manifest)
 
         # Create a file containing basic information about graph structure,
         # supporting diagnostics and performance analysis.
         summaries: Dict = dict()
         summaries["_invocation_id"] = get_invocation_id()
-        summaries["linked"] = linker.get_graph_summary(manifest)
+        with span("graph_summary", category="graph"):
+            summaries["linked"] = linker.get_graph_summary(manifest)
 
         # This is only called for the "build" command
         if add_test_edges:
-            manifest.build_parent_and_child_maps()
-            linker.add_test_edges(manifest)
+            with span("add_test_edges", category="graph"):
+                manifest.build_parent_and_child_maps()
+                linker.add_test_edges(manifest)
 
             # Create another diagnostic summary, just as above, but this time
             # including the test edges.
-            summaries["with_test_edges"] = linker.get_graph_summary(manifest)
+            with span("graph_summary", category="graph"):
+                summaries["with_test_edges"] = linker.get_graph_summary(manifest)
 
         with open(
             os.path.join(self.config.project_target_path, "graph_summary.json"), "w"
@@ -705,24 +821,42 @@ class Compiler:
                     )
                 )
 
-        stats = _generate_stats(manifest)
-
         if write:
-            self.write_graph_file(linker, manifest)
+            with span("write_graph_file", category="graph"):
+                self.write_graph_file(linker, manifest)
+
+        self.print_stats(manifest)
+        return Graph(linker.graph)
 
+    def print_stats(self, manifest: Manifest) -> None:
         # Do not print these for list command
         if self.config.args.which != "list":
             stats = _generate_stats(manifest)
             print_compile_stats(stats)
 
-        return Graph(linker.graph)
+    def link_graph(self, manifest: Manifest) -> Linker:
+        """Link the graph, or, when partial parsing, load it from the linked graph file of a
+        previous invocation if no dependencies have changed since. Only graphs without cycles
+        are saved, so a loaded graph doesn't need to be checked for cycles again.
+        """
+        path = os.path.join(self.config.project_target_path, LINKED_GRAPH_FILE_NAME)
+        key = linked_graph_key(manifest)
+        if get_flags().PARTIAL_PARSE:
+            saved = Linker.read_linked_graph(path, key)
+            if saved is not None:
+                return saved
+
+        linker = Linker()
+        linker.link_graph(manifest)
+        linker.write_linked_graph(path, key)
+        return linker
 
     def write_graph_file(self, linker: Linker, manifest: Manifest):
         filename = graph_file_name
         graph_path = os.path.join(self.config.project_target_path, filename)
         flags = get_flags()
         if flags.WRITE_JSON:
-            linker.write_graph(graph_path, manifest)
+            linker.write_graph(graph_path, manifest, node_data=flags.WRITE_GRAPH_NODE_DATA)
 
     # writes the "compiled_code" into the target/compiled directory
     def _write_node(
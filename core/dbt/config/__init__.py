@@ -1,4 +1,28 @@
-# all these are just exports, they need "noqa" so flake8 will not complain.
-from .profile import Profile  # noqa
-from .project import IsFQNResource, PartialProject, Project  # noqa
-from .runtime import RuntimeConfig  # noqa
+from typing import TYPE_CHECKING, Any
+
+# These are just exports. They are loaded on first access, so that importing a submodule
+# like dbt.config.utils (which the cli does at startup) doesn't also load the runtime
+# config and, with it, the adapters.
+if TYPE_CHECKING:
+    from .profile import Profile  # noqa
+    from .project import IsFQNResource, PartialProject, Project  # noqa
+    from .runtime import RuntimeConfig  # noqa
+
+_EXPORTS = {
+    "Profile": "dbt.config.profile",
+    "IsFQNResource": "dbt.config.project",
+    "PartialProject": "dbt.config.project",
+    "Project": "dbt.config.project",
+    "RuntimeConfig": "dbt.config.runtime",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+
+    value = getattr(importlib.import_module(_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
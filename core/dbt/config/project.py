@@ -669,6 +669,14 @@ class Project:
     restrict_access: bool
     dbt_cloud: Dict[str, Any]
     flags: Dict[str, Any]
+    # Merged dbt_project.yml configs by fqn prefix, see BaseContextConfigGenerator
+    fqn_config_cache: Dict[Any, Any] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # Merged vars by package and adapter type, see ModelConfiguredVar
+    merged_vars_cache: Dict[Any, Any] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     @property
     def all_source_paths(self) -> List[str]:
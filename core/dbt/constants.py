@@ -21,8 +21,11 @@ LEGACY_TIME_SPINE_MODEL_NAME = "metricflow_time_spine"
 LEGACY_TIME_SPINE_GRANULARITY = TimeGranularity.DAY
 MINIMUM_REQUIRED_TIME_SPINE_GRANULARITY = TimeGranularity.DAY
 PARTIAL_PARSE_FILE_NAME = "partial_parse.msgpack"
+LINKED_GRAPH_FILE_NAME = "linked_graph.json"
+RETRY_GRAPH_FILE_NAME = "retry_graph.json"
 PACKAGE_LOCK_HASH_KEY = "sha1_hash"
 CATALOGS_FILE_NAME = "catalogs.yml"
 RUN_RESULTS_FILE_NAME = "run_results.json"
 CATALOG_FILENAME = "catalog.json"
 SOURCE_RESULT_FILE_NAME = "sources.json"
+TIMELINE_FILE_NAME = "timeline.json"
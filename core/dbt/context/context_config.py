@@ -1,7 +1,7 @@
 from abc import abstractmethod
 from copy import deepcopy
 from dataclasses import dataclass
-from typing import Any, Dict, Generic, Iterator, List, Optional, TypeVar
+from typing import Any, Dict, Generic, Iterator, List, Optional, Tuple, TypeVar
 
 from dbt.adapters.factory import get_config_class_by_name
 from dbt.config import IsFQNResource, Project, RuntimeConfig
@@ -119,20 +119,52 @@ class BaseContextConfigGenerator(Generic[T]):
         src = self.get_config_source(project)
         model_configs = src.get_config_dict(resource_type)
         for level_config in fqn_search(model_configs, fqn):
-            result = {}
-            for key, value in level_config.items():
-                if key.startswith("+"):
-                    result[key[1:].strip()] = deepcopy(value)
-                elif not isinstance(value, dict):
-                    result[key] = deepcopy(value)
-
-            yield result
+            yield self._level_config(level_config)
+
+    @staticmethod
+    def _level_config(level_config: Dict[str, Any]) -> Dict[str, Any]:
+        result = {}
+        for key, value in level_config.items():
+            if key.startswith("+"):
+                result[key[1:].strip()] = deepcopy(value)
+            elif not isinstance(value, dict):
+                result[key] = deepcopy(value)
+        return result
 
     def _active_project_configs(
         self, fqn: List[str], resource_type: NodeType
     ) -> Iterator[Dict[str, Any]]:
         return self._project_configs(self._active_project, fqn, resource_type)
 
+    def _merged_project_configs(
+        self, project: Project, fqn: List[str], resource_type: NodeType, base: bool
+    ) -> T:
+        """Return the initial result updated with the project's configs along the fqn.
+
+        The merged result for each fqn prefix is cached on the active project, so a
+        level of dbt_project.yml config is only merged once, however many nodes share
+        that path. A copy is returned, so callers are free to update it.
+        """
+        model_configs = self.get_config_source(project).get_config_dict(resource_type)
+        key = (type(self), project.project_name, resource_type, base)
+        cached: Optional[Tuple[Dict[str, Any], Dict[Tuple[str, ...], T]]]
+        cached = self._active_project.fqn_config_cache.get(key)
+        # the config dict is kept in the cache entry so that a replaced dict is a cache miss
+        if cached is None or cached[0] is not model_configs:
+            cached = (model_configs, {})
+            self._active_project.fqn_config_cache[key] = cached
+        results_by_prefix = cached[1]
+
+        result = self.initial_result(resource_type=resource_type, base=base)
+        for depth, level_config in enumerate(fqn_search(model_configs, fqn)):
+            prefix = tuple(fqn[:depth])
+            if prefix not in results_by_prefix:
+                results_by_prefix[prefix] = self._update_from_config(
+                    deepcopy(result), self._level_config(level_config)
+                )
+            result = results_by_prefix[prefix]
+        return deepcopy(result)
+
     @abstractmethod
     def _update_from_config(
         self, result: T, partial: Dict[str, Any], validate: bool = False
@@ -154,13 +186,9 @@ class BaseContextConfigGenerator(Generic[T]):
     ) -> BaseConfig:
         own_config = self.get_node_project(project_name)
 
-        result = self.initial_result(resource_type=resource_type, base=base)
-
         # builds the config from what was specified in the runtime_config, which generally
         # comes from the project's dbt_project.yml file.
-        project_configs = self._project_configs(own_config, fqn, resource_type)
-        for fqn_config in project_configs:
-            result = self._update_from_config(result, fqn_config)
+        result = self._merged_project_configs(own_config, fqn, resource_type, base)
 
         # When schema files patch config, it has lower precedence than
         # config in the models (config_call_dict), so we add the patch_config_dict
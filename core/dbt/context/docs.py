@@ -1,4 +1,4 @@
-from typing import Any, Dict, Union
+from typing import Any, Dict, List, Union
 
 from dbt.config.runtime import RuntimeConfig
 from dbt.context.base import contextmember
@@ -19,6 +19,8 @@ class DocsRuntimeContext(SchemaYamlContext):
         super().__init__(config, current_project, None)
         self.node = node
         self.manifest = manifest
+        # file ids of the docs blocks resolved by doc(), in call order
+        self.doc_file_ids: List[str] = []
 
     @contextmember()
     def doc(self, *args: str) -> str:
@@ -59,6 +61,7 @@ class DocsRuntimeContext(SchemaYamlContext):
         )
         if target_doc:
             file_id = target_doc.file_id
+            self.doc_file_ids.append(file_id)
             if file_id in self.manifest.files:
                 source_file = self.manifest.files[file_id]
                 # TODO CT-211
@@ -42,6 +42,7 @@ from dbt.clients.jinja import (
     get_rendered,
 )
 from dbt.clients.jinja_static import statically_parse_unrendered_config
+from dbt.clients.seed_stream import DEFAULT_SAMPLE_SIZE, SeedStream
 from dbt.config import IsFQNResource, Project, RuntimeConfig
 from dbt.constants import DEFAULT_ENV_PLACEHOLDER
 from dbt.context.base import Var, contextmember, contextproperty
@@ -952,11 +953,22 @@ class ModelConfiguredVar(Var):
 
         adapter_type = self._config.credentials.type
 
+        # Vars are scoped by package (see VarProvider.vars_for), so every node in a package
+        # gets the same merged vars. They are merged once per invocation, and flattened into
+        # a dict so that var() doesn't have to search each source. The cli vars are
+        # compared, since a unit test can override them on a copy of the config.
+        key = (self._node.package_name, adapter_type)
+        cached = self._config.merged_vars_cache.get(key)
+        if cached is not None and cached[0] == self._cli_vars:
+            return cached[1]
+
         merged = MultiDict()
         for project in self.packages_for_node():
             merged.add(project.vars.vars_for(search_node, adapter_type))
         merged.add(self._cli_vars)
-        return merged
+        merged_vars = dict(merged)
+        self._config.merged_vars_cache[key] = (dict(self._cli_vars), merged_vars)
+        return merged_vars
 
 
 class ParseVar(ModelConfiguredVar):
@@ -1249,26 +1261,32 @@ class ProviderContext(ManifestContext):
         except Exception:
             raise CompilationError(message_if_exception, self.model)
 
-    @contextmember()
-    def load_agate_table(self) -> "agate.Table":
-        from dbt_common.clients import agate_helper
-
+    def _seed_node(self) -> SeedNode:
         if not isinstance(self.model, SeedNode):
             raise LoadAgateTableNotSeedError(self.model.resource_type, node=self.model)
+        return self.model
 
+    def _seed_file_path(self, seed: SeedNode) -> str:
         # include package_path for seeds defined in packages
         package_path = (
-            os.path.join(self.config.packages_install_path, self.model.package_name)
-            if self.model.package_name != self.config.project_name
+            os.path.join(self.config.packages_install_path, seed.package_name)
+            if seed.package_name != self.config.project_name
             else "."
         )
-        path = os.path.join(self.config.project_root, package_path, self.model.original_file_path)
+        path = os.path.join(self.config.project_root, package_path, seed.original_file_path)
         if not os.path.exists(path):
-            assert self.model.root_path
-            path = os.path.join(self.model.root_path, self.model.original_file_path)
+            assert seed.root_path
+            path = os.path.join(seed.root_path, seed.original_file_path)
+        return path
 
-        column_types = self.model.config.column_types
-        delimiter = self.model.config.delimiter
+    @contextmember()
+    def load_agate_table(self) -> "agate.Table":
+        from dbt_common.clients import agate_helper
+
+        seed = self._seed_node()
+        path = self._seed_file_path(seed)
+        column_types = seed.config.column_types
+        delimiter = seed.config.delimiter
         try:
             table = agate_helper.from_csv(path, text_columns=column_types, delimiter=delimiter)
         except ValueError as e:
@@ -1277,6 +1295,29 @@ class ProviderContext(ManifestContext):
         table.original_abspath = os.path.abspath(path)  # type: ignore
         return table
 
+    @contextmember()
+    def load_agate_table_stream(self, sample_size: Optional[int] = None) -> SeedStream:
+        """Open the seed for chunked loading, rather than reading it all into
+        memory like `load_agate_table`. Column types are inferred from the
+        first `sample_size` rows, unless set with `column_types`.
+
+        The returned stream exposes the inferred `sample_table`, used to create
+        the seed table, and `chunks(chunk_size)`, which yields agate tables of
+        at most `chunk_size` rows for batched inserts.
+        """
+        seed = self._seed_node()
+        path = self._seed_file_path(seed)
+        try:
+            return SeedStream(
+                os.path.abspath(path),
+                text_columns=seed.config.column_types,
+                delimiter=seed.config.delimiter,
+                sample_size=sample_size or DEFAULT_SAMPLE_SIZE,
+                node=seed,
+            )
+        except ValueError as e:
+            raise LoadAgateTableValueError(e, node=self.model)
+
     @contextproperty()
     def ref(self) -> Callable:
         """The most important function in dbt is `ref()`; it's impossible to
@@ -165,8 +165,9 @@ class SourceFile(BaseSourceFile):
 
     @classmethod
     def big_seed(cls, path: FilePath) -> "SourceFile":
-        """Parse seeds over the size limit with just the path"""
-        self = cls(path=path, checksum=FileHash.path(path.original_file_path))
+        """Parse seeds over the size limit without loading their contents,
+        hashing the file in chunks instead"""
+        self = cls(path=path, checksum=FileHash.from_file(path.absolute_path))
         self.contents = ""
         return self
 
@@ -1,4 +1,5 @@
 import enum
+from bisect import insort
 from collections import defaultdict
 from dataclasses import dataclass, field, replace
 from itertools import chain
@@ -218,6 +219,8 @@ class RefableLookup(dbtClassMixin):
 
     def __init__(self, manifest: "Manifest") -> None:
         self.storage: Dict[str, Dict[PackageName, UniqueID]] = {}
+        # (package, name) -> the versions of a versioned model, in ascending order
+        self.versions: Dict[Tuple[PackageName, str], List[UnparsedVersion]] = {}
         self.populate(manifest)
 
     def get_unique_id(
@@ -258,15 +261,7 @@ class RefableLookup(dbtClassMixin):
                 and get_node_info()
             ):
                 # Check to see if newer versions are available, and log an "FYI" if so
-                max_version: UnparsedVersion = max(
-                    [
-                        UnparsedVersion(v.version)
-                        for v in manifest.nodes.values()
-                        if isinstance(v, ModelNode)
-                        and v.name == node.name
-                        and v.version is not None
-                    ]
-                )
+                max_version = self.versions[(node.package_name, node.name)][-1]
                 assert node.latest_version is not None  # for mypy, whenever i may find it
                 if max_version > UnparsedVersion(node.latest_version):
                     fire_event(
@@ -293,6 +288,13 @@ class RefableLookup(dbtClassMixin):
                 self.storage[node.search_name][node.package_name] = node.unique_id
                 if node.is_latest_version:  # type: ignore
                     self.storage[node.name][node.package_name] = node.unique_id
+                # only models are versioned (see VERSIONED_NODE_TYPES)
+                if isinstance(node, ModelNode):
+                    assert node.version is not None
+                    insort(
+                        self.versions.setdefault((node.package_name, node.name), []),
+                        UnparsedVersion(node.version),
+                    )
             else:
                 self.storage[node.name][node.package_name] = node.unique_id
 
@@ -758,6 +760,7 @@ class MacroMethods:
         self.metadata = {}
         self._macros_by_name = {}
         self._macros_by_package = {}
+        self._macro_candidates = {}
 
     def find_macro_candidate_by_name(
         self, name: str, root_project_name: str, package: Optional[str]
@@ -830,22 +833,32 @@ class MacroMethods:
         filter: Optional[Callable[[MacroCandidate], bool]] = None,
     ) -> CandidateList:
         """Find macros by their name."""
-        candidates: CandidateList = CandidateList()
-
-        macros_by_name = self.get_macros_by_name()
-        if name not in macros_by_name:
-            return candidates
+        return CandidateList(
+            candidate
+            for candidate in self._get_macro_candidates(name, root_project_name)
+            if filter is None or filter(candidate)
+        )
 
-        packages = set(get_adapter_package_names(self.metadata.adapter_type))
-        for macro in macros_by_name[name]:
-            candidate = MacroCandidate(
-                locality=_get_locality(macro, root_project_name, packages),
-                macro=macro,
-            )
-            if filter is None or filter(candidate):
-                candidates.append(candidate)
+    def _get_macro_candidates(self, name: str, root_project_name: str) -> List[MacroCandidate]:
+        # The candidates for a name only change with the macros, so they're built once
+        # per name until a macro is added or removed (see _clear_macro_resolution).
+        if self._macro_candidates is None:
+            self._macro_candidates = {}
+
+        key = (name, root_project_name, self.metadata.adapter_type)
+        if key not in self._macro_candidates:
+            packages = set(get_adapter_package_names(self.metadata.adapter_type))
+            self._macro_candidates[key] = [
+                MacroCandidate(
+                    locality=_get_locality(macro, root_project_name, packages),
+                    macro=macro,
+                )
+                for macro in self.get_macros_by_name().get(name, [])
+            ]
+        return self._macro_candidates[key]
 
-        return candidates
+    def _clear_macro_resolution(self) -> None:
+        self._macro_candidates = None
 
     def get_macros_by_name(self) -> Dict[str, List[Macro]]:
         if self._macros_by_name is None:
@@ -984,6 +997,20 @@ class Manifest(MacroMethods, dbtClassMixin):
         default=None,
         metadata={"serialize": lambda x: None, "deserialize": lambda x: None},
     )
+    _macro_candidates: Optional[Dict[Tuple[str, str, Optional[str]], List[MacroCandidate]]] = (
+        field(
+            default=None,
+            metadata={"serialize": lambda x: None, "deserialize": lambda x: None},
+        )
+    )
+    # (project, materialization, adapter type, require explicit package overrides) ->
+    # (materialization macro, package whose override needs a deprecation warning)
+    _materialization_macros: Optional[
+        Dict[Tuple[str, str, str, bool], Tuple[Optional[Macro], Optional[str]]]
+    ] = field(
+        default=None,
+        metadata={"serialize": lambda x: None, "deserialize": lambda x: None},
+    )
 
     def __pre_serialize__(self, context: Optional[Dict] = None):
         # serialization won't work with anything except an empty source_patches because
@@ -1055,6 +1082,35 @@ class Manifest(MacroMethods, dbtClassMixin):
     def find_materialization_macro_by_name(
         self, project_name: str, materialization_name: str, adapter_type: str
     ) -> Optional[Macro]:
+        # This runs for every node that's executed, so the result is kept until a macro
+        # is added or removed.
+        if self._materialization_macros is None:
+            self._materialization_macros = {}
+
+        require_explicit_overrides = (
+            get_flags().require_explicit_package_overrides_for_builtin_materializations
+        )
+        key = (project_name, materialization_name, adapter_type, require_explicit_overrides)
+        if key not in self._materialization_macros:
+            self._materialization_macros[key] = self._resolve_materialization_macro(
+                project_name, materialization_name, adapter_type
+            )
+
+        macro, overriding_package = self._materialization_macros[key]
+        if overriding_package is not None:
+            deprecations.warn(
+                "package-materialization-override",
+                package_name=overriding_package,
+                materialization_name=materialization_name,
+            )
+        return macro
+
+    def _resolve_materialization_macro(
+        self, project_name: str, materialization_name: str, adapter_type: str
+    ) -> Tuple[Optional[Macro], Optional[str]]:
+        """The materialization macro, and its package if it's a package override of a builtin
+        materialization that is only allowed by the legacy behaviour.
+        """
         candidates: CandidateList = CandidateList(
             chain.from_iterable(
                 self._materialization_candidates_for(
@@ -1071,6 +1127,7 @@ class Manifest(MacroMethods, dbtClassMixin):
         ]
 
         materialization_candidate = candidates.last_candidate()
+        overriding_package = None
         # If an imported materialization macro was found that also had a core candidate, fire a deprecation
         if (
             materialization_candidate is not None
@@ -1082,17 +1139,20 @@ class Manifest(MacroMethods, dbtClassMixin):
                 get_flags().require_explicit_package_overrides_for_builtin_materializations
                 is False
             ):
-                deprecations.warn(
-                    "package-materialization-override",
-                    package_name=materialization_candidate.macro.package_name,
-                    materialization_name=materialization_name,
-                )
+                overriding_package = materialization_candidate.macro.package_name
             else:
                 materialization_candidate = candidates.last_candidate(
                     valid_localities=[Locality.Core, Locality.Root]
                 )
 
-        return materialization_candidate.macro if materialization_candidate else None
+        return (
+            materialization_candidate.macro if materialization_candidate else None,
+            overriding_package,
+        )
+
+    def _clear_macro_resolution(self) -> None:
+        super()._clear_macro_resolution()
+        self._materialization_macros = None
 
     def get_resource_fqns(self) -> Mapping[str, PathSet]:
         resource_fqns: Dict[str, Set[Tuple[str, ...]]] = {}
@@ -1671,9 +1731,18 @@ class Manifest(MacroMethods, dbtClassMixin):
             self._macros_by_package[macro.package_name] = {}
 
         self._macros_by_package[macro.package_name][macro.name] = macro
+        self._clear_macro_resolution()
 
         source_file.macros.append(macro.unique_id)
 
+    def remove_macro(self, unique_id: UniqueID) -> Macro:
+        """Remove a macro, along with everything that was looked up from the macros."""
+        macro = self.macros.pop(unique_id)
+        self._macros_by_name = None
+        self._macros_by_package = None
+        self._clear_macro_resolution()
+        return macro
+
     def has_file(self, source_file: SourceFile) -> bool:
         key = source_file.file_id
         if key is None:
@@ -1885,6 +1954,7 @@ class MacroManifest(MacroMethods):
         self.flat_graph: Dict[str, Any] = {}
         self._macros_by_name: Optional[Dict[str, List[Macro]]] = None
         self._macros_by_package: Optional[Dict[str, Dict[str, Macro]]] = None
+        self._macro_candidates: Optional[Dict] = None
 
 
 AnyManifest = Union[Manifest, MacroManifest]
@@ -193,6 +193,7 @@ BANNED_PROJECT_NAMES = {
     "graph",
     "invocation_id",
     "load_agate_table",
+    "load_agate_table_stream",
     "load_result",
     "log",
     "model",
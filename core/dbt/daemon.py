@@ -0,0 +1,339 @@
+"""A local dbt daemon, which keeps a project's parsed state warm between invocations.
+
+    python -m dbt.daemon start      # in the project directory, runs in the foreground
+    python -m dbt.daemon ls -s my_model
+    python -m dbt.daemon stop
+
+The daemon listens on a unix socket and runs the commands it receives in-process, one at
+a time, with a dbtRunner. The contents of the partial parsing file are kept in memory, and
+are deserialized into a manifest after each response is sent, while the daemon waits for
+the next command. Each invocation then only re-checks the project files (via the usual
+partial parsing diff) instead of paying for interpreter startup, imports and deserializing
+the saved manifest. Commands run with the client's working
+directory and its dbt environment variables (see FORWARDED_ENV_VARS), and their output is
+streamed back to the client. Other environment variables, such as credentials that a profile
+reads with env_var(), are taken from the daemon's own environment.
+
+Only the user who started the daemon can connect to it: its socket lives in a directory
+that only that user can access, and connections from other users are rejected where the
+platform reports the peer's uid.
+
+If no daemon is running for the project, the client runs the command itself.
+
+This module only imports the standard library at the top, so that the client starts fast.
+"""
+
+import hashlib
+import io
+import json
+import os
+import socket
+import socketserver
+import struct
+import sys
+import threading
+from contextlib import contextmanager, redirect_stdout, suppress
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    TextIO,
+    cast,
+)
+
+if TYPE_CHECKING:
+    from dbt.cli.main import dbtRunnerResult
+    from dbt.contracts.graph.manifest import Manifest
+
+SOCKET_PATH_ENV_VAR = "DBT_DAEMON_SOCKET"
+SHUTDOWN_COMMAND = "shutdown"
+
+# The client's environment variables that commands run with: dbt's own (flags, secrets and
+# custom env vars), and those that affect the process itself.
+FORWARDED_ENV_VARS = ("PATH", "HOME", "TZ", "LANG", "LC_ALL", "LC_CTYPE", "DO_NOT_TRACK")
+FORWARDED_ENV_VAR_PREFIX = "DBT_"
+
+
+def socket_dir() -> str:
+    """A directory that only the current user can access, for the daemons' sockets.
+
+    Sockets don't live in the project, since unix socket paths are limited to ~100
+    characters and `dbt clean` may remove the target directory.
+    """
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        path = os.path.join(runtime_dir, "dbt")
+    else:
+        path = os.path.join(os.path.expanduser("~"), ".dbt", "daemon")
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    # in case the directory already existed with other permissions
+    os.chmod(path, 0o700)
+    return path
+
+
+def default_socket_path(project_dir: str) -> str:
+    """The socket of the daemon for a project, unless DBT_DAEMON_SOCKET is set."""
+    if os.environ.get(SOCKET_PATH_ENV_VAR):
+        return os.environ[SOCKET_PATH_ENV_VAR]
+    digest = hashlib.sha256(os.path.realpath(project_dir).encode()).hexdigest()[:16]
+    return os.path.join(socket_dir(), f"dbt-{digest}.sock")
+
+
+def forwarded_env(env: Mapping[str, str]) -> Dict[str, str]:
+    return {
+        name: value
+        for name, value in env.items()
+        if name in FORWARDED_ENV_VARS or name.startswith(FORWARDED_ENV_VAR_PREFIX)
+    }
+
+
+def exit_code(result: "dbtRunnerResult") -> int:
+    """The exit code the dbt cli would have used for a result (see dbt.utils.ExitCodes)."""
+    if result.success:
+        return 0
+    return 1 if result.exception is None else 2
+
+
+class _OutputStream(io.TextIOBase):
+    """Sends everything written to it to the client, as it is written."""
+
+    def __init__(self, wfile: IO[bytes]) -> None:
+        self.wfile = wfile
+        self.disconnected = False
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, s: str) -> int:
+        # A client that went away shouldn't fail the command it started.
+        if s and not self.disconnected:
+            try:
+                _send(self.wfile, {"output": s})
+            except OSError:
+                self.disconnected = True
+        return len(s)
+
+
+def _send(wfile: IO[bytes], message: Dict[str, Any]) -> None:
+    wfile.write(json.dumps(message).encode() + b"\n")
+    wfile.flush()
+
+
+def _fire_note(msg: str, error: bool = False) -> None:
+    from dbt_common.events.base_types import EventLevel
+    from dbt_common.events.functions import fire_event
+    from dbt_common.events.types import Note
+
+    fire_event(Note(msg=msg), level=EventLevel.ERROR if error else EventLevel.INFO)
+
+
+def _peer_uid(sock: socket.socket) -> Optional[int]:
+    """The uid of the process at the other end of a unix socket, if the platform reports it."""
+    if not hasattr(socket, "SO_PEERCRED"):
+        return None
+    creds = sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i"))
+    _pid, uid, _gid = struct.unpack("3i", creds)
+    return uid
+
+
+@contextmanager
+def _client_environment(cwd: str, env: Dict[str, str]) -> Iterator[None]:
+    # Safe because the daemon handles one request at a time.
+    daemon_cwd, daemon_env = os.getcwd(), dict(os.environ)
+    os.chdir(cwd)
+    for name in forwarded_env(daemon_env):
+        del os.environ[name]
+    os.environ.update(forwarded_env(env))
+    try:
+        yield
+    finally:
+        os.chdir(daemon_cwd)
+        os.environ.clear()
+        os.environ.update(daemon_env)
+
+
+class DaemonRunner:
+    """Runs dbt commands, carrying the parsed manifest over from one invocation to the next."""
+
+    def __init__(self) -> None:
+        # the manifest as it was parsed, serialized like the partial parsing file
+        self.manifest_msgpack: Optional[bytes] = None
+        # manifest_msgpack deserialized, for the next invocation that parses the project
+        self.manifest: Optional["Manifest"] = None
+
+    def prepare(self) -> None:
+        """Deserialize the manifest for the next invocation, if that hasn't been done yet."""
+        if self.manifest is not None or self.manifest_msgpack is None:
+            return
+
+        from dbt.contracts.graph.manifest import Manifest
+        from dbt.parser.manifest import extended_mashumuro_decoder
+
+        try:
+            self.manifest = Manifest.from_msgpack(
+                self.manifest_msgpack, decoder=extended_mashumuro_decoder
+            )
+        except Exception as exc:
+            # the next invocation reads the partial parsing file instead
+            self.manifest_msgpack = None
+            _fire_note(f"Failed to load the saved manifest: {exc}", error=True)
+
+    def invoke(self, args: List[str]) -> "dbtRunnerResult":
+        from dbt.cli.main import dbtRunner
+
+        self.prepare()
+        warm_manifest = self.manifest
+        context_obj: Dict[str, Any] = {}
+
+        class _Runner(dbtRunner):
+            def _context_obj(self, args: List[str]) -> Dict[str, Any]:
+                context_obj.update(super()._context_obj(args), saved_manifest=warm_manifest)
+                return context_obj
+
+        result = _Runner().invoke(args)
+
+        # Commands that parse the project consume the saved manifest, which parsing and
+        # the command go on to update, and leave the contents of the partial parsing file if
+        # they read or wrote it (see requires.setup_manifest). If they didn't, nothing
+        # changed, or parsing failed, and the partial parsing file is still the one we have.
+        if "saved_manifest" not in context_obj:
+            self.manifest = None
+            self.manifest_msgpack = context_obj.get("manifest_msgpack", self.manifest_msgpack)
+        return result
+
+
+class DaemonServer(socketserver.UnixStreamServer):
+    def __init__(self, socket_path: str) -> None:
+        self.socket_path = socket_path
+        self.runner = DaemonRunner()
+        super().__init__(socket_path, _RequestHandler)
+
+    def server_bind(self) -> None:
+        super().server_bind()
+        os.chmod(self.socket_path, 0o600)
+
+    def verify_request(self, request: Any, client_address: Any) -> bool:
+        uid = _peer_uid(request)
+        if uid is not None and uid != os.getuid():
+            _fire_note(f"Rejected a dbt daemon connection from uid {uid}", error=True)
+            return False
+        return True
+
+    def serve_forever(self, poll_interval: float = 0.5) -> None:
+        try:
+            super().serve_forever(poll_interval)
+        finally:
+            self._remove_socket()
+
+    def shutdown(self) -> None:
+        super().shutdown()
+        # serve_forever signals that it has stopped before its own cleanup has run
+        self._remove_socket()
+
+    def _remove_socket(self) -> None:
+        self.server_close()
+        with suppress(FileNotFoundError):
+            os.unlink(self.socket_path)
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    server: DaemonServer
+
+    def handle(self) -> None:
+        request = json.loads(self.rfile.readline())
+        if request.get("command") == SHUTDOWN_COMMAND:
+            _send(self.wfile, {"exit_code": 0})
+            # shutdown() waits for serve_forever to return, so it can't be called from here
+            threading.Thread(target=self.server.shutdown).start()
+            return
+
+        from dbt_common.events.functions import (
+            capture_stdout_logs,
+            stop_capture_stdout_logs,
+        )
+
+        output = _OutputStream(self.wfile)
+        # _OutputStream only implements the writing part of TextIO
+        stdout = cast(TextIO, output)
+        capture_stdout_logs(stdout)
+        try:
+            with _client_environment(request["cwd"], request["env"]), redirect_stdout(stdout):
+                result = self.server.runner.invoke(request["args"])
+        finally:
+            stop_capture_stdout_logs()
+
+        if not output.disconnected:
+            _send(self.wfile, {"exit_code": exit_code(result)})
+        # while waiting for the next command
+        self.server.runner.prepare()
+
+
+def start(socket_path: str) -> int:
+    if os.path.exists(socket_path):
+        if _connect(socket_path) is not None:
+            _fire_note(f"A dbt daemon is already listening on {socket_path}", error=True)
+            return 1
+        os.unlink(socket_path)
+
+    server = DaemonServer(socket_path)
+    _fire_note(f"dbt daemon listening on {socket_path}")
+    server.serve_forever()
+    return 0
+
+
+def _connect(socket_path: str) -> Optional[socket.socket]:
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(socket_path)
+    except OSError:
+        sock.close()
+        return None
+    return sock
+
+
+def send_request(sock: socket.socket, request: Dict[str, Any]) -> int:
+    """Send a request to the daemon, print its output as it arrives and return the exit code."""
+    # The daemon closes connections it rejects without reading the request, which can reset
+    # the connection rather than end it. The request is written straight to the socket, so
+    # that closing the stream doesn't try to flush it again.
+    with sock, sock.makefile("rb") as stream, suppress(ConnectionError):
+        sock.sendall(json.dumps(request).encode() + b"\n")
+        for line in stream:
+            message = json.loads(line)
+            if "output" in message:
+                sys.stdout.write(message["output"])
+                sys.stdout.flush()
+            else:
+                return message["exit_code"]
+    # the daemon went away, or rejected the connection, before the command completed
+    return 2
+
+
+def main(argv: List[str]) -> int:
+    socket_path = default_socket_path(os.getcwd())
+    if argv[:1] == ["start"]:
+        return start(socket_path)
+
+    sock = _connect(socket_path)
+    if argv[:1] == ["stop"]:
+        if sock is None:
+            _fire_note(f"No dbt daemon is listening on {socket_path}", error=True)
+            return 1
+        return send_request(sock, {"command": SHUTDOWN_COMMAND})
+
+    if sock is None:
+        from dbt.cli.main import dbtRunner
+
+        return exit_code(dbtRunner().invoke(argv))
+
+    request = {"args": argv, "cwd": os.getcwd(), "env": forwarded_env(os.environ)}
+    return send_request(sock, request)
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -268,9 +268,8 @@ class SetStrictWrongTypeError(CompilationError):
 class LoadAgateTableValueError(CompilationError):
     def __init__(self, exc: ValueError, node) -> None:
         self.exc = exc
-        self.node = node
         msg = str(self.exc)
-        super().__init__(msg=msg)
+        super().__init__(msg=msg, node=node)
 
 
 class LoadAgateTableNotSeedError(CompilationError):
@@ -1,4 +1,5 @@
 import threading
+import time
 from queue import PriorityQueue
 from typing import Dict, Generator, List, Optional, Set
 
@@ -13,6 +14,7 @@ from dbt.contracts.graph.nodes import (
     SourceDefinition,
 )
 from dbt.node_types import NodeType
+from dbt.profiler import record_span
 
 from .graph import UniqueId
 
@@ -46,6 +48,8 @@ class GraphQueue:
         self.in_progress_microbatch: Set[UniqueId] = set()
         # things that are in the queue
         self.queued: Set[UniqueId] = set()
+        # when each queued thing was put in the queue
+        self._queued_at: Dict[UniqueId, float] = {}
         # this lock controls most things
         self.lock = threading.Lock()
         # store the 'score' of each node as a number. Lower is higher priority.
@@ -141,7 +145,9 @@ class GraphQueue:
 
         with self.lock:
             self._mark_in_progress(node_id, is_microbatch=is_microbatch)
+            queued_at = self._queued_at.pop(node_id)
 
+        record_span("queue_wait", queued_at, category="queue", unique_id=node_id)
         return node
 
     def __len__(self) -> int:
@@ -181,6 +187,7 @@ class GraphQueue:
             if self.graph.in_degree(node) == 0 and not self._already_known(node):
                 self.inner.put((self._scores[node], node))
                 self.queued.add(node)
+                self._queued_at[node] = time.perf_counter()
 
     def mark_done(self, node_id: UniqueId) -> None:
         """Given a node's unique ID, mark it as done.
@@ -1,4 +1,5 @@
-from typing import List, Optional, Set, Tuple
+from itertools import chain
+from typing import Any, Dict, FrozenSet, Hashable, Iterable, List, Optional, Set, Tuple
 
 from dbt import selected_resources
 from dbt.contracts.graph.manifest import Manifest
@@ -7,6 +8,7 @@ from dbt.contracts.state import PreviousState
 from dbt.events.types import NoNodesForSelectionCriteria, SelectorReportInvalidSelector
 from dbt.exceptions import DbtInternalError, InvalidSelectorError
 from dbt.node_types import NodeType
+from dbt.profiler import span
 from dbt_common.events.functions import fire_event, warn_or_error
 
 from .graph import Graph, UniqueId
@@ -19,6 +21,26 @@ def get_package_names(nodes):
     return set([node.split(".")[1] for node in nodes])
 
 
+def _criteria_key(spec: SelectionCriteria) -> Optional[Hashable]:
+    """What the selection made by a criteria depends on, or None if it can't be hashed."""
+    key = (
+        spec.method,
+        tuple(spec.method_arguments),
+        spec.value,
+        spec.childrens_parents,
+        spec.parents,
+        spec.parents_depth,
+        spec.children,
+        spec.children_depth,
+        spec.indirect_selection,
+    )
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
 def can_select_indirectly(node):
     """If a node is not selected itself, but its parent(s) are, it may qualify
     for indirect selection.
@@ -34,25 +56,65 @@ def can_select_indirectly(node):
 
 
 class NodeSelector(MethodManager):
-    """The node selector is aware of the graph and manifest"""
+    """The node selector is aware of the graph and manifest.
+
+    The graph may be left out when the selection specs don't use it (see
+    SelectionCriteria.uses_graph), in which case nodes are selected from the manifest alone.
+    """
 
     def __init__(
         self,
-        graph: Graph,
+        graph: Optional[Graph],
         manifest: Manifest,
         previous_state: Optional[PreviousState] = None,
         include_empty_nodes: bool = False,
     ) -> None:
         super().__init__(manifest, previous_state)
-        self.full_graph: Graph = graph
+        self._full_graph: Optional[Graph] = graph
         self.include_empty_nodes: bool = include_empty_nodes
 
         # build a subgraph containing only non-empty, enabled nodes and enabled
         # sources.
-        graph_members = {
-            unique_id for unique_id in self.full_graph.nodes() if self._is_graph_member(unique_id)
+        all_nodes: Iterable[UniqueId] = self._manifest_unique_ids() if graph is None else graph
+        self.graph_members: Set[UniqueId] = {
+            unique_id for unique_id in all_nodes if self._is_graph_member(unique_id)
         }
-        self.graph = self.full_graph.subgraph(graph_members)
+        self._graph: Optional[Graph] = None
+        self._tests_by_parent: Optional[Dict[UniqueId, Set[UniqueId]]] = None
+        # Selectors (in particular the yaml selectors that include each other) often repeat
+        # criteria, which select the same nodes every time.
+        self._criteria_selections: Dict[Hashable, Tuple[Set[UniqueId], Set[UniqueId]]] = {}
+        self._graph_expansions: Dict[Tuple[str, FrozenSet[UniqueId], Any], Set[UniqueId]] = {}
+        if graph is not None:
+            self._graph = graph.subgraph(self.graph_members)
+
+    @property
+    def full_graph(self) -> Graph:
+        if self._full_graph is None:
+            raise DbtInternalError("NodeSelector was created without a graph")
+        return self._full_graph
+
+    @property
+    def graph(self) -> Graph:
+        if self._graph is None:
+            raise DbtInternalError("NodeSelector was created without a graph")
+        return self._graph
+
+    def _manifest_unique_ids(self) -> Iterable[UniqueId]:
+        # the nodes that Linker.link_graph adds to the graph
+        return map(
+            UniqueId,
+            chain(
+                self.manifest.sources,
+                self.manifest.nodes,
+                self.manifest.semantic_models,
+                self.manifest.exposures,
+                self.manifest.functions,
+                self.manifest.metrics,
+                self.manifest.unit_tests,
+                self.manifest.saved_queries,
+            ),
+        )
 
     def select_included(
         self,
@@ -73,11 +135,23 @@ class NodeSelector(MethodManager):
         - collect the directly included nodes
         - find their specified relatives
         - perform any selector-specific expansion
-        """
 
-        nodes = self.graph.nodes()
+        The result is remembered for the lifetime of the selector, for criteria that come up
+        again.
+        """
+        key = _criteria_key(spec)
+        if key is None:
+            return self._get_nodes_from_criteria(spec)
+        if key not in self._criteria_selections:
+            self._criteria_selections[key] = self._get_nodes_from_criteria(spec)
+        direct_nodes, indirect_nodes = self._criteria_selections[key]
+        return set(direct_nodes), set(indirect_nodes)
+
+    def _get_nodes_from_criteria(
+        self, spec: SelectionCriteria
+    ) -> Tuple[Set[UniqueId], Set[UniqueId]]:
         try:
-            collected = self.select_included(nodes, spec)
+            collected = self.select_included(self.graph_members, spec)
         except InvalidSelectorError:
             valid_selectors = ", ".join(self.SELECTOR_METHODS)
             fire_event(
@@ -109,17 +183,33 @@ class NodeSelector(MethodManager):
         """
         additional: Set[UniqueId] = set()
         if spec.childrens_parents:
-            additional.update(self.graph.select_childrens_parents(selected))
+            additional.update(self._expand("childrens_parents", selected))
 
         if spec.parents:
             depth = spec.parents_depth
-            additional.update(self.graph.select_parents(selected, depth))
+            additional.update(self._expand("parents", selected, depth))
 
         if spec.children:
             depth = spec.children_depth
-            additional.update(self.graph.select_children(selected, depth))
+            additional.update(self._expand("children", selected, depth))
         return additional
 
+    def _expand(
+        self, direction: str, selected: Set[UniqueId], depth: Optional[int] = None
+    ) -> Set[UniqueId]:
+        # different criteria can select the same nodes to expand from, e.g. "+model" and
+        # "+path/to/model.sql"
+        key = (direction, frozenset(selected), depth)
+        if key not in self._graph_expansions:
+            if direction == "childrens_parents":
+                expanded = self.graph.select_childrens_parents(selected)
+            elif direction == "parents":
+                expanded = self.graph.select_parents(selected, depth)
+            else:
+                expanded = self.graph.select_children(selected, depth)
+            self._graph_expansions[key] = expanded
+        return self._graph_expansions[key]
+
     def select_nodes_recursively(
         self, spec: SelectionSpec, warn_on_no_nodes: bool = True
     ) -> Tuple[Set[UniqueId], Set[UniqueId]]:
@@ -277,7 +367,7 @@ class NodeSelector(MethodManager):
                 self.manifest.sources
             )
 
-        for unique_id in self.graph.select_successors(selected):
+        for unique_id in self._select_successors(selected):
             if unique_id in self.manifest.nodes or unique_id in self.manifest.unit_tests:
                 if unique_id in self.manifest.nodes:
                     node = self.manifest.nodes[unique_id]
@@ -302,6 +392,22 @@ class NodeSelector(MethodManager):
 
         return direct_nodes, indirect_nodes
 
+    def _select_successors(self, selected: Set[UniqueId]) -> Set[UniqueId]:
+        if self._graph is not None:
+            return self._graph.select_successors(selected)
+        # Without the graph, only the tests that depend on the selected nodes are found, which
+        # are the only successors that expand_selection looks at.
+        if self._tests_by_parent is None:
+            self._tests_by_parent = {}
+            for unique_id in chain(self.manifest.nodes, self.manifest.unit_tests):
+                if unique_id not in self.graph_members:
+                    continue
+                node = self.manifest.nodes.get(unique_id) or self.manifest.unit_tests[unique_id]
+                if can_select_indirectly(node):
+                    for parent in node.depends_on_nodes:
+                        self._tests_by_parent.setdefault(parent, set()).add(UniqueId(unique_id))
+        return set().union(*(self._tests_by_parent.get(unique_id, ()) for unique_id in selected))
+
     def incorporate_indirect_nodes(
         self,
         direct_nodes: Set[UniqueId],
@@ -343,10 +449,11 @@ class NodeSelector(MethodManager):
             - selectors can filter the nodes after all of them have been
               selected
         """
-        selected_nodes, indirect_only = self.select_nodes(
-            spec=spec, warn_on_no_nodes=warn_on_no_nodes
-        )
-        filtered_nodes = self.filter_selection(selected_nodes)
+        with span("select_nodes", category="graph"):
+            selected_nodes, indirect_only = self.select_nodes(
+                spec=spec, warn_on_no_nodes=warn_on_no_nodes
+            )
+            filtered_nodes = self.filter_selection(selected_nodes)
 
         return filtered_nodes
 
@@ -359,15 +466,16 @@ class NodeSelector(MethodManager):
         # Save to global variable
         selected_resources.set_selected_resources(selected_nodes)
         # Construct a new graph using the selected_nodes
-        new_graph = self.full_graph.get_subset_graph(selected_nodes)
-        # should we give a way here for consumers to mutate the graph?
-        return GraphQueue(new_graph.graph, self.manifest, selected_nodes, preserve_edges)
+        with span("build_graph_queue", category="graph"):
+            new_graph = self.full_graph.get_subset_graph(selected_nodes)
+            # should we give a way here for consumers to mutate the graph?
+            return GraphQueue(new_graph.graph, self.manifest, selected_nodes, preserve_edges)
 
 
 class ResourceTypeSelector(NodeSelector):
     def __init__(
         self,
-        graph: Graph,
+        graph: Optional[Graph],
         manifest: Manifest,
         previous_state: Optional[PreviousState],
         resource_types: List[NodeType],
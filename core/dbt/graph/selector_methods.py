@@ -8,6 +8,7 @@ from typing import (
     Dict,
     Iterator,
     List,
+    Mapping,
     Optional,
     Set,
     Tuple,
@@ -79,15 +80,14 @@ def is_selected_node(fqn: List[str], node_selector: str, is_versioned: bool) ->
     else:
         if fqn[-1] == node_selector:
             return True
-    # Flatten node parts. Dots in model names act as namespace separators
-    flat_fqn = [item for segment in fqn for item in segment.split(".")]
+    flat_fqn = _flat_fqn(fqn)
     # Selector components cannot be more than fqn's
     if len(flat_fqn) < len(node_selector.split(".")):
         return False
 
     slurp_from_ix: Optional[int] = None
     for i, selector_part in enumerate(node_selector.split(".")):
-        if any(wildcard in selector_part for wildcard in ("*", "?", "[", "]")):
+        if _has_wildcard(selector_part):
             slurp_from_ix = i
             break
         elif flat_fqn[i] == selector_part:
@@ -114,13 +114,169 @@ SelectorTarget = Union[
 ]
 
 
+def _has_wildcard(selector_part: str) -> bool:
+    return any(wildcard in selector_part for wildcard in ("*", "?", "[", "]"))
+
+
+def _flat_fqn(fqn: List[str]) -> List[str]:
+    # Dots in model names act as namespace separators
+    return [item for segment in fqn for item in segment.split(".")]
+
+
+class _FqnTrie:
+    """The unique ids of the nodes under each (flattened) fqn prefix."""
+
+    def __init__(self) -> None:
+        self.unique_ids: Set[UniqueId] = set()
+        self.children: Dict[str, "_FqnTrie"] = {}
+
+    def add(self, flat_fqn: List[str], unique_id: UniqueId) -> None:
+        trie = self
+        trie.unique_ids.add(unique_id)
+        for part in flat_fqn:
+            trie = trie.children.setdefault(part, _FqnTrie())
+            trie.unique_ids.add(unique_id)
+
+    def find(self, prefix: List[str]) -> Set[UniqueId]:
+        trie = self
+        for part in prefix:
+            if part not in trie.children:
+                return set()
+            trie = trie.children[part]
+        return trie.unique_ids
+
+
+# Nodes grouped by the value of a config, as (value, unique ids) pairs.
+ConfigValueGroups = List[Tuple[Any, List[UniqueId]]]
+
+
+class SelectorIndex:
+    """Inverted indexes over the manifest for the selector methods that match on a node
+    attribute (tag, group, package, config and fqn), each built the first time it is
+    used. The manifest must not change while an index is in use.
+    """
+
+    def __init__(self, manifest: Manifest) -> None:
+        self.manifest = manifest
+        self._tags: Optional[Dict[str, Set[UniqueId]]] = None
+        self._groups: Optional[Dict[str, Set[UniqueId]]] = None
+        self._packages: Optional[Dict[str, Set[UniqueId]]] = None
+        self._config_values: Dict[Tuple[str, ...], ConfigValueGroups] = {}
+        self._fqn_nodes: Dict[UniqueId, Any] = {}
+        self._fqn_leaves: Dict[str, Set[UniqueId]] = {}
+        self._fqn_trie: Optional[_FqnTrie] = None
+
+    def _items(self, *collections: Mapping[str, Any]) -> Iterator[Tuple[UniqueId, Any]]:
+        for collection in collections:
+            for key, node in collection.items():
+                yield UniqueId(key), node
+
+    def _all_nodes(self) -> Iterator[Tuple[UniqueId, Any]]:
+        # the same nodes as SelectorMethod.all_nodes
+        return self._items(self.manifest.sources, *self._non_source_collections())
+
+    def _non_source_collections(self) -> List[Mapping[str, Any]]:
+        return [
+            self.manifest.nodes,
+            self.manifest.exposures,
+            self.manifest.metrics,
+            self.manifest.unit_tests,
+            self.manifest.semantic_models,
+            self.manifest.saved_queries,
+            self.manifest.functions,
+        ]
+
+    @staticmethod
+    def _matching(index: Dict[str, Set[UniqueId]], pattern: str) -> Set[UniqueId]:
+        # there are far fewer distinct keys than nodes, so match the pattern against those
+        return set().union(*(ids for key, ids in index.items() if fnmatch(key, pattern)))
+
+    def tagged(self, pattern: str) -> Set[UniqueId]:
+        if self._tags is None:
+            self._tags = {}
+            for unique_id, node in self._all_nodes():
+                for tag in getattr(node, "tags", ()):
+                    self._tags.setdefault(tag, set()).add(unique_id)
+        return self._matching(self._tags, pattern)
+
+    def in_group(self, pattern: str) -> Set[UniqueId]:
+        if self._groups is None:
+            self._groups = {}
+            for unique_id, node in self._items(self.manifest.nodes, self.manifest.metrics):
+                group = node.config.get("group")
+                if group:
+                    self._groups.setdefault(group, set()).add(unique_id)
+        return self._matching(self._groups, pattern)
+
+    def in_package(self, pattern: str) -> Set[UniqueId]:
+        if self._packages is None:
+            self._packages = {}
+            for unique_id, node in self._all_nodes():
+                self._packages.setdefault(node.package_name, set()).add(unique_id)
+        return self._matching(self._packages, pattern)
+
+    def config_values(self, attrs: List[str]) -> ConfigValueGroups:
+        """The nodes and sources that have the config at `attrs`, grouped by its value."""
+        key = tuple(attrs)
+        if key not in self._config_values:
+            groups: Dict[Any, Tuple[Any, List[UniqueId]]] = {}
+            unhashable: ConfigValueGroups = []
+            for unique_id, node in self._items(self.manifest.nodes, self.manifest.sources):
+                try:
+                    value = _getattr_descend(node.config, attrs)
+                except AttributeError:
+                    continue
+                try:
+                    # the type keeps values like 1 and True apart
+                    groups.setdefault((type(value), value), (value, []))[1].append(unique_id)
+                except TypeError:
+                    unhashable.append((value, [unique_id]))
+            self._config_values[key] = list(groups.values()) + unhashable
+        return self._config_values[key]
+
+    def fqn_candidates(self, selector: str) -> Iterator[Tuple[UniqueId, Any]]:
+        """Yields (unique id, node) for a superset of the non-source nodes that the fqn
+        selector can match: those with the selector's name as their leaf, or the selector's
+        parts up to the first wildcard as a prefix of their (package-scoped or unscoped) fqn.
+        """
+        if self._fqn_trie is None:
+            self._fqn_trie = _FqnTrie()
+            for unique_id, node in self._items(*self._non_source_collections()):
+                self._fqn_nodes[unique_id] = node
+                fqn = node.fqn
+                leaves = [fqn[-2], "_".join(fqn[-2:])] if node.is_versioned else [fqn[-1]]
+                for leaf in leaves:
+                    self._fqn_leaves.setdefault(leaf, set()).add(unique_id)
+                self._fqn_trie.add(_flat_fqn(fqn), unique_id)
+                self._fqn_trie.add(_flat_fqn(fqn[1:]), unique_id)
+
+        parts = selector.split(".")
+        prefix: List[str] = []
+        for part in parts:
+            if _has_wildcard(part):
+                break
+            prefix.append(part)
+        candidates = (
+            self._fqn_trie.find(prefix)
+            | self._fqn_leaves.get(selector, set())
+            | self._fqn_leaves.get("_".join(parts[-2:]), set())
+        )
+        for unique_id in candidates:
+            yield unique_id, self._fqn_nodes[unique_id]
+
+
 class SelectorMethod(metaclass=abc.ABCMeta):
     def __init__(
-        self, manifest: Manifest, previous_state: Optional[PreviousState], arguments: List[str]
+        self,
+        manifest: Manifest,
+        previous_state: Optional[PreviousState],
+        arguments: List[str],
+        index: Optional[SelectorIndex] = None,
     ) -> None:
         self.manifest: Manifest = manifest
         self.previous_state = previous_state
         self.arguments: List[str] = arguments
+        self.index: SelectorIndex = SelectorIndex(manifest) if index is None else index
 
     def parsed_nodes(
         self, included_nodes: Set[UniqueId]
@@ -276,8 +432,9 @@ class QualifiedNameSelectorMethod(SelectorMethod):
 
         :param str selector: The selector or node name
         """
-        non_source_nodes = list(self.non_source_nodes(included_nodes))
-        for unique_id, node in non_source_nodes:
+        for unique_id, node in self.index.fqn_candidates(selector):
+            if unique_id not in included_nodes:
+                continue
             if self.node_is_match(selector, node.fqn, node.is_versioned):
                 yield unique_id
 
@@ -285,17 +442,16 @@ class QualifiedNameSelectorMethod(SelectorMethod):
 class TagSelectorMethod(SelectorMethod):
     def search(self, included_nodes: Set[UniqueId], selector: str) -> Iterator[UniqueId]:
         """yields nodes from included that have the specified tag"""
-        for unique_id, node in self.all_nodes(included_nodes):
-            if hasattr(node, "tags") and any(fnmatch(tag, selector) for tag in node.tags):
+        for unique_id in self.index.tagged(selector):
+            if unique_id in included_nodes:
                 yield unique_id
 
 
 class GroupSelectorMethod(SelectorMethod):
     def search(self, included_nodes: Set[UniqueId], selector: str) -> Iterator[UniqueId]:
         """yields nodes from included in the specified group"""
-        for unique_id, node in self.groupable_nodes(included_nodes):
-            node_group = node.config.get("group")
-            if node_group and fnmatch(node_group, selector):
+        for unique_id in self.index.in_group(selector):
+            if unique_id in included_nodes:
                 yield unique_id
 
 
@@ -504,8 +660,8 @@ class PackageSelectorMethod(SelectorMethod):
         if selector == "this" and self.manifest.metadata.project_name is not None:
             selector = self.manifest.metadata.project_name
 
-        for unique_id, node in self.all_nodes(included_nodes):
-            if fnmatch(node.package_name, selector):
+        for unique_id in self.index.in_package(selector):
+            if unique_id in included_nodes:
                 yield unique_id
 
 
@@ -548,27 +704,26 @@ class ConfigSelectorMethod(SelectorMethod):
         # search sources is kind of useless now source configs only have
         # 'enabled', which you can't really filter on anyway, but maybe we'll
         # add more someday, so search them anyway.
-        for unique_id, node in self.configurable_nodes(included_nodes):
-            try:
-                value = _getattr_descend(node.config, parts)
-            except AttributeError:
-                continue
+        # The nodes are grouped by config value, so each distinct value is only compared once
+        for value, unique_ids in self.index.config_values(parts):
+            if isinstance(value, list):
+                if not (
+                    (selector in value)
+                    or (CaseInsensitive(selector) == "true" and True in value)
+                    or (CaseInsensitive(selector) == "false" and False in value)
+                ):
+                    continue
             else:
-                if isinstance(value, list):
-                    if (
-                        (selector in value)
-                        or (CaseInsensitive(selector) == "true" and True in value)
-                        or (CaseInsensitive(selector) == "false" and False in value)
-                    ):
-                        yield unique_id
-                else:
-                    if (
-                        (selector == value)
-                        or (CaseInsensitive(selector) == "true" and value is True)
-                        or (CaseInsensitive(selector) == "false")
-                        and value is False
-                    ):
-                        yield unique_id
+                if not (
+                    (selector == value)
+                    or (CaseInsensitive(selector) == "true" and value is True)
+                    or (CaseInsensitive(selector) == "false")
+                    and value is False
+                ):
+                    continue
+            for unique_id in unique_ids:
+                if unique_id in included_nodes:
+                    yield unique_id
 
 
 class ResourceTypeSelectorMethod(SelectorMethod):
@@ -973,6 +1128,8 @@ class MethodManager:
     ) -> None:
         self.manifest = manifest
         self.previous_state = previous_state
+        # shared by the methods, so that each index is built once per selection
+        self.index = SelectorIndex(manifest)
 
     def get_method(self, method: MethodName, method_arguments: List[str]) -> SelectorMethod:
 
@@ -982,4 +1139,4 @@ class MethodManager:
                 f"method name, but it is not handled"
             )
         cls: Type[SelectorMethod] = self.SELECTOR_METHODS[method]
-        return cls(self.manifest, self.previous_state, method_arguments)
+        return cls(self.manifest, self.previous_state, method_arguments, index=self.index)
@@ -80,6 +80,16 @@ class SelectionCriteria:
                 f'Invalid node spec {self.raw} - "@" prefix and "+" suffix ' "are incompatible"
             )
 
+    @property
+    def uses_graph(self) -> bool:
+        """Whether selecting this needs the DAG, rather than just the manifest."""
+        return (
+            self.childrens_parents
+            or self.parents
+            or self.children
+            or self.indirect_selection == IndirectSelection.Buildable
+        )
+
     @classmethod
     def default_method(cls, value: str) -> MethodName:
         if _probably_path(value):
@@ -184,6 +194,12 @@ class BaseSelectionGroup(dbtClassMixin, Iterable[SelectionSpec], metaclass=ABCMe
         for component in self.components:
             yield component
 
+    @property
+    def uses_graph(self) -> bool:
+        return self.indirect_selection == IndirectSelection.Buildable or any(
+            component.uses_graph for component in self.components
+        )
+
     @abstractmethod
     def combine_selections(
         self,
@@ -2,7 +2,7 @@ import json
 import re
 from datetime import date, datetime
 from pathlib import Path
-from typing import Any, Dict, Iterator, List, Optional, Union
+from typing import Any, Dict, FrozenSet, Iterator, List, Optional, Tuple, Union
 
 import jsonschema
 from jsonschema import ValidationError
@@ -15,6 +15,18 @@ from dbt_common.context import get_invocation_context
 
 _PROJECT_SCHEMA: Optional[Dict[str, Any]] = None
 _RESOURCES_SCHEMA: Optional[Dict[str, Any]] = None
+_MODEL_CONFIG_SCHEMA: Optional[Dict[str, Any]] = None
+
+# Validators keyed by the id of their schema. The schema is kept alongside so that its id
+# can't be reused while the validator is cached.
+_VALIDATORS: Dict[int, Tuple[Dict[str, Any], Any]] = {}
+
+# A deprecation to warn about: its name and the keyword arguments of its event
+SchemaDeprecation = Tuple[str, Dict[str, Any]]
+
+# Deprecations found when validating a file, keyed by
+# (schema id, file path, file checksum, adapter types)
+_VALIDATION_RESULTS: Dict[Tuple[int, str, str, FrozenSet[str]], List[SchemaDeprecation]] = {}
 
 _JSONSCHEMA_SUPPORTED_ADAPTERS = {
     "bigquery",
@@ -71,6 +83,27 @@ def resources_schema() -> Dict[str, Any]:
     return _RESOURCES_SCHEMA
 
 
+def model_config_schema() -> Dict[str, Any]:
+    global _MODEL_CONFIG_SCHEMA
+
+    if _MODEL_CONFIG_SCHEMA is None:
+        resources_jsonschema = resources_schema()
+        nested_definition_name = "ModelConfig"
+
+        _MODEL_CONFIG_SCHEMA = {
+            "$schema": "http://json-schema.org/draft-07/schema#",
+            "title": nested_definition_name,
+            **resources_jsonschema["definitions"][nested_definition_name],
+            "definitions": {
+                k: v
+                for k, v in resources_jsonschema["definitions"].items()
+                if k != nested_definition_name
+            },
+        }
+
+    return _MODEL_CONFIG_SCHEMA
+
+
 def custom_type_rule(validator, types, instance, schema):
     """This is necessary because PyYAML loads things that look like dates or datetimes as those
     python objects. Then jsonschema.validate() fails because it expects strings.
@@ -103,11 +136,21 @@ def _additional_properties_violation_keys(error: ValidationError) -> List[str]:
     return [key.strip("'") for key in found_keys]
 
 
+def _get_validator(schema: Dict[str, Any]):
+    """Validators resolve and cache the `$ref`s of their schema as they go, so reuse one
+    validator per schema for the whole process rather than building one per validation.
+    """
+    cached = _VALIDATORS.get(id(schema))
+    if cached is None or cached[0] is not schema:
+        cached = (schema, CustomDraft7Validator(schema))
+        _VALIDATORS[id(schema)] = cached
+    return cached[1]
+
+
 def _validate_with_schema(
     schema: Dict[str, Any], json: Dict[str, Any]
 ) -> Iterator[ValidationError]:
-    validator = CustomDraft7Validator(schema)
-    return validator.iter_errors(json)
+    return _get_validator(schema).iter_errors(json)
 
 
 def _get_allowed_config_key_aliases() -> List[str]:
@@ -154,15 +197,45 @@ def _get_allowed_config_fields_from_error_path(
     return allowed_config_fields
 
 
+def _schema_deprecation(name: str, **kwargs: Any) -> SchemaDeprecation:
+    return name, kwargs
+
+
 def _can_run_validations() -> bool:
     invocation_context = get_invocation_context()
     return invocation_context.adapter_types.issubset(_JSONSCHEMA_SUPPORTED_ADAPTERS)
 
 
-def jsonschema_validate(schema: Dict[str, Any], json: Dict[str, Any], file_path: str) -> None:
+def jsonschema_validate(
+    schema: Dict[str, Any],
+    json: Dict[str, Any],
+    file_path: str,
+    checksum: Optional[str] = None,
+) -> None:
+    """Warn about deprecated or unexpected keys in `json`.
+
+    If the `checksum` of the file is given, the deprecations found are cached for the
+    process, and a file with the same path and checksum is not validated again.
+    """
     if not _can_run_validations():
         return
 
+    if checksum is None:
+        deprecations_found = list(_iter_schema_deprecations(schema, json, file_path))
+    else:
+        adapter_types = frozenset(get_invocation_context().adapter_types)
+        key = (id(schema), file_path, checksum, adapter_types)
+        if key not in _VALIDATION_RESULTS:
+            _VALIDATION_RESULTS[key] = list(_iter_schema_deprecations(schema, json, file_path))
+        deprecations_found = _VALIDATION_RESULTS[key]
+
+    for name, kwargs in deprecations_found:
+        deprecations.warn(name, **kwargs)
+
+
+def _iter_schema_deprecations(
+    schema: Dict[str, Any], json: Dict[str, Any], file_path: str
+) -> Iterator[SchemaDeprecation]:
     errors = _validate_with_schema(schema, json)
     for error in errors:
         # Listify the error path to make it easier to work with (it's a deque in the ValidationError object)
@@ -171,7 +244,7 @@ def jsonschema_validate(schema: Dict[str, Any], json: Dict[str, Any], file_path:
             keys = _additional_properties_violation_keys(error)
             if len(error.path) == 0:
                 for key in keys:
-                    deprecations.warn(
+                    yield _schema_deprecation(
                         "custom-top-level-key-deprecation",
                         msg="Unexpected top-level key" + (" " + key if key else ""),
                         file=file_path,
@@ -184,7 +257,7 @@ def jsonschema_validate(schema: Dict[str, Any], json: Dict[str, Any], file_path:
                         continue
 
                     if key == "overrides" and key_path.startswith("sources"):
-                        deprecations.warn(
+                        yield _schema_deprecation(
                             "source-override-deprecation",
                             source_name=key_path.split(".")[-1],
                             file=file_path,
@@ -194,14 +267,14 @@ def jsonschema_validate(schema: Dict[str, Any], json: Dict[str, Any], file_path:
                             schema, error_path
                         )
                         if allowed_config_fields and key in allowed_config_fields:
-                            deprecations.warn(
+                            yield _schema_deprecation(
                                 "property-moved-to-config-deprecation",
                                 key=key,
                                 file=file_path,
                                 key_path=key_path,
                             )
                         else:
-                            deprecations.warn(
+                            yield _schema_deprecation(
                                 "custom-key-in-object-deprecation",
                                 key=key,
                                 file=file_path,
@@ -222,7 +295,7 @@ def jsonschema_validate(schema: Dict[str, Any], json: Dict[str, Any], file_path:
                             if key in _get_allowed_config_key_aliases():
                                 continue
 
-                            deprecations.warn(
+                            yield _schema_deprecation(
                                 "custom-key-in-config-deprecation",
                                 key=key,
                                 file=file_path,
@@ -238,7 +311,7 @@ def jsonschema_validate(schema: Dict[str, Any], json: Dict[str, Any], file_path:
                             and isinstance(sub_error.path[-1], str)
                             and not sub_error.path[-1].startswith("+")
                         ):
-                            deprecations.warn(
+                            yield _schema_deprecation(
                                 "missing-plus-prefix-in-config-deprecation",
                                 key=sub_error.path[-1],
                                 file=file_path,
@@ -248,7 +321,7 @@ def jsonschema_validate(schema: Dict[str, Any], json: Dict[str, Any], file_path:
             # Not deprecating invalid types yet
             pass
         else:
-            deprecations.warn(
+            yield _schema_deprecation(
                 "generic-json-schema-validation-deprecation",
                 violation=error.message,
                 file=file_path,
@@ -260,21 +333,7 @@ def validate_model_config(config: Dict[str, Any], file_path: str) -> None:
     if not _can_run_validations():
         return
 
-    resources_jsonschema = resources_schema()
-    nested_definition_name = "ModelConfig"
-
-    model_config_schema = {
-        "$schema": "http://json-schema.org/draft-07/schema#",
-        "title": nested_definition_name,
-        **resources_jsonschema["definitions"][nested_definition_name],
-        "definitions": {
-            k: v
-            for k, v in resources_jsonschema["definitions"].items()
-            if k != nested_definition_name
-        },
-    }
-
-    errors = _validate_with_schema(model_config_schema, config)
+    errors = _validate_with_schema(model_config_schema(), config)
     for error in errors:
         error_path = list(error.path)
         if error.validator == "additionalProperties":
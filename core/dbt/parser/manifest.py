@@ -33,7 +33,7 @@ from dbt.artifacts.resources import (
 )
 from dbt.artifacts.resources.types import BatchSize
 from dbt.artifacts.schemas.base import Writable
-from dbt.clients.jinja import MacroStack, get_rendered
+from dbt.clients.jinja import MacroStack, get_rendered, has_render_chars
 from dbt.clients.jinja_static import statically_extract_macro_calls
 from dbt.config import Project, RuntimeConfig
 from dbt.constants import (
@@ -42,7 +42,7 @@ from dbt.constants import (
     SEMANTIC_MANIFEST_FILE_NAME,
 )
 from dbt.context.configured import generate_macro_context
-from dbt.context.docs import generate_runtime_docs_context
+from dbt.context.docs import DocsRuntimeContext
 from dbt.context.macro_resolver import MacroResolver, TestMacroNamespace
 from dbt.context.providers import ParseProvider, generate_runtime_macro_context
 from dbt.context.query_header import generate_query_header_context
@@ -123,6 +123,7 @@ from dbt.parser.singular_test import SingularTestParser
 from dbt.parser.snapshots import SnapshotParser
 from dbt.parser.sources import SourcePatcher
 from dbt.parser.unit_tests import process_models_for_unit_test
+from dbt.profiler import record_span, span
 from dbt.utils.artifact_upload import add_artifact_produced
 from dbt.version import __version__
 from dbt_common.clients.jinja import parse
@@ -242,6 +243,8 @@ class ManifestLoader:
         all_projects: Mapping[str, RuntimeConfig],
         macro_hook: Optional[Callable[[Manifest], Any]] = None,
         file_diff: Optional[FileDiff] = None,
+        saved_manifest: Optional[Manifest] = None,
+        manifest_msgpack_hook: Optional[Callable[[bytes], Any]] = None,
     ) -> None:
         self.root_project: RuntimeConfig = root_project
         self.all_projects: Mapping[str, RuntimeConfig] = all_projects
@@ -259,6 +262,9 @@ class ManifestLoader:
             self.macro_hook = lambda m: None
         else:
             self.macro_hook = macro_hook
+        # Called with the serialized manifest whenever the partial parsing file is read or
+        # written, so that a long-running process (see dbt.daemon) can keep it in memory.
+        self.manifest_msgpack_hook = manifest_msgpack_hook
 
         self._perf_info = self.build_perf_info()
 
@@ -272,7 +278,9 @@ class ManifestLoader:
         self.skip_parsing = False
 
         # This is a saved manifest from a previous run that's used for partial parsing
-        self.saved_manifest: Optional[Manifest] = self.read_manifest_for_partial_parse()
+        self.saved_manifest: Optional[Manifest] = self.read_manifest_for_partial_parse(
+            saved_manifest
+        )
 
     # This is the method that builds a complete manifest. We sometimes
     # use an abbreviated process in tests.
@@ -284,6 +292,8 @@ class ManifestLoader:
         file_diff: Optional[FileDiff] = None,
         reset: bool = False,
         write_perf_info=False,
+        saved_manifest: Optional[Manifest] = None,
+        manifest_msgpack_hook: Optional[Callable[[bytes], Any]] = None,
     ) -> Manifest:
         adapter = get_adapter(config)  # type: ignore
         # reset is set in a TaskManager load_manifest call, since
@@ -318,6 +328,8 @@ class ManifestLoader:
             projects,
             macro_hook=macro_hook,
             file_diff=file_diff,
+            saved_manifest=saved_manifest,
+            manifest_msgpack_hook=manifest_msgpack_hook,
         )
 
         manifest = loader.load()
@@ -372,6 +384,7 @@ class ManifestLoader:
         project_parser_files = orig_project_parser_files = file_reader.project_parser_files
         self._perf_info.path_count = len(self.manifest.files)
         self._perf_info.read_files_elapsed = time.perf_counter() - start_read_files
+        record_span("read_files", start_read_files, category="parse")
 
         self.skip_parsing = False
         project_parser_files = self.safe_update_project_parser_files_partially(
@@ -406,6 +419,7 @@ class ManifestLoader:
                 self.load_and_parse_macros(project_parser_files)
 
             self._perf_info.load_macros_elapsed = time.perf_counter() - start_load_macros
+            record_span("load_macros", start_load_macros, category="parse")
 
             # Now that the macros are parsed, parse the rest of the files.
             # This is currently done on a per project basis.
@@ -459,6 +473,7 @@ class ManifestLoader:
             patcher.construct_sources()
             self.manifest.sources = patcher.sources
             self._perf_info.patch_sources_elapsed = time.perf_counter() - start_patch
+            record_span("patch_sources", start_patch, category="parse")
 
             # We need to rebuild disabled in order to include disabled sources
             self.manifest.rebuild_disabled_lookup()
@@ -476,14 +491,22 @@ class ManifestLoader:
             # These check the created_at time on the nodes to
             # determine whether they need processing.
             start_process = time.perf_counter()
-            self.process_sources(self.root_project.project_name)
-            self.process_refs(self.root_project.project_name, self.root_project.dependencies)
-            self.process_unit_tests(self.root_project.project_name)
-            self.process_docs(self.root_project)
-            self.process_metrics(self.root_project)
-            self.process_saved_queries(self.root_project)
-            self.process_model_inferred_primary_keys()
-            self.process_functions(self.root_project.project_name)
+            with span("process_sources", category="parse"):
+                self.process_sources(self.root_project.project_name)
+            with span("process_refs", category="parse"):
+                self.process_refs(self.root_project.project_name, self.root_project.dependencies)
+            with span("process_unit_tests", category="parse"):
+                self.process_unit_tests(self.root_project.project_name)
+            with span("process_docs", category="parse"):
+                self.process_docs(self.root_project)
+            with span("process_metrics", category="parse"):
+                self.process_metrics(self.root_project)
+            with span("process_saved_queries", category="parse"):
+                self.process_saved_queries(self.root_project)
+            with span("process_model_inferred_primary_keys", category="parse"):
+                self.process_model_inferred_primary_keys()
+            with span("process_functions", category="parse"):
+                self.process_functions(self.root_project.project_name)
             self.check_valid_group_config()
             self.check_valid_access_property()
             self.check_valid_snapshot_config()
@@ -772,6 +795,13 @@ class ManifestLoader:
                     elapsed=time.perf_counter() - parser_start_timer,
                 )
             )
+            record_span(
+                parser_name,
+                parser_start_timer,
+                category="parse",
+                project=project.project_name,
+                parsed_path_count=project_parsed_path_count,
+            )
             total_parsed_path_count += project_parsed_path_count
 
         # HookParser doesn't run from loaded files, just dbt_project.yml,
@@ -839,10 +869,13 @@ class ManifestLoader:
                     UnableToPartialParse(reason="saved manifest contained the wrong version")
                 )
                 self.manifest.metadata.dbt_version = __version__
-            manifest_msgpack = self.manifest.to_msgpack(extended_mashumaro_encoder)
-            make_directory(os.path.dirname(path))
-            with open(path, "wb") as fp:
-                fp.write(manifest_msgpack)
+            with span("write_partial_parse_file", category="parse"):
+                manifest_msgpack = self.manifest.to_msgpack(extended_mashumaro_encoder)
+                make_directory(os.path.dirname(path))
+                with open(path, "wb") as fp:
+                    fp.write(manifest_msgpack)
+            if self.manifest_msgpack_hook is not None:
+                self.manifest_msgpack_hook(manifest_msgpack)
         except Exception:
             raise
 
@@ -951,7 +984,9 @@ class ManifestLoader:
                     return True
         return False
 
-    def read_manifest_for_partial_parse(self) -> Optional[Manifest]:
+    def read_manifest_for_partial_parse(
+        self, saved_manifest: Optional[Manifest] = None
+    ) -> Optional[Manifest]:
         flags = get_flags()
         if not flags.PARTIAL_PARSE:
             fire_event(PartialParsingNotEnabled())
@@ -962,23 +997,26 @@ class ManifestLoader:
 
         reparse_reason = None
 
-        if os.path.exists(path):
+        if saved_manifest is not None:
+            # A manifest kept in memory by a long-running process (see dbt.daemon) doesn't
+            # need to be read from disk, but it has to pass the same checks.
+            is_partial_parsable, reparse_reason = self.is_partial_parsable(saved_manifest)
+            if is_partial_parsable:
+                return self._refresh_saved_manifest(saved_manifest)
+        elif os.path.exists(path):
             try:
-                with open(path, "rb") as fp:
-                    manifest_mp = fp.read()
-                manifest: Manifest = Manifest.from_msgpack(manifest_mp, decoder=extended_mashumuro_decoder)  # type: ignore
+                with span("read_partial_parse_file", category="parse"):
+                    with open(path, "rb") as fp:
+                        manifest_mp = fp.read()
+                    manifest: Manifest = Manifest.from_msgpack(manifest_mp, decoder=extended_mashumuro_decoder)  # type: ignore
                 # keep this check inside the try/except in case something about
                 # the file has changed in weird ways, perhaps due to being a
                 # different version of dbt
                 is_partial_parsable, reparse_reason = self.is_partial_parsable(manifest)
                 if is_partial_parsable:
-                    # We don't want to have stale generated_at dates
-                    manifest.metadata.generated_at = datetime.now(timezone.utc).replace(
-                        tzinfo=None
-                    )
-                    # or invocation_ids
-                    manifest.metadata.invocation_id = get_invocation_id()
-                    return manifest
+                    if self.manifest_msgpack_hook is not None:
+                        self.manifest_msgpack_hook(manifest_mp)
+                    return self._refresh_saved_manifest(manifest)
             except Exception as exc:
                 fire_event(
                     ParsedFileLoadFailed(path=path, exc=str(exc), exc_info=traceback.format_exc())
@@ -996,6 +1034,13 @@ class ManifestLoader:
 
         return None
 
+    def _refresh_saved_manifest(self, manifest: Manifest) -> Manifest:
+        # We don't want to have stale generated_at dates
+        manifest.metadata.generated_at = datetime.now(timezone.utc).replace(tzinfo=None)
+        # or invocation_ids
+        manifest.metadata.invocation_id = get_invocation_id()
+        return manifest
+
     def build_perf_info(self):
         flags = get_flags()
         mli = ManifestLoaderInfo(
@@ -1261,73 +1306,35 @@ class ManifestLoader:
     # metrics: metric descriptions
     # semantic_models: semantic model descriptions
     def process_docs(self, config: RuntimeConfig):
+        renderer = DescriptionRenderer(config, self.manifest)
         for node in self.manifest.nodes.values():
             if node.created_at < self.started_at:
                 continue
-            ctx = generate_runtime_docs_context(
-                config,
-                node,
-                self.manifest,
-                config.project_name,
-            )
-            _process_docs_for_node(ctx, node, self.manifest)
+            _process_docs_for_node(renderer, node)
         for source in self.manifest.sources.values():
             if source.created_at < self.started_at:
                 continue
-            ctx = generate_runtime_docs_context(
-                config,
-                source,
-                self.manifest,
-                config.project_name,
-            )
-            _process_docs_for_source(ctx, source, self.manifest)
+            _process_docs_for_source(renderer, source)
         for macro in self.manifest.macros.values():
             if macro.created_at < self.started_at:
                 continue
-            ctx = generate_runtime_docs_context(
-                config,
-                macro,
-                self.manifest,
-                config.project_name,
-            )
-            _process_docs_for_macro(ctx, macro)
+            _process_docs_for_macro(renderer, macro)
         for exposure in self.manifest.exposures.values():
             if exposure.created_at < self.started_at:
                 continue
-            ctx = generate_runtime_docs_context(
-                config,
-                exposure,
-                self.manifest,
-                config.project_name,
-            )
-            _process_docs_for_exposure(ctx, exposure)
+            _process_docs_for_exposure(renderer, exposure)
         for metric in self.manifest.metrics.values():
             if metric.created_at < self.started_at:
                 continue
-            ctx = generate_runtime_docs_context(
-                config,
-                metric,
-                self.manifest,
-                config.project_name,
-            )
-            _process_docs_for_metrics(ctx, metric)
+            _process_docs_for_metrics(renderer, metric)
         for semantic_model in self.manifest.semantic_models.values():
             if semantic_model.created_at < self.started_at:
                 continue
-            ctx = generate_runtime_docs_context(
-                config,
-                semantic_model,
-                self.manifest,
-                config.project_name,
-            )
-            _process_docs_for_semantic_model(ctx, semantic_model)
+            _process_docs_for_semantic_model(renderer, semantic_model)
         for saved_query in self.manifest.saved_queries.values():
             if saved_query.created_at < self.started_at:
                 continue
-            ctx = generate_runtime_docs_context(
-                config, saved_query, self.manifest, config.project_name
-            )
-            _process_docs_for_saved_query(ctx, saved_query)
+            _process_docs_for_saved_query(renderer, saved_query)
 
     # Loops through all nodes and exposures, for each element in
     # 'sources' array finds the source node and updates the
@@ -1791,74 +1798,119 @@ def _get_doc_blocks(description: str, manifest: Manifest, node_package: str) ->
     return doc_blocks
 
 
+class DescriptionRenderer:
+    """Renders descriptions and finds their doc blocks for process_docs.
+
+    Most descriptions are plain text, which is returned as is without building a docs
+    context or parsing it. Descriptions with jinja are rendered with a docs context for
+    the node, built the first time one of its descriptions needs it, and memoized by
+    (text, package), since `doc()` resolves relative to the node's package.
+    """
+
+    def __init__(self, config: RuntimeConfig, manifest: Manifest) -> None:
+        self.config = config
+        self.manifest = manifest
+        # (text, package) -> (rendered text, file ids of the docs blocks it used)
+        self._rendered: Dict[Tuple[str, str], Tuple[str, List[str]]] = {}
+        self._doc_blocks: Dict[Tuple[str, str], List[str]] = {}
+        self._context: Optional[Tuple[DocsRuntimeContext, Dict[str, Any]]] = None
+
+    def _get_context(self, node) -> Tuple[DocsRuntimeContext, Dict[str, Any]]:
+        if self._context is None or self._context[0].node is not node:
+            ctx = DocsRuntimeContext(self.config, node, self.manifest, self.config.project_name)
+            self._context = (ctx, ctx.to_dict())
+        return self._context
+
+    def render(self, description: str, node) -> str:
+        if not has_render_chars(description):
+            return description
+
+        key = (description, node.package_name)
+        if key in self._rendered:
+            rendered, file_ids = self._rendered[key]
+            # doc() links the docs file to the node for partial parsing, so do the same
+            # for the docs blocks used by the memoized rendering
+            for file_id in file_ids:
+                if file_id in self.manifest.files:
+                    self.manifest.files[file_id].add_node(node.unique_id)  # type: ignore[union-attr]
+            return rendered
+
+        ctx, ctx_dict = self._get_context(node)
+        first_doc = len(ctx.doc_file_ids)
+        rendered = get_rendered(description, ctx_dict)
+        self._rendered[key] = (rendered, ctx.doc_file_ids[first_doc:])
+        return rendered
+
+    def doc_blocks(self, description: str, node) -> List[str]:
+        if not has_render_chars(description):
+            return []
+
+        key = (description, node.package_name)
+        if key not in self._doc_blocks:
+            self._doc_blocks[key] = _get_doc_blocks(description, self.manifest, node.package_name)
+        return list(self._doc_blocks[key])
+
+
 # node and column descriptions
-def _process_docs_for_node(
-    context: Dict[str, Any],
-    node: ManifestNode,
-    manifest: Manifest,
-):
-    node.doc_blocks = _get_doc_blocks(node.description, manifest, node.package_name)
-    node.description = get_rendered(node.description, context)
+def _process_docs_for_node(renderer: DescriptionRenderer, node: ManifestNode):
+    node.doc_blocks = renderer.doc_blocks(node.description, node)
+    node.description = renderer.render(node.description, node)
 
     for column_name, column in node.columns.items():
-        column.doc_blocks = _get_doc_blocks(column.description, manifest, node.package_name)
-        column.description = get_rendered(column.description, context)
+        column.doc_blocks = renderer.doc_blocks(column.description, node)
+        column.description = renderer.render(column.description, node)
 
 
 # source and table descriptions, column descriptions
-def _process_docs_for_source(
-    context: Dict[str, Any],
-    source: SourceDefinition,
-    manifest: Manifest,
-):
-    source.doc_blocks = _get_doc_blocks(source.description, manifest, source.package_name)
-    source.description = get_rendered(source.description, context)
+def _process_docs_for_source(renderer: DescriptionRenderer, source: SourceDefinition):
+    source.doc_blocks = renderer.doc_blocks(source.description, source)
+    source.description = renderer.render(source.description, source)
 
-    source.source_description = get_rendered(source.source_description, context)
+    source.source_description = renderer.render(source.source_description, source)
 
     for column in source.columns.values():
-        column.doc_blocks = _get_doc_blocks(column.description, manifest, source.package_name)
-        column.description = get_rendered(column.description, context)
+        column.doc_blocks = renderer.doc_blocks(column.description, source)
+        column.description = renderer.render(column.description, source)
 
 
 # macro argument descriptions
-def _process_docs_for_macro(context: Dict[str, Any], macro: Macro) -> None:
-    macro.description = get_rendered(macro.description, context)
+def _process_docs_for_macro(renderer: DescriptionRenderer, macro: Macro) -> None:
+    macro.description = renderer.render(macro.description, macro)
     for arg in macro.arguments:
-        arg.description = get_rendered(arg.description, context)
+        arg.description = renderer.render(arg.description, macro)
 
 
 # exposure descriptions
-def _process_docs_for_exposure(context: Dict[str, Any], exposure: Exposure) -> None:
-    exposure.description = get_rendered(exposure.description, context)
+def _process_docs_for_exposure(renderer: DescriptionRenderer, exposure: Exposure) -> None:
+    exposure.description = renderer.render(exposure.description, exposure)
 
 
-def _process_docs_for_metrics(context: Dict[str, Any], metric: Metric) -> None:
-    metric.description = get_rendered(metric.description, context)
+def _process_docs_for_metrics(renderer: DescriptionRenderer, metric: Metric) -> None:
+    metric.description = renderer.render(metric.description, metric)
 
 
 def _process_docs_for_semantic_model(
-    context: Dict[str, Any], semantic_model: SemanticModel
+    renderer: DescriptionRenderer, semantic_model: SemanticModel
 ) -> None:
     if semantic_model.description:
-        semantic_model.description = get_rendered(semantic_model.description, context)
+        semantic_model.description = renderer.render(semantic_model.description, semantic_model)
 
     for dimension in semantic_model.dimensions:
         if dimension.description:
-            dimension.description = get_rendered(dimension.description, context)
+            dimension.description = renderer.render(dimension.description, semantic_model)
 
     for measure in semantic_model.measures:
         if measure.description:
-            measure.description = get_rendered(measure.description, context)
+            measure.description = renderer.render(measure.description, semantic_model)
 
     for entity in semantic_model.entities:
         if entity.description:
-            entity.description = get_rendered(entity.description, context)
+            entity.description = renderer.render(entity.description, semantic_model)
 
 
-def _process_docs_for_saved_query(context: Dict[str, Any], saved_query: SavedQuery) -> None:
+def _process_docs_for_saved_query(renderer: DescriptionRenderer, saved_query: SavedQuery) -> None:
     if saved_query.description:
-        saved_query.description = get_rendered(saved_query.description, context)
+        saved_query.description = renderer.render(saved_query.description, saved_query)
 
 
 def _process_refs(
@@ -2209,13 +2261,7 @@ def _process_functions_for_node(
 # This is called in task.rpc.sql_commands when a "dynamic" node is
 # created in the manifest, in 'add_refs'
 def process_macro(config: RuntimeConfig, manifest: Manifest, macro: Macro) -> None:
-    ctx = generate_runtime_docs_context(
-        config,
-        macro,
-        manifest,
-        config.project_name,
-    )
-    _process_docs_for_macro(ctx, macro)
+    _process_docs_for_macro(DescriptionRenderer(config, manifest), macro)
 
 
 # This is called in task.rpc.sql_commands when a "dynamic" node is
@@ -2223,8 +2269,7 @@ def process_macro(config: RuntimeConfig, manifest: Manifest, macro: Macro) -> No
 def process_node(config: RuntimeConfig, manifest: Manifest, node: ManifestNode):
     _process_sources_for_node(manifest, config.project_name, node)
     _process_refs(manifest, config.project_name, node, config.dependencies)
-    ctx = generate_runtime_docs_context(config, node, manifest, config.project_name)
-    _process_docs_for_node(ctx, node, manifest)
+    _process_docs_for_node(DescriptionRenderer(config, manifest), node)
 
 
 def write_semantic_manifest(manifest: Manifest, target_path: str) -> None:
@@ -2248,6 +2293,8 @@ def parse_manifest(
     write: bool,
     write_json: bool,
     active_integrations: List[Optional[CatalogWriteIntegrationConfig]],
+    saved_manifest: Optional[Manifest] = None,
+    manifest_msgpack_hook: Optional[Callable[[bytes], Any]] = None,
 ) -> Manifest:
     register_adapter(runtime_config, get_mp_context())
     adapter = get_adapter(runtime_config)
@@ -2257,6 +2304,8 @@ def parse_manifest(
     manifest = ManifestLoader.get_full_manifest(
         runtime_config,
         write_perf_info=write_perf_info,
+        saved_manifest=saved_manifest,
+        manifest_msgpack_hook=manifest_msgpack_hook,
     )
 
     # If we should (over)write the manifest in the target path, do that now
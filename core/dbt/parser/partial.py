@@ -552,7 +552,7 @@ class PartialParsing:
                     source_file.macros.remove(unique_id)
                 continue
 
-            base_macro = self.saved_manifest.macros.pop(unique_id)
+            base_macro = self.saved_manifest.remove_macro(unique_id)
 
             # Recursively check children of this macro
             # The macro_child_map might not exist if a macro is removed by
@@ -1020,7 +1020,7 @@ class PartialParsing:
         # Need to delete all macros in the same file
         # and then reapply all schema file updates for those macros
         if macro_unique_id and macro_unique_id in self.saved_manifest.macros:
-            macro = self.saved_manifest.macros.pop(macro_unique_id)
+            macro = self.saved_manifest.remove_macro(macro_unique_id)
             macro_file_id = macro.file_id
             if macro_file_id in self.new_files:
                 source_file = self.saved_files[macro_file_id]
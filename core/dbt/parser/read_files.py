@@ -122,10 +122,22 @@ def validate_yaml(file_path, dct):
 
 
 # Special processing for big seed files
-def load_seed_source_file(match: FilePath, project_name) -> SourceFile:
+def load_seed_source_file(match: FilePath, project_name, saved_files=None) -> SourceFile:
     if match.seed_too_large():
-        # We don't want to calculate a hash of this file. Use the path.
-        source_file = SourceFile.big_seed(match)
+        # We don't want to load this file into memory, so reuse the saved checksum
+        # if the file hasn't been modified, or hash it in chunks otherwise
+        file_id = f"{project_name}://{match.original_file_path}"
+        old_source_file = saved_files.get(file_id) if saved_files else None
+        if (
+            old_source_file is not None
+            and match.modification_time != 0.0
+            and old_source_file.path.modification_time == match.modification_time
+            and old_source_file.checksum.name != "path"
+        ):
+            source_file = SourceFile(path=match, checksum=old_source_file.checksum)
+            source_file.contents = ""
+        else:
+            source_file = SourceFile.big_seed(match)
     else:
         file_contents = load_file_contents(match.absolute_path, strip=True)
         checksum = FileHash.from_contents(file_contents)
@@ -145,7 +157,7 @@ def get_source_files(project, paths, extension, parse_file_type, saved_files, ig
     fb_list = []
     for fp in fp_list:
         if parse_file_type == ParseFileType.Seed:
-            fb_list.append(load_seed_source_file(fp, project.project_name))
+            fb_list.append(load_seed_source_file(fp, project.project_name, saved_files))
         # singular tests live in /tests but only generic tests live
         # in /tests/generic and fixtures in /tests/fixture so we want to skip those
         else:
@@ -196,7 +208,7 @@ class ReadFiles(Protocol):
 class ReadFilesFromFileSystem:
     all_projects: Mapping[str, Project]
     files: MutableMapping[str, AnySourceFile] = field(default_factory=dict)
-    # saved_files is only used to compare schema files
+    # saved_files is only used to compare schema files and large seeds
     saved_files: MutableMapping[str, AnySourceFile] = field(default_factory=dict)
     # project_parser_files = {
     #   "my_project": {
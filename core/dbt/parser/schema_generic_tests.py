@@ -5,7 +5,13 @@ from typing import Any, Dict, List, Optional, Union
 
 from dbt.adapters.factory import get_adapter, get_adapter_package_names
 from dbt.artifacts.resources import NodeVersion, RefArgs
-from dbt.clients.jinja import add_rendered_test_kwargs, get_rendered
+from dbt.clients.jinja import (
+    TEST_KWARG_FUNCTION_PATTERN,
+    add_rendered_test_kwargs,
+    get_rendered,
+    has_render_chars,
+)
+from dbt.clients.jinja_static import statically_parse_ref_or_source
 from dbt.context.configured import SchemaYamlVars, generate_schema_yml_context
 from dbt.context.context_config import ContextConfig
 from dbt.context.macro_resolver import MacroResolver
@@ -39,6 +45,55 @@ from dbt.parser.search import FileBlock
 from dbt.utils import get_pseudo_test_path, md5
 from dbt_common.dataclass_schema import ValidationError
 
+# Internal generic tests whose macros only use their arguments, see render_test_update
+STATIC_GENERIC_TEST_MACROS = frozenset(
+    {
+        "macro.dbt.test_not_null",
+        "macro.dbt.test_unique",
+        "macro.dbt.test_accepted_values",
+        "macro.dbt.test_relationships",
+    }
+)
+# The macros that rendering the test kwargs records as dependencies of these tests: their
+# model kwarg calls get_where_subquery. not_null and unique have never recorded it.
+STATIC_GENERIC_TEST_KWARG_MACROS = {
+    "macro.dbt.test_accepted_values": ("get_where_subquery",),
+    "macro.dbt.test_relationships": ("get_where_subquery",),
+}
+
+
+def _statically_extract_test_refs(
+    kwargs: Dict[str, Any]
+) -> Optional[List[Union[RefArgs, List[str]]]]:
+    """Return the refs and sources in the test kwargs, in the order rendering them would
+    find them, or None if any of the kwargs has to be rendered with jinja.
+    """
+    refs: List[Union[RefArgs, List[str]]] = []
+
+    def _extract(value: Any) -> bool:
+        if isinstance(value, dict):
+            return all(_extract(v) for v in value.values())
+        elif isinstance(value, (list, tuple)):
+            return all(_extract(v) for v in value)
+        elif not isinstance(value, str):
+            return True
+        elif has_render_chars(value):
+            return False
+        elif TEST_KWARG_FUNCTION_PATTERN.match(value) is None:
+            return True
+        try:
+            refs.append(statically_parse_ref_or_source(value))
+        except ParsingError:
+            # env_var, var, doc or a more complex expression
+            return False
+        return True
+
+    for key, value in kwargs.items():
+        # column names are never rendered, and the model is the target of the test
+        if key not in ("column_name", "model") and not _extract(value):
+            return None
+    return refs
+
 
 # This parser handles the tests that are defined in "schema" (yaml) files, on models,
 # sources, etc. The base generic test is handled by the GenericTestParser
@@ -271,13 +326,12 @@ class SchemaGenericTestParser(SimpleParser):
             for var in env_vars.keys():
                 schema_file.add_env_var(var, yaml_key, search_name)
 
-    # This does special shortcut processing for the two
-    # most common internal macros, not_null and unique,
-    # which avoids the jinja rendering to resolve config
-    # and variables, etc, which might be in the macro.
-    # In the future we will look at generalizing this
-    # more to handle additional macros or to use static
-    # parsing to avoid jinja overhead.
+    # This does special shortcut processing for the internal generic tests
+    # (not_null, unique, accepted_values and relationships), which avoids the
+    # jinja rendering to resolve config and variables, etc, which might be in
+    # the macro. Their macros don't call ref, source or config themselves, so
+    # as long as the test arguments are literals or simple ref() or source()
+    # calls, the refs and sources can be extracted statically.
     def render_test_update(self, node, config, builder, schema_file_id):
         macro_unique_id = self.macro_resolver.get_macro_id(
             node.package_name, "test_" + builder.name
@@ -285,17 +339,31 @@ class SchemaGenericTestParser(SimpleParser):
         # Add the depends_on here so we can limit the macros added
         # to the context in rendering processing
         node.depends_on.add_macro(macro_unique_id)
-        if macro_unique_id in ["macro.dbt.test_not_null", "macro.dbt.test_unique"]:
+        static_refs = None
+        if macro_unique_id in STATIC_GENERIC_TEST_MACROS:
+            static_refs = _statically_extract_test_refs(node.test_metadata.kwargs)
+        if static_refs is not None:
             config_call_dict = builder.config
             config._config_call_dict = config_call_dict
             # This sets the config from dbt_project
             self.update_parsed_node_config(node, config)
+            for macro_name in STATIC_GENERIC_TEST_KWARG_MACROS.get(macro_unique_id, ()):
+                macro_id = self.macro_resolver.get_macro_id(node.package_name, macro_name)
+                if macro_id is not None:
+                    node.depends_on.add_macro(macro_id)
+            for ref_or_source in static_refs:
+                if isinstance(ref_or_source, RefArgs):
+                    node.refs.append(ref_or_source)
+                else:
+                    node.sources.append(ref_or_source)
             # source node tests are processed at patch_source time
             if isinstance(builder.target, UnpatchedSourceDefinition):
                 sources = [builder.target.fqn[-2], builder.target.fqn[-1]]
                 node.sources.append(sources)
             else:  # all other nodes
-                node.refs.append(RefArgs(name=builder.target.name, version=builder.version))
+                # the rendered path calls ref(name, version='...'), so match its str version
+                version = str(builder.version) if builder.version else None
+                node.refs.append(RefArgs(name=builder.target.name, version=version))
         else:
             try:
                 # make a base context that doesn't have the magic kwargs field
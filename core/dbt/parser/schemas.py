@@ -145,11 +145,12 @@ def yaml_from_file(
                 )
 
                 # Validate the yaml against the jsonschema to raise deprecation warnings
-                # for invalid fields.
+                # for invalid fields. Unchanged files reuse their earlier results.
                 jsonschema_validate(
                     schema=resources_schema(),
                     json=contents,
                     file_path=source_file.path.original_file_path,
+                    checksum=source_file.checksum.checksum,
                 )
         else:
             contents = load_yaml_text(to_load, source_file.path)
@@ -1,7 +1,11 @@
+import json
+import os
+import threading
+import time
 from contextlib import contextmanager
 from cProfile import Profile
 from pstats import Stats
-from typing import Any, Generator
+from typing import Any, Dict, Generator, Iterator, List, Optional
 
 
 @contextmanager
@@ -18,3 +22,86 @@ def profiler(enable: bool, outfile: str) -> Generator[Any, None, None]:
             stats = Stats(profiler)
             stats.sort_stats("tottime")
             stats.dump_stats(str(outfile))
+
+
+class Timeline:
+    """Named spans of an invocation (parsing phases, graph compilation, selection, and the
+    queue wait, compile and execute of each node), in the Chrome trace event format. The
+    file can be opened with chrome://tracing or https://ui.perfetto.dev.
+    """
+
+    def __init__(self) -> None:
+        self.events: List[Dict[str, Any]] = []
+        self._thread_names: Dict[int, str] = {}
+        self._lock = threading.Lock()
+
+    def add(self, name: str, category: str, start: float, end: float, **args: Any) -> None:
+        thread = threading.current_thread()
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            # microseconds, as perf_counter offsets
+            "ts": start * 1_000_000,
+            "dur": (end - start) * 1_000_000,
+            "pid": os.getpid(),
+            "tid": thread.ident,
+            "args": args,
+        }
+        with self._lock:
+            self.events.append(event)
+            self._thread_names.setdefault(thread.ident or 0, thread.name)
+
+    def to_dict(self) -> Dict[str, Any]:
+        thread_names = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": os.getpid(),
+                "tid": tid,
+                "args": {"name": name},
+            }
+            for tid, name in self._thread_names.items()
+        ]
+        return {"traceEvents": thread_names + self.events, "displayTimeUnit": "ms"}
+
+    def write(self, path: str) -> None:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w") as fp:
+            json.dump(self.to_dict(), fp)
+
+
+_timeline: Optional[Timeline] = None
+
+
+@contextmanager
+def timeline(outfile: str) -> Iterator[Timeline]:
+    """Record spans until exiting, then write them to `outfile`."""
+    global _timeline
+    _timeline = Timeline()
+    try:
+        yield _timeline
+    finally:
+        recorded, _timeline = _timeline, None
+        recorded.write(outfile)
+
+
+def record_span(
+    name: str, start: float, end: Optional[float] = None, category: str = "dbt", **args: Any
+) -> None:
+    """Add a span that started at `start` (a time.perf_counter() value) to the timeline."""
+    if _timeline is not None:
+        _timeline.add(name, category, start, time.perf_counter() if end is None else end, **args)
+
+
+@contextmanager
+def span(name: str, category: str = "dbt", **args: Any) -> Iterator[None]:
+    """Add the time spent in the block to the timeline, if one is being recorded."""
+    if _timeline is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_span(name, start, category=category, **args)
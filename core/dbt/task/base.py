@@ -41,6 +41,7 @@ from dbt.events.types import (
 )
 from dbt.flags import get_flags
 from dbt.graph import Graph
+from dbt.profiler import span
 from dbt.task import group_lookup
 from dbt.task.printer import print_run_result_error
 from dbt_common.events.contextvars import get_node_info
@@ -292,7 +293,10 @@ class BaseRunner(metaclass=ABCMeta):
                     node_info=ctx.node.node_info,
                 )
             )
-            with collect_timing_info("compile", ctx.timing.append):
+            with (
+                collect_timing_info("compile", ctx.timing.append),
+                span("compile", category="node", unique_id=self.node.unique_id),
+            ):
                 # if we fail here, we still have a compiled node to return
                 # this has the benefit of showing a build path for the errant
                 # model.  This calls the 'compile' method in CompileTask
@@ -306,7 +310,10 @@ class BaseRunner(metaclass=ABCMeta):
                         node_info=ctx.node.node_info,
                     )
                 )
-                with collect_timing_info("execute", ctx.timing.append):
+                with (
+                    collect_timing_info("execute", ctx.timing.append),
+                    span("execute", category="node", unique_id=ctx.node.unique_id),
+                ):
                     result = self.run(ctx.node, manifest)
                     ctx.node = result.node
 
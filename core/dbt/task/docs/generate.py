@@ -1,9 +1,10 @@
 import os
 import shutil
+from concurrent.futures import Future, as_completed
 from dataclasses import replace
 from datetime import datetime, timezone
 from itertools import chain
-from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple, cast
 
 import agate
 
@@ -11,9 +12,12 @@ import dbt.compilation
 import dbt.exceptions
 import dbt.utils
 import dbt_common.utils.formatting
+from dbt.adapters.base import BaseAdapter, BaseRelation
+from dbt.adapters.contracts.relation import RelationConfig
 from dbt.adapters.events.types import (
     BuildingCatalog,
     CannotGenerateDocs,
+    CatalogGenerationError,
     CatalogWritten,
     WriteCatalogFailure,
 )
@@ -44,8 +48,10 @@ from dbt.task.docs import DOCS_INDEX_FILE_PATH
 from dbt.utils.artifact_upload import add_artifact_produced
 from dbt_common.clients.system import load_file_contents
 from dbt_common.dataclass_schema import ValidationError
-from dbt_common.events.functions import fire_event
+from dbt_common.events.functions import fire_event, warn_or_error
 from dbt_common.exceptions import DbtInternalError
+from dbt_common.utils import executor
+from dbt_common.utils.executor import HasThreadingConfig
 
 
 def get_stripped_prefix(source: Dict[str, Any], prefix: str) -> Dict[str, Any]:
@@ -102,7 +108,46 @@ class Catalog(Dict[CatalogKey, CatalogTable]):
 
     def add_column(self, data: PrimitiveDict):
         table = self.get_table(data)
-        column_data = get_stripped_prefix(data, "column_")
+        self._add_column(table, get_stripped_prefix(data, "column_"))
+
+    def add_table(self, table: agate.Table) -> None:
+        """Add the columns in the results of a catalog query, row by row, without building a
+        dict of every row first.
+        """
+        names = table.column_names
+        if "table_schema" not in names or "table_name" not in names:
+            # add_column raises the error about the missing key
+            for row in table:
+                self.add_column(dict(zip(names, map(dbt.utils._coerce_decimal, row))))
+            return
+
+        database_index = names.index("table_database") if "table_database" in names else None
+        schema_index = names.index("table_schema")
+        name_index = names.index("table_name")
+        column_fields = [
+            (index, name[len("column_") :])
+            for index, name in enumerate(names)
+            if name.startswith("column_")
+        ]
+        for row in table:
+            values = row.values()
+            database = values[database_index] if database_index is not None else None
+            key = CatalogKey(
+                None if database is None else str(database),
+                str(values[schema_index]),
+                str(values[name_index]),
+            )
+            catalog_table = self.get(key)
+            if catalog_table is None:
+                data = dict(zip(names, map(dbt.utils._coerce_decimal, values)))
+                catalog_table = self[key] = build_catalog_table(data)
+            column_data = {
+                field: dbt.utils._coerce_decimal(values[index]) for index, field in column_fields
+            }
+            self._add_column(catalog_table, column_data)
+
+    @staticmethod
+    def _add_column(table: CatalogTable, column_data: Dict[str, Any]) -> None:
         # the index should really never be that big so it's ok to end up
         # serializing this to JSON (2^53 is the max safe value there)
         column_data["index"] = int(column_data["index"])
@@ -188,6 +233,15 @@ def format_stats(stats: PrimitiveDict) -> StatsDict:
     return stats_collector
 
 
+def _schema_key(
+    database: Optional[str], schema: Optional[str]
+) -> Tuple[Optional[str], Optional[str]]:
+    return (
+        dbt_common.utils.formatting.lowercase(database),
+        dbt_common.utils.formatting.lowercase(schema),
+    )
+
+
 def mapping_key(node: ResultNode) -> CatalogKey:
     dkey = dbt_common.utils.formatting.lowercase(node.database)
     return CatalogKey(dkey, node.schema.lower(), node.identifier.lower())
@@ -247,7 +301,7 @@ class GenerateTask(CompileTask):
 
         selected_node_ids: Optional[Set[UniqueId]] = None
         if self.args.empty_catalog:
-            catalog_table: agate.Table = agate.Table([])
+            catalog = Catalog([])
             exceptions: List[Exception] = []
             selected_node_ids = set()
         else:
@@ -285,17 +339,10 @@ class GenerateTask(CompileTask):
                     self.manifest.sources.values(),
                 )
                 used_schemas = self.manifest.get_used_schemas()
-                catalog_table, exceptions = adapter.get_filtered_catalog(
-                    catalogable_nodes, used_schemas, relations
+                catalog, exceptions = self.get_catalog(
+                    adapter, catalogable_nodes, used_schemas, relations
                 )
 
-        catalog_data: List[PrimitiveDict] = [
-            dict(zip(catalog_table.column_names, map(dbt.utils._coerce_decimal, row)))
-            for row in catalog_table
-        ]
-
-        catalog = Catalog(catalog_data)
-
         errors: Optional[List[str]] = None
         if exceptions:
             errors = [str(e) for e in exceptions]
@@ -342,6 +389,68 @@ class GenerateTask(CompileTask):
         fire_event(CatalogWritten(path=os.path.abspath(catalog_path)))
         return results
 
+    def get_catalog(
+        self,
+        adapter: BaseAdapter,
+        catalogable_nodes: Iterable[ResultNode],
+        used_schemas: FrozenSet[Tuple[str, str]],
+        relations: Optional[Set[BaseRelation]],
+    ) -> Tuple[Catalog, List[Exception]]:
+        """Query the catalog of each schema separately across the thread pool, so that
+        generating it takes as long as the slowest schema, and add the results of each
+        query to the Catalog as it completes.
+        """
+        schemas: Dict[Tuple[Optional[str], Optional[str]], List[ResultNode]] = {}
+        for node in catalogable_nodes:
+            schemas.setdefault(_schema_key(node.database, node.schema), []).append(node)
+
+        schema_relations: Dict[Tuple[Optional[str], Optional[str]], Set[BaseRelation]] = {}
+        if relations is not None:
+            for relation in relations:
+                key = _schema_key(relation.database, relation.schema)
+                schema_relations.setdefault(key, set()).add(relation)
+            # only the schemas with selected relations need to be queried
+            schemas = {key: schemas.get(key, []) for key in schema_relations}
+
+        catalog = Catalog([])
+        if self.config.threads <= 1 or len(schemas) <= 1:
+            # the nodes have what RelationConfig describes, though mypy can't tell
+            relation_configs = cast(
+                List[RelationConfig], list(chain.from_iterable(schemas.values()))
+            )
+            catalog_table, exceptions = adapter.get_filtered_catalog(
+                relation_configs, used_schemas, relations
+            )
+            catalog.add_table(catalog_table)
+            return catalog, exceptions
+
+        exceptions = []
+        # RuntimeConfig.threads is an int, where the protocol allows None
+        with executor(cast(HasThreadingConfig, self.config)) as tpe:
+            futures: List[Future[Tuple[agate.Table, List[Exception]]]] = [
+                tpe.submit_connected(
+                    adapter,
+                    f"generate_catalog.{database}.{schema}",
+                    adapter.get_filtered_catalog,
+                    nodes,
+                    used_schemas,
+                    schema_relations.get((database, schema)) if relations is not None else None,
+                )
+                for (database, schema), nodes in schemas.items()
+            ]
+            for future in as_completed(futures):
+                exc = future.exception()
+                if exc is None:
+                    catalog_table, schema_exceptions = future.result()
+                    catalog.add_table(catalog_table)
+                    exceptions.extend(schema_exceptions)
+                elif isinstance(exc, KeyboardInterrupt) or not isinstance(exc, Exception):
+                    raise exc
+                else:
+                    warn_or_error(CatalogGenerationError(exc=str(exc)))
+                    exceptions.append(exc)
+        return catalog, exceptions
+
     def get_node_selector(self) -> ResourceTypeSelector:
         if self.manifest is None or self.graph is None:
             raise DbtInternalError("manifest and graph must be set to perform node selection")
@@ -1,7 +1,8 @@
 import os
 import threading
 import time
-from typing import AbstractSet, Dict, List, Optional, Type
+from collections import defaultdict
+from typing import AbstractSet, Dict, List, Optional, Tuple, Type
 
 from dbt import deprecations
 from dbt.adapters.base import BaseAdapter
@@ -33,17 +34,26 @@ from .base import BaseRunner
 from .printer import print_run_result_error
 from .run import RunTask
 
+# The maximum number of sources combined into a single batched freshness query
+MAX_SOURCES_PER_FRESHNESS_BATCH = 100
+
+SqlFreshnessCache = Dict[str, Tuple[Optional[AdapterResponse], FreshnessResponse]]
+
 
 class FreshnessRunner(BaseRunner):
     def __init__(self, config, adapter, node, node_index, num_nodes) -> None:
         super().__init__(config, adapter, node, node_index, num_nodes)
         self._metadata_freshness_cache: Dict[BaseRelation, FreshnessResult] = {}
+        self._sql_freshness_cache: SqlFreshnessCache = {}
 
     def set_metadata_freshness_cache(
         self, metadata_freshness_cache: Dict[BaseRelation, FreshnessResult]
     ) -> None:
         self._metadata_freshness_cache = metadata_freshness_cache
 
+    def set_sql_freshness_cache(self, sql_freshness_cache: SqlFreshnessCache) -> None:
+        self._sql_freshness_cache = sql_freshness_cache
+
     def on_skip(self):
         raise DbtRuntimeError("Freshness: nodes cannot be skipped!")
 
@@ -131,12 +141,17 @@ class FreshnessRunner(BaseRunner):
                 )
                 status = compiled_node.freshness.status(freshness["age"])
             elif compiled_node.loaded_at_field is not None:
-                adapter_response, freshness = self.adapter.calculate_freshness(
-                    relation,
-                    compiled_node.loaded_at_field,
-                    compiled_node.freshness.filter,
-                    macro_resolver=manifest,
-                )
+                if compiled_node.unique_id in self._sql_freshness_cache:
+                    adapter_response, freshness = self._sql_freshness_cache[
+                        compiled_node.unique_id
+                    ]
+                else:
+                    adapter_response, freshness = self.adapter.calculate_freshness(
+                        relation,
+                        compiled_node.loaded_at_field,
+                        compiled_node.freshness.filter,
+                        macro_resolver=manifest,
+                    )
 
                 status = compiled_node.freshness.status(freshness["age"])
             elif self.adapter.supports(Capability.TableLastModifiedMetadata):
@@ -206,6 +221,7 @@ class FreshnessTask(RunTask):
             )
 
         self._metadata_freshness_cache: Dict[BaseRelation, FreshnessResult] = {}
+        self._sql_freshness_cache: SqlFreshnessCache = {}
 
     def result_path(self) -> str:
         if self.args.output:
@@ -238,6 +254,9 @@ class FreshnessTask(RunTask):
                 adapter, selected_uids
             )
 
+        if before_run_status == RunStatus.Success and getattr(self.args, "batch_freshness", False):
+            self.populate_sql_freshness_cache(adapter, selected_uids)
+
         if (
             before_run_status == RunStatus.Success
             and populate_metadata_freshness_cache_status == RunStatus.Success
@@ -250,6 +269,7 @@ class FreshnessTask(RunTask):
         freshness_runner = super().get_runner(node)
         assert isinstance(freshness_runner, FreshnessRunner)
         freshness_runner.set_metadata_freshness_cache(self._metadata_freshness_cache)
+        freshness_runner.set_sql_freshness_cache(self._sql_freshness_cache)
         return freshness_runner
 
     def get_runner_type(self, _) -> Optional[Type[BaseRunner]]:
@@ -320,3 +340,83 @@ class FreshnessTask(RunTask):
 
     def get_freshness_metadata_cache(self) -> Dict[BaseRelation, FreshnessResult]:
         return self._metadata_freshness_cache
+
+    def get_sql_freshness_cache(self) -> SqlFreshnessCache:
+        return self._sql_freshness_cache
+
+    def populate_sql_freshness_cache(self, adapter, selected_uids: AbstractSet[str]) -> None:
+        """Calculate the freshness of sources with a loaded_at_field in batches, using a
+        single `union all` query for the sources in each database and schema rather than
+        a query per source. Sources missing from the cache, for example because their
+        batch failed, have their freshness calculated source-by-source by the runner.
+        """
+        if self.manifest is None:
+            raise DbtInternalError("Manifest must be set to populate sql freshness cache")
+
+        sources_by_schema: Dict[Tuple[Optional[str], str], List[SourceDefinition]]
+        sources_by_schema = defaultdict(list)
+        for selected_source_uid in sorted(selected_uids):
+            source = self.manifest.sources.get(selected_source_uid)
+            if source and source.loaded_at_field is not None and source.loaded_at_query is None:
+                sources_by_schema[(source.database, source.schema)].append(source)
+
+        if not sources_by_schema:
+            return
+
+        fire_event(
+            Note(
+                msg=f"Pulling freshness for {sum(map(len, sources_by_schema.values()))} sources "
+                f"from {len(sources_by_schema)} schemas in batch"
+            ),
+            EventLevel.INFO,
+        )
+
+        with adapter.connection_named("freshness_batch"):
+            snapshotted_at_sql = adapter.execute_macro(
+                "current_timestamp", macro_resolver=self.manifest
+            )
+            for schema_sources in sources_by_schema.values():
+                for i in range(0, len(schema_sources), MAX_SOURCES_PER_FRESHNESS_BATCH):
+                    batch = schema_sources[i : i + MAX_SOURCES_PER_FRESHNESS_BATCH]
+                    try:
+                        self._populate_sql_freshness_batch(adapter, batch, snapshotted_at_sql)
+                    except Exception as e:
+                        # As with metadata freshness, a failed batch is left out of the
+                        # cache and its sources fall back to one query per source.
+                        fire_event(
+                            Note(
+                                msg=f"Freshness could not be computed in batch for "
+                                f"{len(batch)} sources in schema '{batch[0].schema}': {e}"
+                            ),
+                            EventLevel.WARN,
+                        )
+
+    def _populate_sql_freshness_batch(
+        self, adapter, sources: List[SourceDefinition], snapshotted_at_sql: str
+    ) -> None:
+        queries = []
+        for source in sources:
+            relation = adapter.Relation.create_from(self.config, source)
+            source_unique_id = source.unique_id.replace("'", "''")
+            query = (
+                f"select '{source_unique_id}' as source_unique_id, "
+                f"max({source.loaded_at_field}) as max_loaded_at, "
+                f"{snapshotted_at_sql} as snapshotted_at "
+                f"from {relation}"
+            )
+            if source.freshness and source.freshness.filter:
+                query += f" where {source.freshness.filter}"
+            queries.append(query)
+
+        adapter_response, table = adapter.execute(
+            "\nunion all\n".join(queries), auto_begin=False, fetch=True
+        )
+        for source_unique_id, max_loaded_at, snapshotted_at in table.rows:
+            # There is no public adapter method that builds a freshness response
+            # from raw values, so this relies on the private one that
+            # calculate_freshness uses. If an adapter lacks it, the batch fails
+            # and its sources fall back to one query per source.
+            self._sql_freshness_cache[source_unique_id] = (
+                adapter_response,
+                adapter._create_freshness_response(max_loaded_at, snapshotted_at),
+            )
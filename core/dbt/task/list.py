@@ -1,5 +1,7 @@
+import dataclasses
 import json
-from typing import Iterator, List
+from enum import Enum
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple, Type
 
 from dbt.cli.flags import Flags
 from dbt.config.runtime import RuntimeConfig
@@ -17,12 +19,79 @@ from dbt.graph import ResourceTypeSelector
 from dbt.node_types import NodeType
 from dbt.task.base import resource_types_from_args
 from dbt.task.runnable import GraphRunnableTask
+from dbt.tracking import track_behavior_change_warn
 from dbt.utils import JSONEncoder
+from dbt_common.dataclass_schema import dbtClassMixin
 from dbt_common.events.contextvars import task_contextvars
+from dbt_common.events.event_manager_client import get_event_manager
 from dbt_common.events.functions import fire_event, warn_or_error
 from dbt_common.events.types import PrintEvent
 from dbt_common.exceptions import DbtInternalError, DbtRuntimeError
 
+# Fields that a node's __post_serialize__ drops or rewrites, which therefore can't be
+# serialized on their own.
+_POST_SERIALIZED_FIELDS = frozenset(
+    (
+        "compiled",
+        "compiled_code",
+        "extra_ctes",
+        "extra_ctes_injected",
+        "doc_blocks",
+        "previous_batch_results",
+    )
+)
+_field_names: Dict[Type, Optional[Tuple[str, ...]]] = {}
+
+
+class _NotProjectable(Exception):
+    pass
+
+
+def _projectable_fields(cls: Type) -> Optional[Tuple[str, ...]]:
+    """The fields of `cls` that serialize to themselves, in the order to_dict outputs them."""
+    if cls not in _field_names:
+        if dataclasses.is_dataclass(cls) and issubclass(cls, dbtClassMixin):
+            _field_names[cls] = tuple(
+                f.name
+                for f in dataclasses.fields(cls)
+                if not f.name.startswith("_") and f.name not in _POST_SERIALIZED_FIELDS
+            )
+        else:
+            _field_names[cls] = None
+    return _field_names[cls]
+
+
+def _serialize_value(value: Any) -> Any:
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return value
+    elif isinstance(value, dbtClassMixin):
+        return value.to_dict(omit_none=False)
+    elif isinstance(value, Enum):
+        return value.value
+    elif isinstance(value, (list, tuple)):
+        return [_serialize_value(v) for v in value]
+    elif isinstance(value, dict):
+        return {k: _serialize_value(v) for k, v in value.items()}
+    # anything else (e.g. datetimes) has a serialization strategy of its own
+    raise _NotProjectable()
+
+
+def node_to_dict(node: Any, keys: Iterable[str]) -> Dict[str, Any]:
+    """The `keys` of node.to_dict(omit_none=False), without serializing the rest of the
+    node. Falls back to the full to_dict for keys that only exist after serialization.
+    """
+    keys = frozenset(keys)
+    fields = _projectable_fields(type(node))
+    if fields is not None and not any(
+        key.startswith("_") or key in _POST_SERIALIZED_FIELDS for key in keys
+    ):
+        try:
+            return {key: _serialize_value(getattr(node, key)) for key in fields if key in keys}
+        except _NotProjectable:
+            pass
+    node_dict = node.to_dict(omit_none=False)
+    return {key: value for key, value in node_dict.items() if key in keys}
+
 
 class ListTask(GraphRunnableTask):
     DEFAULT_RESOURCE_VALUES = frozenset(
@@ -67,8 +136,11 @@ class ListTask(GraphRunnableTask):
                 )
 
     def _iterate_selected_nodes(self):
-        selector = self.get_node_selector()
         spec = self.get_selection_spec()
+        # The graph is only compiled for selections that need it, like "+" or "@"
+        if self.graph is None and spec.uses_graph:
+            self.compile_manifest()
+        selector = self.get_node_selector()
         unique_ids = sorted(selector.get_selected(spec))
         if not unique_ids:
             warn_or_error(NoNodesSelected())
@@ -146,9 +218,16 @@ class ListTask(GraphRunnableTask):
                 return None
         return current
 
+    def _top_level_keys(self) -> FrozenSet[str]:
+        if not self.args.output_keys:
+            return self.ALLOWED_KEYS
+        return frozenset(key.split(".")[0] for key in self.args.output_keys)
+
     def generate_json(self):
+        keys = self._top_level_keys()
         for node in self._iterate_selected_nodes():
-            node_dict = node.to_dict(omit_none=False)
+            # only the keys that are output get serialized
+            node_dict = node_to_dict(node, keys)
 
             if self.args.output_keys:
                 # Handle both nested and regular keys
@@ -177,7 +256,6 @@ class ListTask(GraphRunnableTask):
         # We set up a context manager here with "task_contextvars" because we
         # we need the project_root in compile_manifest.
         with task_contextvars(project_root=self.config.project_root):
-            self.compile_manifest()
             output = self.args.output
             if output == "selector":
                 generator = self.generate_selectors
@@ -192,8 +270,26 @@ class ListTask(GraphRunnableTask):
 
             return self.output_results(generator())
 
+    def _can_batch_output(self) -> bool:
+        """Whether the results can be printed as one PrintEvent rather than one per node.
+        Json-formatted logs and callbacks see one event per node, so they rule it out.
+        """
+        if "json" in (self.args.LOG_FORMAT, self.args.LOG_FORMAT_FILE):
+            return False
+        return all(
+            callback is track_behavior_change_warn for callback in get_event_manager().callbacks
+        )
+
     def output_results(self, results):
         """Log, or output a plain, newline-delimited, and ready-to-pipe list of nodes found."""
+        if self._can_batch_output():
+            self.node_results.extend(results)
+            if self.node_results:
+                # Each event is scrubbed and written by every logger, which dominates the
+                # time taken to list a large project
+                fire_event(PrintEvent(msg="\n".join(self.node_results)))
+            return self.node_results
+
         for result in results:
             self.node_results.append(result)
             # No formatting, still get to stdout when --quiet is used
@@ -221,8 +317,8 @@ class ListTask(GraphRunnableTask):
             return self.args.select
 
     def get_node_selector(self) -> ResourceTypeSelector:
-        if self.manifest is None or self.graph is None:
-            raise DbtInternalError("manifest and graph must be set to get perform node selection")
+        if self.manifest is None:
+            raise DbtInternalError("manifest must be set to get perform node selection")
         return ResourceTypeSelector(
             graph=self.graph,
             manifest=self.manifest,
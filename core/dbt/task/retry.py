@@ -6,8 +6,9 @@ from click.core import ParameterSource
 from dbt.artifacts.schemas.results import NodeStatus
 from dbt.cli.flags import Flags
 from dbt.cli.types import Command as CliCommand
+from dbt.compilation import read_retry_graph
 from dbt.config import RuntimeConfig
-from dbt.constants import RUN_RESULTS_FILE_NAME
+from dbt.constants import RETRY_GRAPH_FILE_NAME, RUN_RESULTS_FILE_NAME
 from dbt.contracts.state import load_result_state
 from dbt.flags import get_flags, set_flags
 from dbt.graph import GraphQueue
@@ -77,6 +78,9 @@ class RetryTask(ConfiguredTask):
         self.previous_results = load_result_state(
             Path(config.project_root) / Path(state_path) / RUN_RESULTS_FILE_NAME
         )
+        self.retry_graph_path = str(
+            Path(config.project_root) / Path(state_path) / RETRY_GRAPH_FILE_NAME
+        )
         if not self.previous_results:
             raise DbtRuntimeError(
                 f"Could not find previous run in '{state_path}' target directory"
@@ -156,7 +160,20 @@ class RetryTask(ConfiguredTask):
             # Return early with the previous results as the past invocation was successful
             return self.previous_results
 
+        # The previous invocation saved the part of its graph with the nodes to retry, which
+        # saves linking the project again if no dependencies have changed since.
+        retry_graph = read_retry_graph(
+            self.retry_graph_path, self.manifest, self.previous_command_name, unique_ids
+        )
+
         class TaskWrapper(self.task_class):
+            def compile_manifest(self):
+                if retry_graph is None:
+                    return super().compile_manifest()
+                self.compiler.initialize()
+                self.graph = retry_graph
+                self.compiler.print_stats(self.manifest)
+
             def get_graph_queue(self):
                 new_graph = self.graph.get_subset_graph(unique_ids)
                 return GraphQueue(
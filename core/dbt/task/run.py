@@ -56,6 +56,7 @@ from dbt.graph.thread_pool import DbtThreadPool
 from dbt.hooks import get_hook_dict
 from dbt.materializations.incremental.microbatch import MicrobatchBuilder
 from dbt.node_types import NodeType, RunHookType
+from dbt.profiler import span
 from dbt.task import group_lookup
 from dbt.task.base import BaseRunner
 from dbt.task.compile import CompileRunner, CompileTask
@@ -1015,7 +1016,10 @@ class RunTask(CompileTask):
                 failures = 1
 
                 if not failed:
-                    with collect_timing_info("compile", timing.append):
+                    with (
+                        collect_timing_info("compile", timing.append),
+                        span("compile", category="node", unique_id=hook.unique_id),
+                    ):
                         sql = self.get_hook_sql(
                             adapter, hook, hook.index, num_hooks, extra_context
                         )
@@ -1036,7 +1040,10 @@ class RunTask(CompileTask):
                         )
                     )
 
-                    with collect_timing_info("execute", timing.append):
+                    with (
+                        collect_timing_info("execute", timing.append),
+                        span("execute", category="node", unique_id=hook.unique_id),
+                    ):
                         status, message = get_execution_status(sql, adapter)
 
                     finished_at = timing[1].completed_at or datetime.now(timezone.utc).replace(
@@ -2,6 +2,7 @@ import os
 import time
 from abc import abstractmethod
 from concurrent.futures import as_completed
+from contextlib import suppress
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import (
@@ -32,8 +33,9 @@ from dbt.artifacts.schemas.results import (
 )
 from dbt.artifacts.schemas.run import RunExecutionResult, RunResult
 from dbt.cli.flags import Flags
+from dbt.compilation import write_retry_graph
 from dbt.config.runtime import RuntimeConfig
-from dbt.constants import RUN_RESULTS_FILE_NAME
+from dbt.constants import RETRY_GRAPH_FILE_NAME, RUN_RESULTS_FILE_NAME
 from dbt.contracts.graph.manifest import Manifest
 from dbt.contracts.graph.nodes import Exposure, ResultNode
 from dbt.contracts.state import PreviousState
@@ -73,6 +75,8 @@ from dbt_common.events.functions import fire_event, warn_or_error
 from dbt_common.events.types import Formatting
 from dbt_common.exceptions import NotImplementedError
 
+SUCCESSFUL_STATUSES = frozenset((NodeStatus.Success, NodeStatus.Pass, NodeStatus.NoOp))
+
 
 class GraphRunnableMode(StrEnum):
     Topological = "topological"
@@ -647,10 +651,34 @@ class GraphRunnableTask(ConfiguredTask):
                         artifact_type=result.__class__.__name__, artifact_path=self.result_path()
                     )
                 )
+            self.write_retry_graph(result.results)
 
         self.task_end_messages(result.results)
         return result
 
+    def write_retry_graph(self, results) -> None:
+        """Save the graph of the nodes that didn't succeed, for `dbt retry` to start from.
+
+        Unlike the linked graph file, this is the subset graph that retry runs, with the test
+        edges of build, so retry doesn't have to add those or take the subset of the whole
+        graph again. Taking the subset is about as slow as linking, so it is only done when
+        there is something to retry.
+        """
+        path = os.path.join(self.config.project_target_path, RETRY_GRAPH_FILE_NAME)
+        if self.manifest is not None and self.graph is not None:
+            unique_ids = [
+                result.node.unique_id
+                for result in results
+                if result.status not in SUCCESSFUL_STATUSES
+                and result.node.unique_id in self.graph.graph
+            ]
+            if unique_ids:
+                write_retry_graph(path, self.graph, self.manifest, self.args.which, unique_ids)
+                return
+        # nothing to retry, and the file of an earlier invocation doesn't describe this one
+        with suppress(FileNotFoundError):
+            os.remove(path)
+
     @classmethod
     def interpret_results(cls, results):
         if results is None:
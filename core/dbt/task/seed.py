@@ -12,7 +12,7 @@ from dbt.task.printer import print_run_end_messages
 from dbt.task.run import ModelRunner, RunTask
 from dbt_common.events.base_types import EventLevel
 from dbt_common.events.functions import fire_event
-from dbt_common.events.types import Formatting
+from dbt_common.events.types import Formatting, Note
 from dbt_common.exceptions import DbtInternalError
 
 
@@ -57,6 +57,20 @@ class SeedRunner(ModelRunner):
             ),
             level=level,
         )
+        self._print_load_rate(result)
+
+    def _print_load_rate(self, result) -> None:
+        rows_affected = (result.adapter_response or {}).get("rows_affected")
+        if result.status == NodeStatus.Error or not rows_affected or not result.execution_time:
+            return
+        rows_per_second = int(rows_affected) / result.execution_time
+        fire_event(
+            Note(
+                msg=f"Loaded {rows_affected} rows into seed {self.node.schema}.{result.node.alias} "
+                f"in {result.execution_time:.2f}s ({rows_per_second:.0f} rows/sec)"
+            ),
+            level=EventLevel.DEBUG,
+        )
 
 
 class SeedTask(RunTask):
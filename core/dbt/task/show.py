@@ -1,8 +1,13 @@
+import csv
 import io
+import json
 import threading
 import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
+from dbt.adapters.contracts.connection import AdapterResponse
 from dbt.adapters.factory import get_adapter
+from dbt.adapters.sql import SQLConnectionManager
 from dbt.artifacts.schemas.run import RunResult, RunStatus
 from dbt.context.providers import generate_runtime_model_context
 from dbt.contracts.graph.nodes import SeedNode
@@ -15,6 +20,102 @@ from dbt_common.events.base_types import EventLevel
 from dbt_common.events.functions import fire_event
 from dbt_common.events.types import Note
 from dbt_common.exceptions import DbtRuntimeError
+from dbt_common.utils.encoding import ForgivingJSONEncoder
+
+if TYPE_CHECKING:
+    import agate
+
+# Number of rows fetched from the cursor at a time when streaming results to a file
+SHOW_FETCH_CHUNK_SIZE = 10000
+# Number of rows previewed when all rows are streamed to a file (--limit -1)
+SHOW_STREAMED_PREVIEW_ROWS = 5
+
+
+def _write_table(table: "agate.Table", output_file: str, output_format: str) -> None:
+    with open(output_file, "w", encoding="utf-8", newline="") as fp:
+        if output_format == "json":
+            table.to_json(path=fp)
+        else:
+            table.to_csv(path=fp)
+
+
+def _deduplicate_column_names(column_names: List[str]) -> List[str]:
+    """Rename repeated column names the way adapters name the columns of a result table: the
+    second `id` becomes `id_2`, the third `id_3` and so on.
+    """
+    counts: Dict[str, int] = {}
+    unique_names = []
+    for name in column_names:
+        counts[name] = counts.get(name, 0) + 1
+        unique_names.append(name if counts[name] == 1 else f"{name}_{counts[name]}")
+    return unique_names
+
+
+def stream_query_results(
+    adapter,
+    sql: str,
+    output_file: str,
+    output_format: str,
+    limit: Optional[int] = None,
+    chunk_size: int = SHOW_FETCH_CHUNK_SIZE,
+) -> Tuple[AdapterResponse, "agate.Table", int]:
+    """Execute the sql and write the rows it returns to output_file, as a json list of
+    objects when output_format is json and as csv otherwise. Rows are fetched from the
+    cursor in chunks, so only the previewed rows are kept in memory.
+
+    Returns the adapter response, a table of the previewed rows (at most `limit` rows,
+    or SHOW_STREAMED_PREVIEW_ROWS when there is no limit) and the number of rows written.
+    """
+    from dbt_common.clients.agate_helper import table_from_data_flat
+
+    preview_limit = SHOW_STREAMED_PREVIEW_ROWS if limit is None else limit
+    connections = adapter.connections
+    if not isinstance(connections, SQLConnectionManager):
+        # Not a sql adapter, so there is no cursor to stream rows from. Other connection
+        # managers have add_select_query too, but it raises NotImplementedError.
+        response, table = adapter.execute(sql, fetch=True, limit=limit)
+        _write_table(table, output_file, output_format)
+        return response, table.limit(preview_limit), len(table.rows)
+
+    _, cursor = connections.add_select_query(sql)
+    response = connections.get_response(cursor)
+
+    column_names: List[str] = []
+    if cursor.description is not None:
+        column_names = _deduplicate_column_names([col[0] for col in cursor.description])
+
+    preview_rows: List[Any] = []
+    num_rows = 0
+    with open(output_file, "w", encoding="utf-8", newline="") as fp:
+        csv_writer = csv.writer(fp)
+        if output_format == "json":
+            fp.write("[")
+        else:
+            csv_writer.writerow(column_names)
+
+        while column_names and (limit is None or num_rows < limit):
+            fetch_size = chunk_size if limit is None else min(chunk_size, limit - num_rows)
+            rows = cursor.fetchmany(fetch_size)
+            if not rows:
+                break
+            if len(preview_rows) < preview_limit:
+                preview_rows.extend(rows[: preview_limit - len(preview_rows)])
+            if output_format == "json":
+                for row in rows:
+                    fp.write(",\n" if num_rows else "\n")
+                    fp.write(json.dumps(dict(zip(column_names, row)), cls=ForgivingJSONEncoder))
+                    num_rows += 1
+            else:
+                csv_writer.writerows(rows)
+                num_rows += len(rows)
+
+        if output_format == "json":
+            fp.write("\n]\n" if num_rows else "]\n")
+
+    preview = table_from_data_flat(
+        connections.process_results(column_names, preview_rows), column_names
+    )
+    return response, preview, num_rows
 
 
 class ShowRunner(CompileRunner):
@@ -39,9 +140,22 @@ class ShowRunner(CompileRunner):
                 "limit": limit,
             },
         )
-        adapter_response, execute_result = self.adapter.execute(
-            compiled_node.compiled_code, fetch=True
-        )
+        output_file = getattr(self.config.args, "output_file", None)
+        if output_file:
+            adapter_response, execute_result, num_rows = stream_query_results(
+                self.adapter,
+                compiled_node.compiled_code,
+                output_file,
+                self.config.args.output,
+                limit=limit,
+            )
+            fire_event(
+                Note(msg=f"Wrote {num_rows} rows from '{compiled_node.name}' to {output_file}")
+            )
+        else:
+            adapter_response, execute_result = self.adapter.execute(
+                compiled_node.compiled_code, fetch=True
+            )
 
         end_time = time.time()
 
@@ -64,6 +178,8 @@ class ShowTask(CompileTask):
         if not (self.args.select or getattr(self.args, "inline", None)):
             raise DbtRuntimeError("Either --select or --inline must be passed to show")
         super()._runtime_initialize()
+        if getattr(self.args, "output_file", None) and len(self._flattened_nodes or []) != 1:
+            raise DbtRuntimeError("--output-file can only be used when showing a single node")
 
     def get_runner_type(self, node):
         if isinstance(node, SeedNode):
@@ -129,7 +245,14 @@ class ShowTaskDirect(ConfiguredTask):
         adapter = get_adapter(self.config)
         with adapter.connection_named("show", should_release_connection=False):
             limit = None if self.args.limit < 0 else self.args.limit
-            response, table = adapter.execute(self.args.inline_direct, fetch=True, limit=limit)
+            output_file = getattr(self.args, "output_file", None)
+            if output_file:
+                response, table, num_rows = stream_query_results(
+                    adapter, self.args.inline_direct, output_file, self.args.output, limit=limit
+                )
+                fire_event(Note(msg=f"Wrote {num_rows} rows to {output_file}"))
+            else:
+                response, table = adapter.execute(self.args.inline_direct, fetch=True, limit=limit)
 
             output = io.StringIO()
             if self.args.output == "json":
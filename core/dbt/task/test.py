@@ -2,6 +2,7 @@ import io
 import json
 import re
 import threading
+from collections import Counter
 from dataclasses import dataclass
 from typing import (
     TYPE_CHECKING,
@@ -260,8 +261,11 @@ class TestRunner(CompileRunner):
 
         # generate diff, if exists
         should_error, diff = False, None
-        daff_diff = self._get_daff_diff(expected, actual)
-        if daff_diff.hasDifference():
+        # daff is only needed to render differences, so skip it when the row contents match
+        daff_diff = (
+            self._get_daff_diff(expected, actual) if tables_differ(expected, actual) else None
+        )
+        if daff_diff is not None and daff_diff.hasDifference():
             should_error = True
             rendered = self._render_daff_diff(daff_diff)
             rendered = f"\n\n{green('actual')} differs from {red('expected')}:\n\n{rendered}\n"
@@ -462,3 +466,31 @@ def list_rows_from_table(table: "agate.Table", sort: bool = False) -> List[Any]:
         rows = sorted(rows, key=lambda x: [(elem is None, elem) for elem in x])
 
     return [header] + rows
+
+
+def _row_counts_from_table(table: "agate.Table") -> Counter:
+    """
+    Count the rows of the given table by their cell values, built column by column.
+
+    Cells are keyed by their string representation, with None kept distinct, which mirrors
+    how daff compares cell values.
+    """
+    columns = [
+        [None if value is None else str(value) for value in column.values()]
+        for column in table.columns
+    ]
+    if not columns:
+        return Counter({(): len(table.rows)})
+    return Counter(zip(*columns))
+
+
+def tables_differ(expected: "agate.Table", actual: "agate.Table") -> bool:
+    """
+    Order-insensitive comparison of two tables, equivalent to checking whether an unordered
+    daff diff of the same tables has any difference, without building daff structures.
+    """
+    if list(expected.column_names) != list(actual.column_names):
+        return True
+    if len(expected.rows) != len(actual.rows):
+        return True
+    return _row_counts_from_table(expected) != _row_counts_from_table(actual)
@@ -1,10 +1,13 @@
 import os
 import platform
+import queue
+import threading
+import time
 import traceback
 import uuid
 from contextlib import contextmanager
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Union
 
 import pytz
 import requests
@@ -104,7 +107,8 @@ class TimeoutEmitter(Emitter):
         )
 
         self._log_result("GET", r.status_code)
-        return r
+        # the emitter checks the status code to decide which events to keep for a retry
+        return r.status_code
 
     def http_get(self, payload):
         self._log_request("GET", payload)
@@ -112,7 +116,7 @@ class TimeoutEmitter(Emitter):
         r = requests.get(self.endpoint, params=payload, timeout=5.0)
 
         self._log_result("GET", r.status_code)
-        return r
+        return r.status_code
 
 
 emitter = TimeoutEmitter()
@@ -122,6 +126,73 @@ tracker = Tracker(
     app_id="dbt",
 )
 
+# Events waiting to be handed to the tracker. Events tracked while the queue is full are
+# dropped, rather than making the caller wait for the network.
+MAX_QUEUED_EVENTS = 1000
+# How long flush() waits for queued events to be sent, at the end of an invocation.
+FLUSH_TIMEOUT = 2.0
+
+
+class EventQueue:
+    """Hands tracking events to the tracker from a background thread.
+
+    The tracker sends events in batches (see INIT_KW_ARGS) as part of tracking the event
+    that fills a batch, and a send can take up to the request timeout. Tracking from the
+    background thread means that model runs, parsing, etc. never wait on the collector.
+    """
+
+    def __init__(self, maxsize: int = MAX_QUEUED_EVENTS) -> None:
+        self._queue: "queue.Queue[Union[StructuredEvent, threading.Event]]" = queue.Queue(maxsize)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def put(self, event: StructuredEvent) -> None:
+        self._start()
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            fire_event(SendEventFailure())
+
+    def flush(self, timeout: float = FLUSH_TIMEOUT) -> bool:
+        """Wait for the queued events to be sent, for at most `timeout` seconds.
+
+        Returns False if they weren't all sent in time. They are still sent in the
+        background, for as long as the process runs.
+        """
+        self._start()
+        deadline = time.monotonic() + timeout
+        flushed = threading.Event()
+        try:
+            self._queue.put(flushed, timeout=timeout)
+        except queue.Full:
+            return False
+        return flushed.wait(max(deadline - time.monotonic(), 0))
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                # a daemon thread, so that a blocked send can't keep dbt from exiting
+                self._thread = threading.Thread(target=self._run, name="dbt-tracking", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if isinstance(item, threading.Event):
+                try:
+                    tracker.flush()
+                except Exception:
+                    fire_event(FlushEventsFailure())
+                item.set()
+            else:
+                try:
+                    tracker.track(item)
+                except Exception:
+                    fire_event(SendEventFailure())
+
+
+event_queue = EventQueue()
+
 
 class User:
     def __init__(self, cookie_dir) -> None:
@@ -222,7 +293,9 @@ def track(user, *args, **kwargs):
 
     fire_event(SendingEvent(kwargs=str(kwargs)))
     try:
-        tracker.track(StructuredEvent(*args, **kwargs))
+        # The event carries the current subject, since the user's tracking state may have
+        # changed by the time the event queue gets to it.
+        event_queue.put(StructuredEvent(*args, event_subject=tracker.subject, **kwargs))
     except Exception:
         fire_event(SendEventFailure())
 
@@ -478,9 +551,7 @@ def track_artifact_upload(options):
 
 def flush():
     fire_event(FlushEvents())
-    try:
-        tracker.flush()
-    except Exception:
+    if not event_queue.flush():
         fire_event(FlushEventsFailure())
 
 
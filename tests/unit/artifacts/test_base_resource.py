@@ -2,7 +2,7 @@ from dataclasses import dataclass
 
 import pytest
 
-from dbt.artifacts.resources.base import BaseResource
+from dbt.artifacts.resources.base import BaseResource, FileHash
 from dbt.artifacts.resources.types import NodeType
 
 
@@ -56,3 +56,28 @@ class TestMinorSchemaChange:
     ):
         # new code (using class without default field) can create an instance of itself given old data (class with old field)
         BaseResource.from_dict(base_resource_new_default_field.to_dict())
+
+
+class TestFileHash:
+    @pytest.mark.parametrize(
+        "contents",
+        [
+            b"",
+            b"  \n",
+            b"a,b\n1,2",
+            b"\n a,b\r\n1,2\r\n\n",
+            b"\x1ca,b\n1,\xc3\xa9\x1f\t",
+            # unicode whitespace: U+00A0, U+2028 and U+3000
+            "\u00a0a,b\n1,2\u2028\n\u3000".encode("utf-8"),
+            "\u2028\u00a0 \u3000".encode("utf-8"),
+            # non-whitespace multi-byte characters at the edges: U+00E9 and U+1F600
+            "\u00e9a,b\n1,\U0001f600".encode("utf-8"),
+        ],
+    )
+    def test_from_file_matches_from_contents(self, tmp_path, contents):
+        path = tmp_path / "seed.csv"
+        path.write_bytes(contents)
+
+        file_hash = FileHash.from_file(str(path), chunk_size=2)
+
+        assert file_hash == FileHash.from_contents(contents.decode("utf-8").strip())
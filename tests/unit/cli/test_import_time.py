@@ -0,0 +1,32 @@
+import json
+import subprocess
+import sys
+
+# Modules that only some commands need, and that dominate the cost of importing them. They
+# are imported on first use, so that `dbt --help`, `dbt --version` and commands that never
+# build a manifest don't pay for them.
+DEFERRED_MODULES = [
+    "agate",
+    "dbt.adapters.factory",
+    "dbt.config.runtime",
+    "dbt.context.providers",
+    "dbt.contracts.graph.manifest",
+    "dbt.parser.manifest",
+    "dbt.task.base",
+    "dbt.tracking",
+    "networkx",
+]
+
+
+def _run_python(code: str) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+
+class TestImportTime:
+    def test_deferred_modules_not_imported(self):
+        result = _run_python(
+            "import json, sys; import dbt.cli.main; print(json.dumps(sorted(sys.modules)))"
+        )
+        imported = set(json.loads(result.stdout))
+
+        assert [module for module in DEFERRED_MODULES if module in imported] == []
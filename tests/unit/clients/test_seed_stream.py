@@ -0,0 +1,68 @@
+import agate
+import pytest
+
+from dbt.clients.seed_stream import SeedStream
+from dbt.exceptions import LoadAgateTableValueError
+from dbt_common.clients import agate_helper
+from tests.unit.utils.manifest import make_seed
+
+SEED_CSV = """id,name,amount,created_at
+1,alice,1.5,2024-01-01
+2,bob,,2024-01-02
+3,carol,3.25,2024-01-03
+4,dave,4,2024-01-04
+5,erin,5.5,2024-01-05
+"""
+
+
+@pytest.fixture
+def seed_path(tmp_path):
+    path = tmp_path / "seed.csv"
+    path.write_text(SEED_CSV, encoding="utf-8")
+    return str(path)
+
+
+class TestSeedStream:
+    def test_chunks_match_full_table(self, seed_path):
+        full_table = agate_helper.from_csv(seed_path, text_columns=[])
+        stream = SeedStream(seed_path, text_columns=[])
+
+        chunks = list(stream.chunks(2))
+
+        assert [len(chunk.rows) for chunk in chunks] == [2, 2, 1]
+        assert stream.rows_loaded == 5
+        assert stream.column_names == full_table.column_names
+        assert [type(t) for t in stream.column_types] == [type(t) for t in full_table.column_types]
+        streamed_rows = [tuple(row) for chunk in chunks for row in chunk.rows]
+        assert streamed_rows == [tuple(row) for row in full_table.rows]
+
+    def test_sample_table(self, seed_path):
+        stream = SeedStream(seed_path, text_columns=[], sample_size=2)
+
+        assert len(stream.sample_table.rows) == 2
+        assert stream.sample_table.original_abspath == seed_path
+
+    def test_text_columns(self, seed_path):
+        stream = SeedStream(seed_path, text_columns=["id"])
+
+        assert isinstance(stream.column_types[0], agate.data_types.Text)
+        assert next(stream.chunks()).rows[0]["id"] == "1"
+
+    def test_value_outside_of_sample(self, tmp_path):
+        path = tmp_path / "seed.csv"
+        path.write_text("id\n1\n2\nthree\n", encoding="utf-8")
+        node = make_seed("pkg", "seed")
+        stream = SeedStream(str(path), text_columns=[], sample_size=2, node=node)
+
+        with pytest.raises(LoadAgateTableValueError, match="column_types") as exc_info:
+            list(stream.chunks())
+        assert exc_info.value.node is node
+        assert "in seed seed (data/seed.csv)" in str(exc_info.value)
+
+    def test_bom_and_delimiter(self, tmp_path):
+        path = tmp_path / "seed.csv"
+        path.write_text("\ufeffid|name\n1|alice\n", encoding="utf-8")
+        stream = SeedStream(str(path), text_columns=[], delimiter="|")
+
+        assert stream.column_names == ("id", "name")
+        assert list(next(stream.chunks()).rows[0]) == [1, "alice"]
@@ -111,3 +111,21 @@ def test_checked_load():
     # in override anchors.
     # real_override_dupes_issues = checked_load(override__yml)[1]
     # assert len(real_override_dupes_issues) == 1
+
+
+def test_checked_load_duplicate_messages():
+    contents, issues = checked_load(nested_dupe__yml)
+
+    assert contents == {"a": {"b": 1}, "c": {"d": 3, "e": 2}}
+    assert len(issues) == 1
+    assert issues[0].failure_type == "duplicate_key"
+    assert issues[0].message.startswith("Duplicate key 'd'")
+    assert issues[0].message.endswith("line 8, column 3")
+
+
+def test_checked_load_non_string_keys():
+    issues = checked_load("1: a\n2: b\n1: c\n")[1]
+    assert len(issues) == 1
+    assert issues[0].message.startswith("Duplicate key '1'")
+
+    assert checked_load("1: a\n'1': b\n")[1] == []
@@ -11,6 +11,7 @@ from tests.unit.utils.event_manager import *  # noqa
 from tests.unit.utils.flags import *  # noqa
 from tests.unit.utils.manifest import *  # noqa
 from tests.unit.utils.project import *  # noqa
+from tests.unit.utils.tracking import *  # noqa
 
 
 @pytest.fixture
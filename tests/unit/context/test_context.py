@@ -1,4 +1,5 @@
 import os
+from dataclasses import replace
 from typing import Any, Dict, Set
 from unittest import mock
 
@@ -72,7 +73,13 @@ class TestVar:
 
     @pytest.fixture
     def config(self, provider):
-        return mock.MagicMock(config_version=2, vars=provider, cli_vars={}, project_name="root")
+        return mock.MagicMock(
+            config_version=2,
+            vars=provider,
+            cli_vars={},
+            project_name="root",
+            merged_vars_cache={},
+        )
 
     def test_var_default_something(self, model, config, context):
         config.cli_vars = {"foo": "baz"}
@@ -115,6 +122,25 @@ class TestVar:
         assert var("foo", "bar") == "bar"
         assert var("foo") is None
 
+    def test_merged_vars_cached_per_package(self, model, config, context):
+        config.vars = VarProvider({"foo": "global", "root": {"bar": "root"}})
+        config.cli_vars = {"baz": "cli"}
+        var = providers.RuntimeVar(context, config, model)
+        assert (var("foo"), var("bar"), var("baz")) == ("global", "root", "cli")
+
+        with mock.patch.object(VarProvider, "vars_for") as vars_for:
+            other_model = replace(model, name="model_two", unique_id="model.root.model_two")
+            var = providers.RuntimeVar(context, config, other_model)
+            assert (var("foo"), var("bar"), var("baz")) == ("global", "root", "cli")
+        vars_for.assert_not_called()
+
+    def test_merged_vars_cache_checks_cli_vars(self, model, config, context):
+        config.cli_vars = {"foo": "baz"}
+        assert providers.RuntimeVar(context, config, model)("foo") == "baz"
+
+        config.cli_vars = {"foo": "override"}
+        assert providers.RuntimeVar(context, config, model)("foo") == "override"
+
 
 class TestParseWrapper:
     @pytest.fixture
@@ -224,6 +250,7 @@ REQUIRED_MACRO_KEYS = REQUIRED_QUERY_HEADER_KEYS | {
     "render",
     "try_or_compiler_error",
     "load_agate_table",
+    "load_agate_table_stream",
     "ref",
     "source",
     "metric",
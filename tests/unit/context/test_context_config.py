@@ -0,0 +1,121 @@
+import os
+from argparse import Namespace
+from unittest import mock
+
+import pytest
+
+from dbt.adapters.postgres import PostgresAdapter
+from dbt.context.context_config import ContextConfig
+from dbt.node_types import NodeType
+from tests.unit.utils import config_from_parts_or_dicts
+
+PROFILE_DATA = {
+    "target": "test",
+    "quoting": {},
+    "outputs": {
+        "test": {
+            "type": "postgres",
+            "host": "localhost",
+            "schema": "analytics",
+            "user": "test",
+            "pass": "test",
+            "dbname": "test",
+            "port": 1,
+        }
+    },
+}
+
+PROJECT_DATA = {
+    "name": "root",
+    "version": "0.1",
+    "profile": "test",
+    "project-root": os.getcwd(),
+    "config-version": 2,
+    "models": {
+        "+meta": {"owner": "data"},
+        "root": {
+            "+materialized": "table",
+            "staging": {
+                "+materialized": "view",
+                "+tags": ["staging"],
+            },
+        },
+    },
+}
+
+
+@pytest.fixture
+def config():
+    flags = Namespace(state_modified_compare_more_unrendered_values=True)
+    with mock.patch(
+        "dbt.context.context_config.get_config_class_by_name",
+        return_value=PostgresAdapter.AdapterSpecificConfigs,
+    ), mock.patch("dbt.context.context_config.get_flags", return_value=flags):
+        yield config_from_parts_or_dicts(PROJECT_DATA, PROFILE_DATA)
+
+
+def build_config_dict(config, fqn, config_call=None, rendered=True):
+    context_config = ContextConfig(config, fqn, NodeType.Model, "root")
+    if config_call:
+        context_config.add_config_call(config_call)
+        context_config.add_unrendered_config_call(config_call)
+    return context_config.build_config_dict(rendered=rendered)
+
+
+class TestFqnConfigCache:
+    def test_project_configs_by_fqn(self, config):
+        staging = build_config_dict(config, ["root", "staging", "stg_orders"])
+        marts = build_config_dict(config, ["root", "marts", "orders"])
+
+        assert staging["materialized"] == "view"
+        assert staging["tags"] == ["staging"]
+        assert staging["meta"] == {"owner": "data"}
+        assert marts["materialized"] == "table"
+        assert marts["tags"] == []
+
+    def test_cached_configs_are_not_shared(self, config):
+        first = build_config_dict(
+            config, ["root", "staging", "a"], config_call={"tags": ["a"], "meta": {"x": 1}}
+        )
+        second = build_config_dict(config, ["root", "staging", "b"])
+
+        assert first["tags"] == ["staging", "a"]
+        assert first["meta"] == {"owner": "data", "x": 1}
+        assert second["tags"] == ["staging"]
+        assert second["meta"] == {"owner": "data"}
+
+        first["meta"]["owner"] = "changed"
+        third = build_config_dict(config, ["root", "staging", "c"])
+        assert third["meta"] == {"owner": "data"}
+
+    def test_cache_is_populated_per_prefix(self, config):
+        build_config_dict(config, ["root", "staging", "a"])
+        build_config_dict(config, ["root", "staging", "a"], rendered=False)
+
+        cached = {
+            key[0].__name__: sorted(prefixes)
+            for key, (_, prefixes) in config.fqn_config_cache.items()
+        }
+        assert cached == {
+            "ContextConfigGenerator": [(), ("root",), ("root", "staging")],
+            "UnrenderedConfigGenerator": [(), ("root",), ("root", "staging")],
+        }
+
+    def test_replaced_project_configs_are_not_cached(self, config):
+        assert build_config_dict(config, ["root", "a"])["materialized"] == "table"
+
+        config.models = {"+materialized": "incremental"}
+
+        assert build_config_dict(config, ["root", "a"])["materialized"] == "incremental"
+
+    def test_unrendered_config(self, config):
+        unrendered = build_config_dict(
+            config, ["root", "staging", "a"], config_call={"alias": "b"}, rendered=False
+        )
+
+        assert unrendered == {
+            "meta": {"owner": "data"},
+            "materialized": "view",
+            "tags": ["staging"],
+            "alias": "b",
+        }
@@ -51,6 +51,7 @@ from tests.unit.utils import (
     inject_plugin,
     make_manifest,
 )
+from tests.unit.utils.manifest import make_model
 
 REQUIRED_PARSED_NODE_KEYS = frozenset(
     {
@@ -2244,3 +2245,78 @@ class TestDisabledLookup:
         lookup = DisabledLookup(manifest)
 
         assert lookup.find("name", "package", resource_types=[]) is None
+
+
+class TestRefableLookupVersions:
+    @pytest.fixture
+    def manifest(self):
+        return make_manifest(
+            nodes=[
+                make_model("root", "my_model", "", version=v, latest_version=2) for v in (10, 2, 1)
+            ]
+            + [make_model("other", "my_model", "", version=20, latest_version=20)]
+        )
+
+    def test_versions_are_sorted_per_package(self, manifest):
+        assert [v.v for v in manifest.ref_lookup.versions[("root", "my_model")]] == [1, 2, 10]
+        assert [v.v for v in manifest.ref_lookup.versions[("other", "my_model")]] == [20]
+
+    @mock.patch("dbt.contracts.graph.manifest.fire_event")
+    @mock.patch("dbt.contracts.graph.manifest.get_node_info", return_value={"unique_id": "x"})
+    def test_unpinned_ref_to_older_latest_version(self, _, fire_event, manifest):
+        node = manifest.ref_lookup.find("my_model", "root", None, manifest)
+
+        assert node.unique_id == "model.root.my_model.v2"
+        (event,), _ = fire_event.call_args
+        assert (event.ref_node_package, event.ref_max_version) == ("root", "10")
+
+        fire_event.reset_mock()
+        manifest.ref_lookup.find("my_model", "other", None, manifest)
+        fire_event.assert_not_called()
+
+
+class TestMacroResolution:
+    def test_macro_candidates_are_reused_until_macros_change(self):
+        manifest = make_manifest(macros=[MockMacro("dbt"), MockMacro("dep")])
+        with mock.patch(
+            "dbt.contracts.graph.manifest.get_adapter_package_names", return_value=["dbt"]
+        ) as get_adapter_package_names:
+            assert manifest.find_macro_by_name("my_macro", "root", None).package_name == "dep"
+            assert manifest.find_macro_by_name("my_macro", "root", "dbt").package_name == "dbt"
+            assert get_adapter_package_names.call_count == 1
+
+            root_macro = MockMacro("root")
+            manifest.add_macro(mock.MagicMock(macros=[]), root_macro)
+            assert manifest.find_macro_by_name("my_macro", "root", None) is root_macro
+
+            manifest.remove_macro(root_macro.unique_id)
+            assert manifest.find_macro_by_name("my_macro", "root", None).package_name == "dep"
+            assert get_adapter_package_names.call_count == 3
+
+    @mock.patch("dbt.contracts.graph.manifest.deprecations.warn")
+    @mock.patch.object(Manifest, "_get_parent_adapter_types", return_value=["default"])
+    def test_materialization_is_resolved_once(self, _, warn):
+        set_from_args(
+            Namespace(REQUIRE_EXPLICIT_PACKAGE_OVERRIDES_FOR_BUILTIN_MATERIALIZATIONS=False),
+            None,
+        )
+        manifest = make_manifest(macros=[MockMaterialization("dbt"), MockMaterialization("dep")])
+
+        resolve_materialization_macro = manifest._resolve_materialization_macro
+        with mock.patch.object(
+            manifest, "_resolve_materialization_macro", wraps=resolve_materialization_macro
+        ) as resolve:
+            for _ in range(2):
+                macro = manifest.find_materialization_macro_by_name(
+                    "root", "my_materialization", "postgres"
+                )
+                assert macro.package_name == "dep"
+            assert resolve.call_count == 1
+
+        # the legacy override is still reported each time
+        assert warn.call_count == 2
+        warn.assert_called_with(
+            "package-materialization-override",
+            package_name="dep",
+            materialization_name="my_materialization",
+        )
@@ -1,8 +1,11 @@
+import json
+
 import networkx as nx
 import pytest
 
 from dbt.contracts.graph.manifest import Manifest
 from dbt.graph.queue import GraphQueue
+from dbt.profiler import timeline
 from tests.unit.utils import MockNode, make_manifest
 
 
@@ -45,3 +48,14 @@ class TestGraphQueue:
             "model.test_package.upstream_model",
             "model.test_package.downstream_model",
         }
+
+    def test_get_records_queue_wait(self, manifest, graph, tmp_path):
+        outfile = tmp_path / "timeline.json"
+        with timeline(str(outfile)):
+            graph_queue = GraphQueue(graph=graph, manifest=manifest, selected={})
+            graph_queue.get()
+
+        (event,) = json.loads(outfile.read_text())["traceEvents"][1:]
+        assert event["name"] == "queue_wait"
+        assert event["args"] == {"unique_id": "model.test_package.upstream_model"}
+        assert not graph_queue._queued_at
@@ -19,8 +19,14 @@ import dbt_common.exceptions
 from dbt.config.runtime import RuntimeConfig
 from dbt.flags import set_from_args
 from dbt.graph import NodeSelector, parse_difference
+from dbt.graph.selector_spec import IndirectSelection
 from dbt.node_types import NodeType
-from tests.unit.utils.manifest import make_manifest, make_model
+from tests.unit.utils.manifest import (
+    make_generic_test,
+    make_manifest,
+    make_model,
+    make_not_null_test,
+)
 
 set_from_args(Namespace(WARN_ERROR=False), None)
 
@@ -137,6 +143,25 @@ def test_run_specs(include, exclude, expected, graph, mock_manifest_with_mock_gr
     assert selected == expected
 
 
+def test_repeated_criteria_are_selected_once(graph, mock_manifest_with_mock_graph, mocker):
+    selector = graph_selector.NodeSelector(graph, mock_manifest_with_mock_graph)
+    select_included = mocker.spy(selector, "select_included")
+    select_parents = mocker.spy(selector.graph, "select_parents")
+
+    spec = graph_cli.parse_difference(["tag:abc,+f", "tag:bcef,+f", "+Y.f"], ["tag:abc,+f"])
+    selected, _ = selector.select_nodes(spec)
+
+    assert selected == {"m.Y.f"}
+    # tag:abc, +f, tag:bcef, +Y.f
+    assert select_included.call_count == 4
+    # "+f" and "+Y.f" select the same node, so its parents are only looked up once
+    assert select_parents.call_count == 1
+
+    # results handed out can be changed without affecting later selections
+    selected.clear()
+    assert selector.select_nodes(spec)[0] == {"m.Y.f"}
+
+
 param_specs = [
     ("a", False, None, False, None, "fqn", "a", False),
     ("+a", True, None, False, None, "fqn", "a", False),
@@ -323,3 +348,77 @@ class TestNodeSelector:
         # Ensure that --indirect-selection empty returns the same result
         spec.indirect_selection = graph_selector.IndirectSelection.Empty
         assert selector.get_selected(spec) == {"model.pkg.model_two"}
+
+    @pytest.mark.parametrize(
+        "raw,indirect_selection",
+        [
+            ("model_one", IndirectSelection.Eager),
+            ("model_one", IndirectSelection.Cautious),
+            ("model_one", IndirectSelection.Empty),
+            ("tag:a", IndirectSelection.Eager),
+            ("tag:a", IndirectSelection.Cautious),
+            ("path:models", IndirectSelection.Eager),
+        ],
+    )
+    def test_select_without_graph(self, runtime_config: RuntimeConfig, raw, indirect_selection):
+        model_one = make_model(pkg="pkg", name="model_one", code="select 1", tags=["a"])
+        model_two = make_model(
+            pkg="pkg",
+            name="model_two",
+            code="select * from {{ ref('model_one') }}",
+            refs=[model_one],
+            tags=["a"],
+        )
+        model_three = make_model(pkg="pkg", name="model_three", code="select 1")
+        tests = [
+            make_not_null_test("pkg", model_one, "id"),
+            make_generic_test(
+                "pkg",
+                "relationships",
+                model_two,
+                {"to": "ref('model_three')", "field": "id"},
+                refs=[model_three],
+                column_name="id",
+            ),
+        ]
+        manifest = make_manifest(nodes=[model_one, model_two, model_three, *tests])
+        graph = dbt.compilation.Compiler(runtime_config).compile(manifest, write=False)
+
+        spec = graph_selector.SelectionCriteria.from_single_spec(raw)
+        spec.indirect_selection = indirect_selection
+        assert not spec.uses_graph
+        expected = NodeSelector(graph, manifest).get_selected(spec)
+        assert NodeSelector(None, manifest).get_selected(spec) == expected
+
+    def test_select_without_graph_needs_graph(self):
+        manifest = make_manifest(nodes=[make_model(pkg="pkg", name="model_one", code="")])
+        spec = graph_selector.SelectionCriteria.from_single_spec("model_one+")
+        with pytest.raises(dbt_common.exceptions.DbtInternalError):
+            NodeSelector(None, manifest).get_selected(spec)
+
+    def test_reuses_linked_graph(self, runtime_config: RuntimeConfig, tmp_path, mocker):
+        runtime_config.target_path = str(tmp_path)
+        model_one = make_model(pkg="pkg", name="model_one", code="SELECT * FROM events")
+        model_two = make_model(
+            pkg="pkg",
+            name="model_two",
+            code='SELECT * FROM {{ ref("model_one") }}',
+            refs=[model_one],
+        )
+        link_graph = mocker.spy(dbt.compilation.Linker, "link_graph")
+        compiler = dbt.compilation.Compiler(runtime_config)
+
+        first = compiler.compile(make_manifest(nodes=[model_one, model_two]))
+        second = compiler.compile(make_manifest(nodes=[model_one, model_two]))
+        assert link_graph.call_count == 1
+        assert list(second.edges()) == list(first.edges())
+
+        # a new dependency
+        model_three = make_model(pkg="pkg", name="model_three", code="", refs=[model_two])
+        third = compiler.compile(make_manifest(nodes=[model_one, model_two, model_three]))
+        assert link_graph.call_count == 2
+        assert len(third.edges()) == 2
+
+        set_from_args(Namespace(partial_parse=False), None)
+        compiler.compile(make_manifest(nodes=[model_one, model_two, model_three]))
+        assert link_graph.call_count == 3
@@ -36,6 +36,7 @@ from tests.unit.utils.manifest import (
     make_exposure,
     make_group,
     make_macro,
+    make_manifest,
     make_metric,
     make_model,
     make_saved_query,
@@ -427,6 +428,59 @@ def test_select_config_meta(manifest):
     assert not search_manifest_using_method(manifest, list_method, "other") == {"table_model"}
 
 
+def test_select_config_values_keep_types_apart():
+    models = [
+        make_model("pkg", "bool_model", "select 1", config_kwargs={"meta": {"prop": True}}),
+        make_model("pkg", "int_model", "select 1", config_kwargs={"meta": {"prop": 1}}),
+        make_model("pkg", "list_model", "select 1", config_kwargs={"meta": {"prop": ["a"]}}),
+    ]
+    manifest = make_manifest(nodes=models)
+    method = MethodManager(manifest, None).get_method("config", ["meta", "prop"])
+
+    assert search_manifest_using_method(manifest, method, "true") == {"bool_model"}
+    assert search_manifest_using_method(manifest, method, 1) == {"bool_model", "int_model"}
+    assert search_manifest_using_method(manifest, method, "a") == {"list_model"}
+
+
+@pytest.mark.parametrize(
+    "selector",
+    [
+        "pkg",
+        "pkg.unions",
+        "union_model",
+        "mynamespace.union_model",
+        "versioned_model",
+        "versioned_model.v1",
+        "versioned_model_v2",
+        "pkg.subdirectory.*",
+        "*union*",
+        "*",
+        "table_model?",
+        "missing",
+    ],
+)
+def test_select_fqn_index_matches_scan(manifest, selector):
+    method = MethodManager(manifest, None).get_method("fqn", [])
+    included_nodes = set(manifest.nodes) | set(manifest.exposures) | set(manifest.metrics)
+    expected = {
+        unique_id
+        for unique_id, node in method.non_source_nodes(included_nodes)
+        if method.node_is_match(selector, node.fqn, node.is_versioned)
+    }
+    assert set(method.search(included_nodes, selector)) == expected
+
+
+def test_selector_index_is_shared(manifest):
+    methods = MethodManager(manifest, None)
+    tag_method = methods.get_method("tag", [])
+    assert tag_method.index is methods.get_method("package", []).index
+
+    search_manifest_using_method(manifest, tag_method, "nightly")
+    tags_index = tag_method.index._tags
+    search_manifest_using_method(manifest, methods.get_method("tag", []), "daily")
+    assert methods.index._tags is tags_index
+
+
 def test_select_test_name(manifest):
     methods = MethodManager(manifest, None)
     method = methods.get_method("test_name", [])
@@ -204,3 +204,34 @@ def test_union():
         [{"model_a", "model_b"}, {"model_b", "model_c"}, {"model_d"}]
     )
     assert combined == {"model_a", "model_b", "model_c", "model_d"}
+
+
+@pytest.mark.parametrize(
+    "raw,uses_graph",
+    [
+        ("tag:nightly", False),
+        ("path:models/marts", False),
+        ("resource_type:source", False),
+        ("model_a+", True),
+        ("+model_a", True),
+        ("2+model_a", True),
+        ("@model_a", True),
+    ],
+)
+def test_uses_graph(raw, uses_graph):
+    criteria = SelectionCriteria.from_single_spec(raw)
+    assert criteria.uses_graph is uses_graph
+    fqn_a = SelectionCriteria.from_single_spec("fqn:model_a")
+    assert SelectionUnion(components=[fqn_a, criteria]).uses_graph is uses_graph
+
+
+def test_uses_graph_buildable():
+    criteria = SelectionCriteria.from_single_spec("tag:nightly")
+    criteria.indirect_selection = IndirectSelection.Buildable
+    assert criteria.uses_graph
+
+    union = SelectionUnion(
+        components=[SelectionCriteria.from_single_spec("tag:nightly")],
+        indirect_selection=IndirectSelection.Buildable,
+    )
+    assert union.uses_graph
@@ -6,12 +6,23 @@ import pytest
 from pytest_mock import MockerFixture
 
 from dbt.adapters.postgres import PostgresAdapter
+from dbt.artifacts.resources import ColumnInfo
 from dbt.artifacts.resources.base import FileHash
 from dbt.config import RuntimeConfig
+from dbt.context.docs import DocsRuntimeContext
+from dbt.contracts.files import FilePath, ParseFileType, SourceFile
 from dbt.contracts.graph.manifest import Manifest, ManifestStateCheck
+from dbt.contracts.graph.nodes import Documentation
 from dbt.events.types import InvalidConcurrentBatchesConfig, UnusedResourceConfigPath
 from dbt.flags import set_from_args
-from dbt.parser.manifest import ManifestLoader, _warn_for_unused_resource_config_paths
+from dbt.node_types import NodeType
+from dbt.parser.manifest import (
+    DescriptionRenderer,
+    ManifestLoader,
+    _process_docs_for_node,
+    _warn_for_unused_resource_config_paths,
+    extended_mashumaro_encoder,
+)
 from dbt.parser.read_files import FileDiff
 from dbt.tracking import User
 from dbt_common.events.event_catcher import EventCatcher
@@ -35,6 +46,48 @@ class TestPartialParse:
         # if specified in flags, we use the specified path
         patched_open.assert_called_with("specified_partial_parse_path", "rb")
 
+    @patch("dbt.parser.manifest.ManifestLoader.is_partial_parsable")
+    @patch("dbt.parser.manifest.ManifestLoader.build_manifest_state_check")
+    @patch("dbt.parser.manifest.open")
+    def test_partial_parse_saved_manifest_in_memory(
+        self, patched_open, patched_state_check, patched_is_partial_parsable
+    ):
+        mock_project = MagicMock(RuntimeConfig)
+        mock_project.project_target_path = "mock_target_path"
+        saved_manifest = Manifest()
+
+        patched_is_partial_parsable.return_value = (True, None)
+        loader = ManifestLoader(mock_project, {}, saved_manifest=saved_manifest)
+        assert loader.saved_manifest is saved_manifest
+        patched_is_partial_parsable.assert_called_with(saved_manifest)
+        # the partial parsing file isn't read
+        patched_open.assert_not_called()
+
+        patched_is_partial_parsable.return_value = (False, "vars_changed")
+        loader = ManifestLoader(mock_project, {}, saved_manifest=saved_manifest)
+        assert loader.saved_manifest is None
+        patched_open.assert_not_called()
+
+    @patch("dbt.parser.manifest.ManifestLoader.is_partial_parsable")
+    @patch("dbt.parser.manifest.ManifestLoader.build_manifest_state_check")
+    def test_partial_parse_manifest_msgpack_hook(
+        self, patched_state_check, patched_is_partial_parsable, tmp_path
+    ):
+        mock_project = MagicMock(RuntimeConfig)
+        mock_project.project_target_path = str(tmp_path)
+        manifest_msgpack = Manifest().to_msgpack(extended_mashumaro_encoder)
+        (tmp_path / "partial_parse.msgpack").write_bytes(manifest_msgpack)
+        hook = MagicMock()
+
+        patched_is_partial_parsable.return_value = (True, None)
+        loader = ManifestLoader(mock_project, {}, manifest_msgpack_hook=hook)
+        hook.assert_called_once_with(manifest_msgpack)
+
+        hook.reset_mock()
+        loader.manifest = Manifest()
+        loader.write_manifest_for_partial_parse()
+        hook.assert_called_once_with((tmp_path / "partial_parse.msgpack").read_bytes())
+
     def test_profile_hash_change(self, mock_project):
         # This test validate that the profile_hash is updated when the connection keys change
         profile_hash = "750bc99c1d64ca518536ead26b28465a224be5ffc918bf2a490102faa5a1bcf5"
@@ -296,3 +349,70 @@ class TestCheckForcingConcurrentBatches:
             assert "Batches will be run sequentially" in event_catcher.caught_events[0].info.msg  # type: ignore
         else:
             assert len(event_catcher.caught_events) == 0
+
+
+class TestDescriptionRenderer:
+    @pytest.fixture
+    def args_for_flags(self) -> Namespace:
+        return Namespace(require_ref_searches_node_package_before_root=False)
+
+    @pytest.fixture
+    def docs_manifest(self) -> Manifest:
+        doc_file = SourceFile(
+            path=FilePath(
+                project_root="/users/root",
+                searched_path="models",
+                relative_path="docs.md",
+                modification_time=0.0,
+            ),
+            checksum=FileHash.from_contents("{% docs orders %}All orders{% enddocs %}"),
+            project_name="test",
+            parse_file_type=ParseFileType.Documentation,
+            docs=["doc.test.orders"],
+        )
+        doc = Documentation(
+            name="orders",
+            resource_type=NodeType.Documentation,
+            package_name="test",
+            path="docs.md",
+            original_file_path="models/docs.md",
+            unique_id="doc.test.orders",
+            block_contents="All orders",
+        )
+        manifest = Manifest(docs={doc.unique_id: doc}, files={doc_file.file_id: doc_file})
+        manifest.metadata.project_name = "test"
+        return manifest
+
+    def test_plain_text(self, runtime_config: RuntimeConfig, docs_manifest: Manifest):
+        renderer = DescriptionRenderer(runtime_config, docs_manifest)
+        node = model_node()
+
+        with patch("dbt.parser.manifest.DocsRuntimeContext") as docs_context:
+            assert renderer.render("Plain text, no jinja", node) == "Plain text, no jinja"
+            assert renderer.doc_blocks("Plain text, no jinja", node) == []
+
+        docs_context.assert_not_called()
+
+    def test_process_docs_for_node(self, runtime_config: RuntimeConfig, docs_manifest: Manifest):
+        renderer = DescriptionRenderer(runtime_config, docs_manifest)
+        first, second = model_node(), model_node()
+        second.unique_id = "model.test.bar"
+        for node in (first, second):
+            node.description = "{{ doc('orders') }}"
+            node.columns = {"id": ColumnInfo(name="id", description="The id")}
+
+        with patch(
+            "dbt.parser.manifest.DocsRuntimeContext", wraps=DocsRuntimeContext
+        ) as docs_context:
+            _process_docs_for_node(renderer, first)
+            _process_docs_for_node(renderer, second)
+
+        # the second description is memoized, so only the first node needed a context
+        assert docs_context.call_count == 1
+        for node in (first, second):
+            assert node.description == "All orders"
+            assert node.doc_blocks == ["doc.test.orders"]
+            assert node.columns["id"].description == "The id"
+            assert node.columns["id"].doc_blocks == []
+        doc_file = next(iter(docs_manifest.files.values()))
+        assert doc_file.nodes == ["model.test.foo", "model.test.bar"]
@@ -4,6 +4,7 @@ from argparse import Namespace
 from copy import deepcopy
 from unittest import mock
 
+import pytest
 import yaml
 
 import dbt_common.events.functions
@@ -14,6 +15,7 @@ from dbt.artifacts.resources.v1.model import (
     ModelFreshnessUpdatesOnOptions,
 )
 from dbt.context.context_config import ContextConfig
+from dbt.context.macro_resolver import MacroResolver
 from dbt.contracts.files import FileHash, FilePath, SchemaSourceFile, SourceFile
 from dbt.contracts.graph.manifest import Manifest
 from dbt.contracts.graph.model_config import NodeConfig, SnapshotConfig, TestConfig
@@ -46,6 +48,7 @@ from dbt.parser.models import (
     _get_stable_sample_result,
     _shift_sources,
 )
+from dbt.parser.schema_generic_tests import _statically_extract_test_refs
 from dbt.parser.schemas import (
     AnalysisPatchParser,
     MacroPatchParser,
@@ -302,6 +305,49 @@ models:
                 arg: 100
 """
 
+SINGLE_TABLE_MODEL_RELATIONSHIPS_TESTS = """
+models:
+    - name: my_model
+      columns:
+        - name: customer_id
+          data_tests:
+            - relationships:
+                to: ref('customers')
+                field: id
+            - relationships:
+                to: "{{ ref(var('customers_model')) }}"
+                field: id
+"""
+
+STATIC_GENERIC_TESTS = """
+models:
+    - name: my_model
+      columns:
+        - name: customer_id
+          data_tests:
+            - accepted_values:
+                values: ['a', 'b']
+            - relationships:
+                to: ref('customers')
+                field: id
+"""
+
+STATIC_GENERIC_TESTS_VERSIONED = """
+models:
+    - name: my_model
+      columns:
+        - name: customer_id
+          data_tests:
+            - accepted_values:
+                values: ['a', 'b']
+            - relationships:
+                to: ref('customers', v=3)
+                field: id
+      versions:
+        - v: 1
+        - v: 2
+"""
+
 SINGLE_TABLE_MODEL_TESTS_WRONG_SEVERITY = """
 models:
     - name: my_model
@@ -791,6 +837,104 @@ class SchemaParserModelsTest(SchemaParserTest):
         self.assertEqual(len(list(self.parser.manifest.sources)), 0)
         self.assertEqual(len(list(self.parser.manifest.nodes)), 4)
 
+    def test__parse_internal_generic_tests_statically(self):
+        block = self.file_block_for(SINGLE_TABLE_MODEL_RELATIONSHIPS_TESTS, "test_one.yml")
+        self.parser.manifest.files[block.file.file_id] = block.file
+        dct = yaml_from_file(block.file, validate=True)
+        generic_test_parser = self.parser.generic_test_parser
+        with mock.patch.object(
+            generic_test_parser.macro_resolver,
+            "get_macro_id",
+            return_value="macro.dbt.test_relationships",
+        ), mock.patch(
+            "dbt.parser.schema_generic_tests.generate_test_context"
+        ) as generate_test_context, mock.patch(
+            "dbt.parser.schema_generic_tests.add_rendered_test_kwargs"
+        ), mock.patch(
+            "dbt.parser.schema_generic_tests.get_rendered"
+        ):
+            self.parser.parse_file(block, dct)
+
+        tests = [
+            node
+            for node in self.parser.manifest.nodes.values()
+            if node.resource_type == NodeType.Test
+        ]
+        static_test = next(t for t in tests if t.test_metadata.kwargs["to"] == "ref('customers')")
+        self.assertEqual(static_test.refs, [RefArgs(name="customers"), RefArgs(name="my_model")])
+        self.assertEqual(static_test.depends_on.macros, ["macro.dbt.test_relationships"])
+        # only the test with jinja in its arguments is rendered
+        generate_test_context.assert_called_once()
+
+    def _parse_internal_generic_tests(self, yaml):
+        for name, args, sql in [
+            (
+                "test_accepted_values",
+                "model, column_name, values",
+                "select {{ column_name }} from {{ model }}",
+            ),
+            (
+                "test_relationships",
+                "model, column_name, to, field",
+                "select {{ column_name }} from {{ model }}, {{ to }}",
+            ),
+            ("get_where_subquery", "relation", "{{ return(relation) }}"),
+        ]:
+            macro = Macro(
+                name=name,
+                resource_type=NodeType.Macro,
+                unique_id=f"macro.dbt.{name}",
+                package_name="dbt",
+                original_file_path=normalize("macros/macro.sql"),
+                path=normalize("macros/macro.sql"),
+                macro_sql=f"{{% macro {name}({args}) %}}{sql}{{% endmacro %}}",
+            )
+            self.parser.manifest.macros[macro.unique_id] = macro
+        generic_test_parser = self.parser.generic_test_parser
+        generic_test_parser.macro_resolver = MacroResolver(
+            self.parser.manifest.macros, "root", ["dbt"]
+        )
+
+        block = self.file_block_for(yaml, "test_one.yml")
+        self.parser.manifest.files[block.file.file_id] = block.file
+        self.parser.parse_file(block, yaml_from_file(block.file, validate=True))
+        return sorted(
+            (node for node in self.parser.manifest.nodes.values() if node.resource_type == "test"),
+            key=lambda node: node.unique_id,
+        )
+
+    def _assert_static_generic_tests_match_rendered(self, yaml, num_tests):
+        static_tests = self._parse_internal_generic_tests(yaml)
+        self.setUp()
+        with mock.patch("dbt.parser.schema_generic_tests.STATIC_GENERIC_TEST_MACROS", frozenset()):
+            rendered_tests = self._parse_internal_generic_tests(yaml)
+
+        def without_created_at(node):
+            node_dict = node.to_dict()
+            del node_dict["created_at"]
+            return node_dict
+
+        self.assertEqual(len(static_tests), num_tests)
+        self.assertEqual(
+            [without_created_at(node) for node in static_tests],
+            [without_created_at(node) for node in rendered_tests],
+        )
+        for node in static_tests:
+            self.assertIn("macro.dbt.get_where_subquery", node.depends_on.macros)
+        return static_tests
+
+    def test__static_generic_tests_match_rendered(self):
+        self._assert_static_generic_tests_match_rendered(STATIC_GENERIC_TESTS, num_tests=2)
+
+    def test__static_generic_tests_match_rendered_versioned(self):
+        tests = self._assert_static_generic_tests_match_rendered(
+            STATIC_GENERIC_TESTS_VERSIONED, num_tests=4
+        )
+        self.assertEqual(sorted(node.refs[-1].version for node in tests), ["1", "1", "2", "2"])
+        for node in tests:
+            if node.test_metadata.name == "relationships":
+                self.assertIn(RefArgs(name="customers", version=3), node.refs)
+
     def test__parse_model_freshness(self):
         block = self.file_block_for(SINGLE_TABLE_MODEL_FRESHNESS, "test_one.yml")
         self.parser.manifest.files[block.file.file_id] = block.file
@@ -2016,3 +2160,37 @@ class AnalysisParserTest(BaseParserTest):
         self.assertEqual(
             self.parser.manifest.files[file_id].nodes, ["analysis.snowplow.analysis_1"]
         )
+
+
+class TestStaticallyExtractTestRefs:
+    def test_literal_kwargs(self):
+        kwargs = {
+            "column_name": "{{ not rendered }}",
+            "model": "{{ get_where_subquery(ref('my_model')) }}",
+            "values": ["a", "b", 1, None],
+            "quote": False,
+        }
+        assert _statically_extract_test_refs(kwargs) == []
+
+    def test_ref_and_source_kwargs(self):
+        kwargs = {
+            "to": "ref('pkg', 'customers', version=2)",
+            "other": {"source": "source('raw', 'customers')"},
+        }
+        assert _statically_extract_test_refs(kwargs) == [
+            RefArgs(package="pkg", name="customers", version=2),
+            ["raw", "customers"],
+        ]
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "{{ ref('customers') }}",
+            "ref(var('customers'))",
+            "env_var('CUSTOMERS')",
+            "ref('customers') ~ ref('orders')",
+            ["a", "{{ var('b') }}"],
+        ],
+    )
+    def test_needs_rendering(self, value):
+        assert _statically_extract_test_refs({"to": value}) is None
@@ -0,0 +1,48 @@
+from unittest import mock
+
+from dbt.contracts.files import FileHash, FilePath, ParseFileType, SourceFile
+from dbt.parser.read_files import load_seed_source_file
+
+
+class TestLoadSeedSourceFile:
+    def _file_path(self, tmp_path, contents, modification_time=1.0):
+        (tmp_path / "seeds").mkdir(exist_ok=True)
+        (tmp_path / "seeds" / "seed.csv").write_text(contents)
+        return FilePath(
+            searched_path="seeds",
+            relative_path="seed.csv",
+            modification_time=modification_time,
+            project_root=str(tmp_path),
+        )
+
+    def test_small_seed(self, tmp_path):
+        path = self._file_path(tmp_path, "a,b\n1,2\n")
+
+        source_file = load_seed_source_file(path, "test")
+
+        assert source_file.parse_file_type == ParseFileType.Seed
+        assert source_file.checksum == FileHash.from_contents("a,b\n1,2")
+
+    @mock.patch("dbt.contracts.files.MAXIMUM_SEED_SIZE", 4)
+    def test_big_seed_is_hashed(self, tmp_path):
+        path = self._file_path(tmp_path, "a,b\n1,2\n")
+
+        source_file = load_seed_source_file(path, "test")
+
+        assert source_file.checksum == FileHash.from_contents("a,b\n1,2")
+        assert source_file.contents == ""
+
+    @mock.patch("dbt.contracts.files.MAXIMUM_SEED_SIZE", 4)
+    def test_big_seed_reuses_saved_checksum(self, tmp_path):
+        path = self._file_path(tmp_path, "a,b\n1,2\n")
+        saved_checksum = FileHash(name="sha256", checksum="saved")
+        saved_files = {
+            "test://seeds/seed.csv": SourceFile(path=path, checksum=saved_checksum),
+        }
+
+        source_file = load_seed_source_file(path, "test", saved_files)
+        assert source_file.checksum == saved_checksum
+
+        modified_path = self._file_path(tmp_path, "a,b\n1,3\n", modification_time=2.0)
+        source_file = load_seed_source_file(modified_path, "test", saved_files)
+        assert source_file.checksum == FileHash.from_contents("a,b\n1,3")
@@ -2,6 +2,8 @@ import unittest
 from decimal import Decimal
 from unittest import mock
 
+import agate
+
 from dbt.task.docs import generate
 
 
@@ -329,3 +331,58 @@ class GenerateTest(unittest.TestCase):
 
         self.mock_get_unique_id_mapping.assert_called_once_with(self.manifest)
         self.assertEqual(result, expected)
+
+        # streaming the rows of the catalog query gives the same catalog
+        catalog = generate.Catalog([])
+        catalog.add_table(agate.Table([list(c.values()) for c in columns], list(columns[0])))
+        self.assertEqual(catalog, generate.Catalog(columns))
+
+    def test_get_catalog_per_schema(self):
+        def get_filtered_catalog(nodes, used_schemas, relations):
+            rows = [
+                [node.database, node.schema, node.name, "BASE TABLE", "id", 1, "integer"]
+                for node in nodes
+            ]
+            columns = [
+                "table_database",
+                "table_schema",
+                "table_name",
+                "table_type",
+                "column_name",
+                "column_index",
+                "column_type",
+            ]
+            return agate.Table(rows, columns), [ValueError(node.schema) for node in nodes]
+
+        nodes = [
+            mock.MagicMock(database="db", schema=schema, identifier=name)
+            for schema, name in [("a", "one"), ("A", "two"), ("b", "three")]
+        ]
+        for node in nodes:
+            node.name = node.identifier
+        adapter = mock.MagicMock()
+        adapter.get_filtered_catalog.side_effect = get_filtered_catalog
+        task = mock.MagicMock()
+        task.config.threads = 4
+        task.config.args.single_threaded = True
+
+        catalog, exceptions = generate.GenerateTask.get_catalog(
+            task, adapter, nodes, frozenset(), None
+        )
+
+        # schemas are queried case-insensitively, once each
+        self.assertEqual(adapter.get_filtered_catalog.call_count, 2)
+        self.assertEqual(
+            set(catalog),
+            {generate.CatalogKey("db", node.schema, node.name) for node in nodes},
+        )
+        self.assertEqual(sorted(str(exc) for exc in exceptions), ["A", "a", "b"])
+
+        # with a selection, only the schemas of the selected relations are queried
+        adapter.get_filtered_catalog.reset_mock()
+        relation = mock.MagicMock(database="db", schema="b")
+        catalog, _ = generate.GenerateTask.get_catalog(
+            task, adapter, nodes, frozenset(), {relation}
+        )
+        adapter.get_filtered_catalog.assert_called_once_with([nodes[2]], frozenset(), mock.ANY)
+        self.assertEqual(set(catalog), {generate.CatalogKey("db", "b", "three")})
@@ -153,3 +153,89 @@ class TestFreshnessTaskMetadataCache:
         task.populate_metadata_freshness_cache(adapter, {source_no_loaded_at_field.unique_id})
 
         assert task.get_freshness_metadata_cache() == {}
+
+
+class TestFreshnessTaskSqlCache:
+    @pytest.fixture
+    def args(self):
+        mock_args = mock.Mock()
+        mock_args.state = None
+        mock_args.defer_state = None
+        mock_args.write_json = None
+
+        return mock_args
+
+    @pytest.fixture
+    def adapter(self, freshness_response):
+        mock_adapter = mock.MagicMock()
+        mock_adapter.execute_macro.return_value = "now()"
+        mock_adapter.Relation.create_from.side_effect = lambda config, source: source.name
+        mock_adapter._create_freshness_response.return_value = freshness_response
+        return mock_adapter
+
+    @pytest.fixture
+    def freshness_response(self):
+        return FreshnessResponse(
+            max_loaded_at=datetime.datetime(2020, 5, 2),
+            snapshotted_at=datetime.datetime(2020, 5, 4),
+            age=2,
+        )
+
+    def _source(self, name, schema, loaded_at_field="loaded_at", filter=None):
+        mock_source = mock.Mock()
+        mock_source.unique_id = f"source.test.{schema}.{name}"
+        mock_source.name = name
+        mock_source.database = "db"
+        mock_source.schema = schema
+        mock_source.loaded_at_field = loaded_at_field
+        mock_source.loaded_at_query = None
+        mock_source.freshness.filter = filter
+        return mock_source
+
+    def test_populate_sql_freshness_cache_batches_by_schema(
+        self, args, adapter, freshness_response
+    ):
+        sources = [
+            self._source("a", "raw"),
+            self._source("b", "raw", filter="id > 1"),
+            self._source("c", "other"),
+            self._source("d", "other", loaded_at_field=None),
+        ]
+        manifest = mock.Mock()
+        manifest.sources = {source.unique_id: source for source in sources}
+        adapter.execute.side_effect = [
+            (
+                "other_response",
+                mock.Mock(rows=[(s.unique_id, None, None) for s in sources[2:3]]),
+            ),
+            (
+                "raw_response",
+                mock.Mock(rows=[(s.unique_id, None, None) for s in sources[:2]]),
+            ),
+        ]
+        task = FreshnessTask(args=args, config=mock.Mock(), manifest=manifest)
+
+        task.populate_sql_freshness_cache(adapter, set(manifest.sources))
+
+        assert adapter.execute.call_count == 2
+        other_sql = adapter.execute.call_args_list[0].args[0]
+        raw_sql = adapter.execute.call_args_list[1].args[0]
+        assert "from c" in other_sql and "union all" not in other_sql
+        assert raw_sql.count("union all") == 1
+        assert "from b where id > 1" in raw_sql
+        assert task.get_sql_freshness_cache() == {
+            sources[0].unique_id: ("raw_response", freshness_response),
+            sources[1].unique_id: ("raw_response", freshness_response),
+            sources[2].unique_id: ("other_response", freshness_response),
+        }
+
+    def test_populate_sql_freshness_cache_adapter_exception(self, args, adapter):
+        sources = [self._source("a", "raw"), self._source("b", "raw")]
+        manifest = mock.Mock()
+        manifest.sources = {source.unique_id: source for source in sources}
+        adapter.execute.side_effect = Exception()
+        task = FreshnessTask(args=args, config=mock.Mock(), manifest=manifest)
+
+        task.populate_sql_freshness_cache(adapter, set(manifest.sources))
+
+        assert task.get_sql_freshness_cache() == {}
@@ -1,9 +1,18 @@
 from argparse import Namespace
 from unittest.mock import patch
 
+import pytest
+
 from dbt.flags import get_flags, set_from_args
-from dbt.task.list import ListTask
+from dbt.task.list import ListTask, node_to_dict
 from dbt_common.events.types import PrintEvent
+from tests.unit.utils.manifest import (
+    make_exposure,
+    make_model,
+    make_semantic_model,
+    make_source,
+    make_unit_test,
+)
 
 
 def test_list_output_results():
@@ -12,7 +21,10 @@ def test_list_output_results():
     results = ["node1", "node2", "node3"]
     expected_node_results = ["node1", "node2", "node3"]
 
-    with patch("dbt.task.list.fire_event") as mock_fire_event:
+    with (
+        patch.object(task, "_can_batch_output", return_value=False),
+        patch("dbt.task.list.fire_event") as mock_fire_event,
+    ):
         node_results = task.output_results(results)
 
     assert node_results == expected_node_results
@@ -22,6 +34,54 @@ def test_list_output_results():
         assert call_args[0][0].msg in expected_node_results
 
 
+def test_list_output_results_batched():
+    set_from_args(Namespace(models=None), {})
+    task = ListTask(get_flags(), None, None)
+
+    with (
+        patch.object(task, "_can_batch_output", return_value=True),
+        patch("dbt.task.list.fire_event") as mock_fire_event,
+    ):
+        node_results = task.output_results(iter(["node1", "node2", "node3"]))
+
+    assert node_results == ["node1", "node2", "node3"]
+    mock_fire_event.assert_called_once()
+    assert mock_fire_event.call_args[0][0].msg == "node1\nnode2\nnode3"
+
+
+class TestNodeToDict:
+    @pytest.fixture
+    def nodes(self):
+        model = make_model("pkg", "model_one", "select 1", tags=["a"])
+        return [
+            model,
+            make_source("pkg", "raw", "table_one"),
+            make_exposure("pkg", "exposure_one"),
+            make_semantic_model("pkg", "semantic_one", model),
+            make_unit_test("pkg", "unit_one", model),
+        ]
+
+    @pytest.mark.parametrize(
+        "keys",
+        [
+            sorted(ListTask.ALLOWED_KEYS),
+            ["name", "fqn", "meta", "not_a_field"],
+            # only exist after __post_serialize__, or not at all
+            ["name", "doc_blocks", "compiled", "_event_status"],
+        ],
+    )
+    def test_matches_to_dict(self, nodes, keys):
+        for node in nodes:
+            node_dict = node.to_dict(omit_none=False)
+            expected = {key: value for key, value in node_dict.items() if key in keys}
+            assert list(node_to_dict(node, keys).items()) == list(expected.items())
+
+    def test_serializes_only_requested_keys(self, nodes):
+        with patch.object(type(nodes[0]), "to_dict") as to_dict:
+            assert node_to_dict(nodes[0], ["name", "config"])["name"] == "model_one"
+        to_dict.assert_not_called()
+
+
 class TestGetNestedValue:
     """Unit tests for the _get_nested_value method"""
 
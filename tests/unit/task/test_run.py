@@ -1,3 +1,4 @@
+import time
 from argparse import Namespace
 from dataclasses import dataclass
 from importlib import import_module
@@ -9,6 +10,7 @@ import pytest
 from psycopg2 import DatabaseError
 from pytest_mock import MockerFixture
 
+import dbt.tracking
 from core.dbt.task.run import MicrobatchBatchRunner
 from dbt.adapters.contracts.connection import AdapterResponse
 from dbt.adapters.postgres import PostgresAdapter
@@ -149,6 +151,18 @@ class TestModelRunner:
         assert log_model_result_catcher.caught_events[0].info.level == EventLevel.ERROR
         assert log_model_result_catcher.caught_events[0].data.status == EventLevel.ERROR
 
+    def test_after_execute_does_not_wait_for_tracking(
+        self, model_runner: ModelRunner, run_result: RunResult, tracking_collector
+    ) -> None:
+        start = time.perf_counter()
+        # enough runs to fill a batch of tracking events
+        for _ in range(35):
+            model_runner.after_execute(run_result)
+        assert time.perf_counter() - start < tracking_collector.delay
+
+        assert dbt.tracking.event_queue.flush(timeout=5)
+        assert len(tracking_collector.events) == 35
+
     @pytest.mark.skip(
         reason="Default and adapter macros aren't being appropriately populated, leading to a runtime error"
     )
@@ -0,0 +1,105 @@
+import csv
+import json
+import sqlite3
+from unittest import mock
+
+import pytest
+
+from dbt.adapters.base.connections import BaseConnectionManager
+from dbt.adapters.sql.connections import SQLConnectionManager
+from dbt.task.show import SHOW_STREAMED_PREVIEW_ROWS, stream_query_results
+from dbt_common.clients.agate_helper import table_from_data_flat
+
+QUERY = "select id, 'name_' || id as name from numbers order by id"
+
+
+class TestStreamQueryResults:
+    @pytest.fixture
+    def adapter(self):
+        conn = sqlite3.connect(":memory:")
+        conn.execute("create table numbers (id integer)")
+        conn.executemany("insert into numbers values (?)", [(i,) for i in range(25)])
+
+        adapter = mock.Mock()
+        adapter.connections = mock.Mock(spec=SQLConnectionManager)
+        adapter.connections.add_select_query.side_effect = lambda sql: (
+            None,
+            conn.execute(sql),
+        )
+        adapter.connections.get_response.return_value = "response"
+        adapter.connections.process_results = SQLConnectionManager.process_results
+        return adapter
+
+    def test_stream_json(self, adapter, tmp_path):
+        output_file = str(tmp_path / "out.json")
+
+        response, preview, num_rows = stream_query_results(
+            adapter, QUERY, output_file, "json", chunk_size=4
+        )
+
+        assert response == "response"
+        assert num_rows == 25
+        assert len(preview.rows) == SHOW_STREAMED_PREVIEW_ROWS
+        assert preview.column_names == ("id", "name")
+        with open(output_file) as fp:
+            rows = json.load(fp)
+        assert rows[0] == {"id": 0, "name": "name_0"}
+        assert len(rows) == 25
+
+    def test_stream_csv_with_limit(self, adapter, tmp_path):
+        output_file = str(tmp_path / "out.csv")
+
+        _, preview, num_rows = stream_query_results(
+            adapter, QUERY, output_file, "text", limit=10, chunk_size=4
+        )
+
+        assert num_rows == 10
+        assert len(preview.rows) == 10
+        with open(output_file, newline="") as fp:
+            rows = list(csv.reader(fp))
+        assert rows[0] == ["id", "name"]
+        assert rows[1:3] == [["0", "name_0"], ["1", "name_1"]]
+        assert len(rows) == 11
+
+    def test_stream_json_no_rows(self, adapter, tmp_path):
+        output_file = str(tmp_path / "out.json")
+
+        _, preview, num_rows = stream_query_results(
+            adapter, QUERY + " limit 0", output_file, "json"
+        )
+
+        assert num_rows == 0
+        assert len(preview.rows) == 0
+        with open(output_file) as fp:
+            assert json.load(fp) == []
+
+    def test_stream_duplicate_column_names(self, adapter, tmp_path):
+        output_file = str(tmp_path / "out.csv")
+
+        _, preview, _ = stream_query_results(
+            adapter, "select id, id, id as name, id from numbers", output_file, "text", limit=1
+        )
+
+        assert preview.column_names == ("id", "id_2", "name", "id_3")
+        with open(output_file, newline="") as fp:
+            assert next(csv.reader(fp)) == ["id", "id_2", "name", "id_3"]
+
+    def test_non_sql_adapter(self, tmp_path):
+        output_file = str(tmp_path / "out.json")
+        table = table_from_data_flat([{"id": i} for i in range(8)], ["id"])
+        adapter = mock.Mock()
+        # like BaseConnectionManager, which defines add_select_query but doesn't implement it
+        adapter.connections = mock.Mock(spec=BaseConnectionManager)
+        adapter.connections.add_select_query.side_effect = NotImplementedError
+        adapter.execute.return_value = ("response", table)
+
+        response, preview, num_rows = stream_query_results(
+            adapter, QUERY, output_file, "json", limit=8
+        )
+
+        adapter.execute.assert_called_once_with(QUERY, fetch=True, limit=8)
+        assert response == "response"
+        assert num_rows == 8
+        assert len(preview.rows) == 8
+        with open(output_file) as fp:
+            assert json.load(fp)[0] == {"id": 0}
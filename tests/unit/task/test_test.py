@@ -1,7 +1,7 @@
 import agate
 import pytest
 
-from dbt.task.test import list_rows_from_table
+from dbt.task.test import TestRunner, list_rows_from_table, tables_differ
 
 
 class TestListRowsFromTable:
@@ -69,3 +69,32 @@ class TestListRowsFromTable:
 
         list_rows = list_rows_from_table(table, sort=True)
         assert list_rows == expected_list_rows
+
+
+class TestTablesDiffer:
+    @pytest.mark.parametrize(
+        "expected_rows,actual_rows,differ",
+        [
+            ([], [], False),  # no rows
+            ([[1, 2, 3]], [[1, 2, 3]], False),  # single row
+            ([[1, 2, 3], [4, 5, 6]], [[4, 5, 6], [1, 2, 3]], False),  # out of order
+            ([[None, 2, 3], [1, 2, 3]], [[1, 2, 3], [None, 2, 3]], False),  # with nulls
+            ([[1, 2, 3]], [[1, 2, 4]], True),  # different value
+            ([[1, 2, 3]], [[1, 2, None]], True),  # null vs value
+            ([[1, 2, 3], [1, 2, 3]], [[1, 2, 3]], True),  # missing duplicate
+            ([[1, 2, 3], [1, 2, 3], [4, 5, 6]], [[1, 2, 3], [4, 5, 6], [4, 5, 6]], True),
+        ],
+    )
+    def test_tables_differ_matches_daff(self, expected_rows, actual_rows, differ):
+        expected = agate.Table(rows=expected_rows, column_names=["a", "b", "c"])
+        actual = agate.Table(rows=actual_rows, column_names=["a", "b", "c"])
+
+        assert tables_differ(expected, actual) is differ
+        daff_diff = TestRunner._get_daff_diff(None, expected, actual)  # type: ignore
+        assert daff_diff.hasDifference() is differ
+
+    def test_tables_differ_different_columns(self):
+        expected = agate.Table(rows=[[1, 2]], column_names=["a", "b"])
+        actual = agate.Table(rows=[[1, 2]], column_names=["a", "c"])
+
+        assert tables_differ(expected, actual)
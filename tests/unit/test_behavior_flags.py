@@ -2,6 +2,7 @@ import pytest
 
 from dbt.tracking import (
     disable_tracking,
+    event_queue,
     initialize_from_flags,
     track_behavior_change_warn,
 )
@@ -39,6 +40,7 @@ def test_false_evaluation_triggers_snowplow_tracking(snowplow_tracker):
     if behavior.my_flag:
         # trigger a False evaluation
         assert False, "This flag should evaluate to false and skip this line"
+    event_queue.flush()
     assert snowplow_tracker.called
 
 
@@ -51,6 +53,7 @@ def test_true_evaluation_does_not_trigger_snowplow_tracking(snowplow_tracker):
     else:
         # trigger a True evaluation
         assert False, "This flag should evaluate to false and skip this line"
+    event_queue.flush()
     assert not snowplow_tracker.called
 
 
@@ -63,4 +66,5 @@ def test_false_evaluation_does_not_trigger_snowplow_tracking_when_disabled(snowp
     if behavior.my_flag:
         # trigger a False evaluation
         assert False, "This flag should evaluate to false and skip this line"
+    event_queue.flush()
     assert not snowplow_tracker.called
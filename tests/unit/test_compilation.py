@@ -1,14 +1,25 @@
+import json
 import os
+import pickle
 import tempfile
 from queue import Empty
 from unittest import mock
 
 import pytest
 
-from dbt.compilation import Graph, Linker
+from dbt.artifacts.schemas.results import RunStatus
+from dbt.compilation import (
+    Graph,
+    Linker,
+    linked_graph_key,
+    read_retry_graph,
+    write_retry_graph,
+)
 from dbt.graph.cli import parse_difference
 from dbt.graph.queue import GraphQueue
 from dbt.graph.selector import NodeSelector
+from dbt.task.runnable import GraphRunnableTask
+from tests.unit.utils.manifest import make_manifest, make_model
 
 
 def _mock_manifest(nodes):
@@ -193,3 +204,120 @@ class TestLinker:
             linker.dependency(l, r)
 
         assert linker.find_cycles() is None
+
+    def test_linked_graph_round_trip(self, linker: Linker, tmp_path) -> None:
+        for l, r in [("A", "B"), ("A", "C"), ("B", "C")]:
+            linker.dependency(l, r)
+        linker.add_node("D")
+        path = str(tmp_path / "linked_graph.json")
+
+        linker.write_linked_graph(path, "key")
+
+        loaded = Linker.read_linked_graph(path, "key")
+        assert loaded is not None
+        assert list(loaded.nodes()) == list(linker.nodes())
+        assert list(loaded.edges()) == list(linker.edges())
+        assert Linker.read_linked_graph(path, "other key") is None
+        assert Linker.read_linked_graph(str(tmp_path / "missing.json"), "key") is None
+
+    def test_read_corrupt_linked_graph(self, tmp_path) -> None:
+        path = tmp_path / "linked_graph.json"
+        path.write_text('{"key": "key", "nodes": ["A"], "edges": [[0, 1]]}')
+
+        assert Linker.read_linked_graph(str(path), "key") is None
+
+
+def test_linked_graph_key():
+    model_one = make_model(pkg="pkg", name="model_one", code="select 1")
+    model_two = make_model(pkg="pkg", name="model_two", code="select 2")
+    model_three = make_model(pkg="pkg", name="model_three", code="select 3", refs=[model_one])
+    key = linked_graph_key(make_manifest(nodes=[model_one, model_two, model_three]))
+
+    # changes to anything but the dependencies don't matter
+    model_two.raw_code = "select 22"
+    assert linked_graph_key(make_manifest(nodes=[model_one, model_two, model_three])) == key
+
+    model_three.depends_on.nodes = [model_two.unique_id]
+    assert linked_graph_key(make_manifest(nodes=[model_one, model_two, model_three])) != key
+    assert linked_graph_key(make_manifest(nodes=[model_one, model_two])) != key
+
+
+def test_retry_graph(tmp_path):
+    model_one = make_model(pkg="pkg", name="model_one", code="select 1")
+    model_two = make_model(pkg="pkg", name="model_two", code="select 2", refs=[model_one])
+    model_three = make_model(pkg="pkg", name="model_three", code="select 3", refs=[model_two])
+    manifest = make_manifest(nodes=[model_one, model_two, model_three])
+    linker = Linker()
+    linker.link_graph(manifest)
+    graph = Graph(linker.graph)
+    path = str(tmp_path / "retry_graph.json")
+
+    write_retry_graph(path, graph, manifest, "run", [model_one.unique_id, model_three.unique_id])
+
+    retry_graph = read_retry_graph(path, manifest, "run", [model_three.unique_id])
+    assert retry_graph is not None
+    assert set(retry_graph) == {model_one.unique_id, model_three.unique_id}
+    # the dependency through model_two is kept
+    assert list(retry_graph.graph.edges()) == [(model_one.unique_id, model_three.unique_id)]
+    subset = retry_graph.get_subset_graph([model_three.unique_id])
+    assert set(subset) == set(graph.get_subset_graph([model_three.unique_id]))
+
+    # nodes that succeeded, other commands and changed dependencies need the whole graph
+    assert read_retry_graph(path, manifest, "run", [model_two.unique_id]) is None
+    assert read_retry_graph(path, manifest, "build", [model_three.unique_id]) is None
+    model_three.depends_on.nodes = [model_one.unique_id]
+    assert read_retry_graph(path, manifest, "run", [model_three.unique_id]) is None
+    assert read_retry_graph(str(tmp_path / "missing.json"), manifest, "run", []) is None
+
+
+def test_graph_summary_and_gpickle(tmp_path):
+    model_one = make_model(pkg="pkg", name="model_one", code="select 1")
+    model_two = make_model(pkg="pkg", name="model_two", code="select 2", refs=[model_one])
+    manifest = make_manifest(nodes=[model_one, model_two])
+    linker = Linker()
+    linker.link_graph(manifest)
+
+    summary = json.loads(json.dumps(linker.get_graph_summary(manifest)))
+    assert summary == {
+        "0": {"name": model_one.unique_id, "type": "model", "succ": [1]},
+        "1": {"name": model_two.unique_id, "type": "model"},
+    }
+
+    path = tmp_path / "graph.gpickle"
+    linker.write_graph(str(path), manifest)
+    with open(path, "rb") as fp:
+        graph = pickle.load(fp)
+    assert graph.nodes[model_two.unique_id]["raw_code"] == "select 2"
+
+    linker.write_graph(str(path), manifest, node_data=False)
+    with open(path, "rb") as fp:
+        graph = pickle.load(fp)
+    assert list(graph.edges) == [(model_one.unique_id, model_two.unique_id)]
+    assert graph.nodes[model_two.unique_id] == {}
+
+
+def test_task_writes_retry_graph_only_with_failures(tmp_path):
+    model_one = make_model(pkg="pkg", name="model_one", code="select 1")
+    model_two = make_model(pkg="pkg", name="model_two", code="select 2", refs=[model_one])
+    manifest = make_manifest(nodes=[model_one, model_two])
+    linker = Linker()
+    linker.link_graph(manifest)
+    task = mock.Mock(manifest=manifest, graph=Graph(linker.graph))
+    task.config.project_target_path = str(tmp_path)
+    task.args.which = "run"
+    path = tmp_path / "retry_graph.json"
+
+    def results(failed_status):
+        return [
+            mock.Mock(node=model_one, status=RunStatus.Success),
+            mock.Mock(node=model_two, status=failed_status),
+        ]
+
+    GraphRunnableTask.write_retry_graph(task, results(RunStatus.Error))
+    assert read_retry_graph(str(path), manifest, "run", [model_two.unique_id]) is not None
+
+    with mock.patch("dbt.task.runnable.write_retry_graph") as patched_write_retry_graph:
+        GraphRunnableTask.write_retry_graph(task, results(RunStatus.Success))
+    patched_write_retry_graph.assert_not_called()
+    # the file of the failed invocation is removed
+    assert not path.exists()
@@ -0,0 +1,188 @@
+import os
+import stat
+import threading
+from unittest import mock
+
+import pytest
+
+from dbt.cli.main import cli, dbtRunnerResult
+from dbt.contracts.graph.manifest import Manifest
+from dbt.daemon import (
+    DaemonRunner,
+    DaemonServer,
+    _connect,
+    default_socket_path,
+    exit_code,
+    forwarded_env,
+    send_request,
+)
+from dbt.parser.manifest import extended_mashumaro_encoder
+
+
+def _manifest_msgpack(project_name):
+    manifest = Manifest()
+    manifest.metadata.project_name = project_name
+    return manifest.to_msgpack(extended_mashumaro_encoder)
+
+
+def _fake_cli_invoke(manifest_msgpack=None, parse_error=None):
+    def invoke(ctx):
+        ctx.obj.pop("saved_manifest")
+        if parse_error:
+            raise parse_error
+        if manifest_msgpack is not None:
+            ctx.obj["manifest_msgpack"] = manifest_msgpack
+        ctx.obj["manifest"] = Manifest()
+        return ctx.obj["manifest"], True
+
+    return invoke
+
+
+class TestDaemonRunner:
+    def test_keeps_parsed_manifest(self):
+        runner = DaemonRunner()
+        first, second = _manifest_msgpack("first"), _manifest_msgpack("second")
+
+        with mock.patch.object(cli, "invoke", side_effect=_fake_cli_invoke(first)):
+            assert runner.invoke(["parse"]).success
+        assert runner.manifest_msgpack == first
+        # the manifest that the command ran with isn't reused
+        assert runner.manifest is None
+
+        runner.prepare()
+        assert runner.manifest.metadata.project_name == "first"
+
+        with mock.patch.object(cli, "invoke", side_effect=_fake_cli_invoke(second)):
+            runner.invoke(["parse"])
+        assert runner.manifest_msgpack == second
+
+    def test_passes_manifest_to_parsing(self):
+        runner = DaemonRunner()
+        runner.manifest_msgpack = _manifest_msgpack("warm")
+        saved = []
+
+        def invoke(ctx):
+            saved.append(ctx.obj["saved_manifest"])
+            return _fake_cli_invoke()(ctx)
+
+        with mock.patch.object(cli, "invoke", side_effect=invoke):
+            runner.invoke(["parse"])
+        assert [manifest.metadata.project_name for manifest in saved] == ["warm"]
+
+    def test_keeps_manifest_when_nothing_changed(self):
+        runner = DaemonRunner()
+        runner.manifest_msgpack = warm = _manifest_msgpack("warm")
+
+        with mock.patch.object(cli, "invoke", side_effect=_fake_cli_invoke()):
+            runner.invoke(["parse"])
+        assert runner.manifest_msgpack == warm
+        assert runner.manifest is None
+
+    def test_keeps_manifest_when_parsing_fails(self):
+        runner = DaemonRunner()
+        runner.manifest_msgpack = warm = _manifest_msgpack("warm")
+
+        with mock.patch.object(
+            cli, "invoke", side_effect=_fake_cli_invoke(parse_error=RuntimeError("bad yaml"))
+        ):
+            result = runner.invoke(["parse"])
+        assert not result.success
+        # the saved manifest may have been partially updated
+        assert runner.manifest is None
+        assert runner.manifest_msgpack == warm
+
+    def test_keeps_manifest_for_commands_that_dont_parse(self):
+        runner = DaemonRunner()
+        runner.manifest = warm = Manifest()
+
+        with mock.patch.object(cli, "invoke", return_value=(None, True)):
+            runner.invoke(["clean"])
+        assert runner.manifest is warm
+
+    def test_prepare_drops_unreadable_manifest(self):
+        runner = DaemonRunner()
+        runner.manifest_msgpack = b"not msgpack"
+
+        runner.prepare()
+        assert runner.manifest is None
+        assert runner.manifest_msgpack is None
+
+
+class TestDaemonServer:
+    @pytest.fixture
+    def server(self, tmp_path):
+        server = DaemonServer(str(tmp_path / "dbt.sock"))
+        thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.01})
+        thread.start()
+        yield server
+        server.shutdown()
+        thread.join()
+
+    def test_round_trip(self, server, tmp_path, capsys, monkeypatch):
+        monkeypatch.setenv("DBT_DAEMON_UNSET", "daemon")
+        monkeypatch.setenv("OTHER_DAEMON_TEST", "daemon")
+
+        def invoke(args):
+            env = [
+                os.environ["DBT_DAEMON_TEST"],
+                os.environ.get("DBT_DAEMON_UNSET", "unset"),
+                os.environ["OTHER_DAEMON_TEST"],
+            ]
+            print(f"{os.getcwd()} {' '.join(env)} {' '.join(args)}")
+            return dbtRunnerResult(success=False)
+
+        request = {
+            "args": ["run", "-s", "a"],
+            "cwd": str(tmp_path),
+            "env": {"DBT_DAEMON_TEST": "x", "OTHER_DAEMON_TEST": "client"},
+        }
+        with mock.patch.object(server.runner, "invoke", side_effect=invoke):
+            code = send_request(_connect(server.server_address), request)
+
+        assert code == 1
+        assert capsys.readouterr().out == f"{tmp_path} x unset daemon run -s a\n"
+        assert "DBT_DAEMON_TEST" not in os.environ
+        assert os.environ["DBT_DAEMON_UNSET"] == "daemon"
+
+    def test_socket_is_private(self, server):
+        assert stat.S_IMODE(os.stat(server.server_address).st_mode) == 0o600
+
+    def test_rejects_other_users(self, server):
+        with mock.patch("dbt.daemon._peer_uid", return_value=os.getuid() + 1):
+            assert send_request(_connect(server.server_address), {"command": "shutdown"}) == 2
+        assert _connect(server.server_address) is not None
+
+    def test_shutdown(self, server):
+        assert send_request(_connect(server.server_address), {"command": "shutdown"}) == 0
+        server.shutdown()
+        assert not os.path.exists(server.server_address)
+        assert _connect(server.server_address) is None
+
+
+def test_default_socket_path(tmp_path, monkeypatch):
+    monkeypatch.delenv("DBT_DAEMON_SOCKET", raising=False)
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    assert os.path.dirname(default_socket_path(str(tmp_path))) == str(tmp_path / "dbt")
+    assert stat.S_IMODE(os.stat(tmp_path / "dbt").st_mode) == 0o700
+    assert default_socket_path(str(tmp_path)) == default_socket_path(str(tmp_path / "."))
+    assert default_socket_path(str(tmp_path)) != default_socket_path(str(tmp_path / "other"))
+
+    monkeypatch.setenv("DBT_DAEMON_SOCKET", "/tmp/my.sock")
+    assert default_socket_path(str(tmp_path)) == "/tmp/my.sock"
+
+
+def test_forwarded_env():
+    env = {"DBT_TARGET": "dev", "DBT_ENV_SECRET_TOKEN": "t", "PATH": "/bin", "AWS_KEY": "k"}
+    assert forwarded_env(env) == {"DBT_TARGET": "dev", "DBT_ENV_SECRET_TOKEN": "t", "PATH": "/bin"}
+
+
+@pytest.mark.parametrize(
+    "result,expected",
+    [
+        (dbtRunnerResult(success=True), 0),
+        (dbtRunnerResult(success=False), 1),
+        (dbtRunnerResult(success=False, exception=RuntimeError()), 2),
+    ],
+)
+def test_exit_code(result, expected):
+    assert exit_code(result) == expected
@@ -7,6 +7,7 @@ from dbt.deprecations import (
     active_deprecations,
     reset_deprecations,
 )
+from dbt.jsonschemas import jsonschemas
 from dbt.jsonschemas.jsonschemas import (
     jsonschema_validate,
     resources_schema,
@@ -91,3 +92,32 @@ class TestValidateJsonSchema:
 
         jsonschema_validate(resources_schema(), model_bigquery_alias_config_contents, "test.yml")
         assert active_deprecations == {"custom-key-in-config-deprecation": 2}
+
+    def test_validate_json_schema_cached_by_checksum(
+        self, mocker, model_bigquery_alias_config_contents
+    ):
+        reset_deprecations()
+
+        safe_set_invocation_context()
+        get_invocation_context().uses_adapter("snowflake")
+        validate = mocker.spy(jsonschemas, "_validate_with_schema")
+
+        for _ in range(2):
+            jsonschema_validate(
+                resources_schema(), model_bigquery_alias_config_contents, "test.yml", "abc"
+            )
+
+        # the second, unchanged file reuses the results of the first validation
+        assert validate.call_count == 1
+        assert active_deprecations == {"custom-key-in-config-deprecation": 4}
+
+        jsonschema_validate(
+            resources_schema(), model_bigquery_alias_config_contents, "test.yml", "def"
+        )
+        assert validate.call_count == 2
+
+    def test_validator_reused(self):
+        schema = resources_schema()
+
+        assert jsonschemas._get_validator(schema) is jsonschemas._get_validator(schema)
+        assert jsonschemas.model_config_schema() is jsonschemas.model_config_schema()
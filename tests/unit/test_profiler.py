@@ -0,0 +1,41 @@
+import json
+import threading
+
+from dbt.profiler import record_span, span, timeline
+
+
+def test_span_without_timeline():
+    with span("nothing to record"):
+        pass
+    record_span("nothing to record", 0.0)
+
+
+def test_timeline(tmp_path):
+    outfile = tmp_path / "target" / "timeline.json"
+
+    with timeline(str(outfile)):
+        with span("outer", category="parse", files=2):
+            with span("inner"):
+                pass
+        thread = threading.Thread(target=record_span, args=("queue_wait", 1.0, 1.5), name="t1")
+        thread.start()
+        thread.join()
+    with span("after the timeline was written"):
+        pass
+
+    trace = json.loads(outfile.read_text())
+    spans = {event["name"]: event for event in trace["traceEvents"] if event["ph"] == "X"}
+    assert set(spans) == {"outer", "inner", "queue_wait"}
+
+    outer, inner = spans["outer"], spans["inner"]
+    assert (outer["cat"], outer["args"]) == ("parse", {"files": 2})
+    assert (inner["cat"], inner["args"]) == ("dbt", {})
+    assert outer["ts"] <= inner["ts"]
+    assert inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"]
+    assert (spans["queue_wait"]["ts"], spans["queue_wait"]["dur"]) == (1_000_000, 500_000)
+
+    thread_names = {
+        event["tid"]: event["args"]["name"] for event in trace["traceEvents"] if event["ph"] == "M"
+    }
+    assert thread_names[spans["queue_wait"]["tid"]] == "t1"
+    assert thread_names[outer["tid"]] == threading.current_thread().name
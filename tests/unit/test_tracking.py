@@ -1,5 +1,8 @@
 import datetime
 import tempfile
+import threading
+import time
+from unittest import mock
 
 import pytest
 
@@ -79,3 +82,47 @@ class TestTracking:
     def test_initialize_from_flags(self, tempdir, send_anonymous_usage_stats):
         dbt.tracking.initialize_from_flags(send_anonymous_usage_stats, tempdir)
         assert dbt.tracking.active_user.do_not_track != send_anonymous_usage_stats
+
+
+class TestEventQueue:
+    def test_tracking_does_not_wait_for_collector(self, tracking_collector):
+        start = time.perf_counter()
+        # enough events to fill a batch, which the emitter sends as soon as it is full
+        for _ in range(dbt.tracking.INIT_KW_ARGS["batch_size"] + 5):
+            dbt.tracking.track_partial_parser({"full_reparse_reason": "file_not_found"})
+        assert time.perf_counter() - start < tracking_collector.delay
+
+        assert dbt.tracking.event_queue.flush(timeout=5)
+        assert len(tracking_collector.events) == dbt.tracking.INIT_KW_ARGS["batch_size"] + 5
+        user_id = dbt.tracking.active_user.id
+        assert all(event["uid"] == user_id for event in tracking_collector.events)
+
+    def test_flush_deadline(self, tracking_collector):
+        tracking_collector.delay = 2
+        dbt.tracking.track_partial_parser({"full_reparse_reason": "file_not_found"})
+
+        start = time.perf_counter()
+        assert not dbt.tracking.event_queue.flush(timeout=0.2)
+        assert time.perf_counter() - start < 1
+
+    def test_full_queue_drops_events(self):
+        release = threading.Event()
+        tracked = []
+
+        def track(event):
+            release.wait(5)
+            tracked.append(event)
+
+        event_queue = dbt.tracking.EventQueue(maxsize=1)
+        with mock.patch.object(
+            dbt.tracking.tracker, "track", side_effect=track
+        ), mock.patch.object(dbt.tracking.tracker, "flush"):
+            start = time.perf_counter()
+            for i in range(5):
+                event_queue.put(i)
+            assert time.perf_counter() - start < 1
+
+            release.set()
+            assert event_queue.flush(timeout=5)
+        # at most one event being tracked and one in the queue
+        assert 1 <= len(tracked) <= 2
@@ -0,0 +1,40 @@
+import json
+import time
+from typing import Any, Dict, List
+from unittest import mock
+
+import pytest
+
+import dbt.tracking
+
+
+class SlowCollector:
+    """A stand-in for the snowplow collector, which takes `delay` seconds to respond."""
+
+    def __init__(self, delay: float) -> None:
+        self.delay = delay
+        self.events: List[Dict[str, Any]] = []
+
+    def post(self, url, data, headers, timeout) -> mock.Mock:
+        time.sleep(self.delay)
+        self.events.extend(json.loads(data)["data"])
+        return mock.Mock(status_code=200)
+
+
+@pytest.fixture
+def tracking_collector(tmp_path, mocker):
+    """Enables tracking, with events sent to a slow stand-in collector."""
+    collector = SlowCollector(delay=0.5)
+    mocker.patch("dbt.tracking.requests.post", side_effect=collector.post)
+    # events left over from other tests
+    dbt.tracking.event_queue.flush(timeout=5)
+    collector.events.clear()
+
+    previous_user = dbt.tracking.active_user
+    dbt.tracking.initialize_from_flags(True, str(tmp_path))
+    yield collector
+
+    # send whatever is left, so that it doesn't end up at the next test's collector
+    dbt.tracking.event_queue.flush(timeout=5)
+    dbt.tracking.active_user.disable_tracking()
+    dbt.tracking.active_user = previous_user
@@ -12,6 +12,8 @@ from .data_types import (
     TimeDelta as TimeDelta,
 )
 
+class CastError(Exception): ...
+
 class MappedSequence(Sequence):
     def __init__(self, values: Any, keys: Optional[Any] = ...) -> None: ...
     def __unicode__(self): ...
@@ -54,6 +56,8 @@ class Table:
     def rows(self): ...
     def print_csv(self, **kwargs: Any) -> None: ...
     def print_json(self, **kwargs: Any) -> None: ...
+    def to_csv(self, path: Any, **kwargs: Any) -> None: ...
+    def to_json(self, path: Any, **kwargs: Any) -> None: ...
     def where(self, test: Callable[[Row], bool]) -> "Table": ...
     def select(self, key: Union[Iterable[str], str]) -> "Table": ...
     # these definitions are much narrower than what's actually accepted
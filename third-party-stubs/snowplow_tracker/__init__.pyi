@@ -57,6 +57,7 @@ class Tracker:
         context: Optional[List[Any]] = None,
         tstamp: Optional[Any] = None,
     ): ...
+    def track(self, event: Any) -> Optional[str]: ...
     def flush(self, asynchronous: bool = False): ...
 
 class SelfDescribingJson: